@@ -44,16 +44,31 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'main.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'main.middleware.BrowserMiddleware',
+    'main.middleware.ReplicaMiddleware'
+]
+
+# Run by main.middleware.BrowserMiddleware for every route except the API
+# ones, which authenticate with headers and need none of this.
+BROWSER_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware'
 ]
 
+# The admin checks look for the session, auth and messages middleware in
+# MIDDLEWARE only; they run from BROWSER_MIDDLEWARE instead. The deferrable
+# ordering constraints (see main.ordering) only exist on Postgres, which is
+# fine for local SQLite databases.
+SILENCED_SYSTEM_CHECKS = ['admin.E408', 'admin.E409', 'admin.E410',
+                          'models.W038']
+
 ROOT_URLCONF = 'backend.urls'
 
 TEMPLATES = [
@@ -124,8 +139,55 @@ USE_TZ = True
 
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-    ]
+        'main.renderers.FastJSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'main.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Proxies in front of the app (Heroku's router is one). Client addresses,
+    # e.g. for the auth throttles, are read from the X-Forwarded-For entry
+    # the last of them appended; the entries before it come from the client.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 1)),
+}
+
+# bcrypt cost of stored passwords and of the tokens handed out at login.
+# backend.settings_test lowers both for the test suite.
+PASSWORD_HASH_ROUNDS = 12
+AUTH_TOKEN_ROUNDS = 12
+
+# Token-bucket throttles of login, register and verify-token, see
+# main.throttling. Use main.throttling.CacheBackend to share the buckets
+# between processes through the AUTH_THROTTLE_CACHE cache.
+AUTH_THROTTLE_BACKEND = os.environ.get('AUTH_THROTTLE_BACKEND',
+                                       'main.throttling.LocalMemoryBackend')
+AUTH_THROTTLE_CACHE = 'default'
+AUTH_THROTTLE_RATES = {
+    'ip': os.environ.get('AUTH_THROTTLE_IP_RATE', '30/min'),
+    'username': os.environ.get('AUTH_THROTTLE_USERNAME_RATE', '10/min'),
+    'verify_token': os.environ.get('AUTH_THROTTLE_VERIFY_TOKEN_RATE',
+                                   '60/min'),
+}
+
+# Compression of API responses. Static files are compressed by whitenoise.
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', 6))
+COMPRESSION_BROTLI_QUALITY = int(
+    os.environ.get('COMPRESSION_BROTLI_QUALITY', 5)
+)
+
+# Seconds between the log lines in which every worker reports its
+# main.metrics counters, e.g. compression byte counts; 0 turns them off.
+METRICS_LOG_INTERVAL = int(os.environ.get('METRICS_LOG_INTERVAL', 0))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {'console': {'class': 'logging.StreamHandler'}},
+    'loggers': {
+        'main.metrics': {'handlers': ['console'], 'level': 'INFO'},
+    },
 }
 
 ALLOWED_HOSTS = [
@@ -173,3 +235,18 @@ STATICFILES_STORAGE = 'whitenoise.django.GzipManifestStaticFilesStorage'
 
 prod_db = dj_database_url.config(conn_max_age=500)
 DATABASES['default'].update(prod_db)
+
+# Read replicas, as comma-separated database URLs. main.replicas sends the
+# reads of GET requests to them and everything else to the primary. A client
+# that writes reads from the primary for REPLICA_PIN_SECONDS afterwards; pins
+# are kept in the REPLICA_PIN_CACHE cache, so point it at a cache shared by
+# all workers when there are several.
+REPLICA_DATABASES = []
+for i, url in enumerate(filter(None, os.environ.get(
+        'REPLICA_DATABASE_URLS', '').split(','))):
+    DATABASES[f'replica{i}'] = dj_database_url.parse(url.strip(),
+                                                      conn_max_age=500)
+    REPLICA_DATABASES.append(f'replica{i}')
+DATABASE_ROUTERS = ['main.replicas.ReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 5))
+REPLICA_PIN_CACHE = 'default'
@@ -0,0 +1,38 @@
+"""
+Settings for serving only the token-based JSON API.
+
+Nothing under backend.urls uses the admin, sessions, CSRF, messages,
+django.contrib.auth or static files (auth is the AUTH-USER/AUTH-TOKEN header
+pair checked by main.validation.val_auth), so this profile leaves their apps
+and middleware out of worker boot and of every request. Run management
+commands that need them, e.g. createsuperuser, with backend.settings.
+
+Compare boot cost with ``manage.py startup_report backend.settings
+backend.settings_api``.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    'corsheaders',
+    'rest_framework',
+    'main'
+]
+
+MIDDLEWARE = [
+    'main.middleware.CompressionMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'main.middleware.ReplicaMiddleware',
+]
+
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,  # noqa: F405
+    # DRF's default session/basic authentication needs django.contrib.auth
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': [],
+    'UNAUTHENTICATED_USER': None,
+}
@@ -0,0 +1,26 @@
+"""
+Settings for running the test suite.
+
+Selected by manage.py when running ``test`` unless DJANGO_SETTINGS_MODULE is
+already set. Swaps in cheaper password hashing and auth tokens and turns the
+auth throttles off, since every test logs in from the same address; every
+other setting matches production.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# bcrypt's minimum cost, down from 12
+PASSWORD_HASH_ROUNDS = 4
+AUTH_TOKEN_ROUNDS = 4
+
+# main.tests.test_throttling turns them back on
+AUTH_THROTTLE_RATES = {'ip': None, 'username': None, 'verify_token': None}
+
+# An unreplicated second database for main.tests.test_replicas, which turns
+# routing on with REPLICA_DATABASES = ['replica'].
+_default = DATABASES['default']  # noqa: F405
+DATABASES['replica'] = {  # noqa: F405
+    **_default,
+    'TEST': {'NAME': None if _default['ENGINE'].endswith('sqlite3')
+             else f"test_{_default['NAME']}_replica"},
+}
@@ -1,20 +1,26 @@
 from django.urls import path
 from main.api.api_auth import register, login, verify_token
 from main.api.api_users import users
+from main.api.api_memberships import memberships
 from main.api.api_teams import teams
-from main.api.api_boards import boards
+from main.api.api_boards import boards, board_export, board_import
 from main.api.api_columns import columns
 from main.api.api_tasks import tasks
 from main.api.api_subtasks import subtasks
+from main.api.api_search import search
 
 urlpatterns = [
     path('verify-token/', verify_token, name='verifytoken'),
     path('register/', register, name='register'),
     path('login/', login, name='login'),
     path('users/', users, name='users'),
+    path('memberships/', memberships, name='memberships'),
     path('teams/', teams, name='teams'),
     path('boards/', boards, name='boards'),
+    path('boards/export/', board_export, name='boardexport'),
+    path('boards/import/', board_import, name='boardimport'),
     path('columns/', columns, name='columns'),
     path('tasks/', tasks, name='tasks'),
     path('subtasks/', subtasks, name='subtasks'),
+    path('search/', search, name='search'),
 ]
@@ -0,0 +1,45 @@
+"""Benchmarks for the main API.
+
+Every script runs against a throwaway test database created from the
+configured ``DATABASES['default']`` (SQLite or a local Postgres), so real
+data is never touched. Run a script as a module from the project root, e.g.
+``python -m benchmarks.bench_serializers``.
+"""
+import os
+import timeit
+from contextlib import contextmanager
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+
+
+@contextmanager
+def scratch_database(verbosity=0):
+    from django.db import connection
+    from django.test.utils import \
+        setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=verbosity,
+                                                  autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+        teardown_test_environment()
+
+
+# return the best time per call in seconds
+def best_of(func, repeat=5, number=10):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def print_table(header, rows):
+    widths = [max(len(str(row[i])) for row in [header, *rows])
+              for i in range(len(header))]
+    for row in [header, *rows]:
+        print('  '.join(str(cell).ljust(width)
+                        for cell, width in zip(row, widths)).rstrip())
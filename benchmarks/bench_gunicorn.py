@@ -0,0 +1,165 @@
+"""Compare gunicorn configurations under concurrent load.
+
+Seeds a throwaway SQLite database, then for each configuration starts
+gunicorn with gunicorn.conf.py and the API-only settings, hammers it with
+concurrent clients and reports requests per second and p50/p99 latency for a
+bcrypt-heavy login and a nested board read.
+
+    python -m benchmarks.bench_gunicorn [--clients 8] [--requests 200]
+        [--config sync --config gthread ...]
+
+Configurations are environment overrides of gunicorn.conf.py, see CONFIGS.
+"""
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from . import print_table
+from .loadtest import percentile
+
+CPUS = os.cpu_count() or 1
+CONFIGS = {
+    'sync': {'GUNICORN_WORKER_CLASS': 'sync',
+             'WEB_CONCURRENCY': str(CPUS * 2 + 1)},
+    'sync-no-preload': {'GUNICORN_WORKER_CLASS': 'sync',
+                        'WEB_CONCURRENCY': str(CPUS * 2 + 1),
+                        'GUNICORN_PRELOAD': 'false'},
+    'gthread': {'GUNICORN_WORKER_CLASS': 'gthread',
+                'WEB_CONCURRENCY': str(CPUS + 1),
+                'GUNICORN_THREADS': '4'},
+    'single-sync': {'GUNICORN_WORKER_CLASS': 'sync',
+                    'WEB_CONCURRENCY': '1'},
+    # the ASGI application; Django runs its sync views in a thread per worker
+    'uvicorn': {'GUNICORN_WORKER_CLASS': 'uvicorn',
+                'WEB_CONCURRENCY': str(CPUS * 2 + 1)},
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def call(url, data=None, headers=None):
+    request = urllib.request.Request(
+        url, data=json.dumps(data).encode() if data is not None else None,
+        # 127.0.0.1 is not in ALLOWED_HOSTS
+        headers={'Content-Type': 'application/json', 'Host': 'localhost',
+                 **(headers or {})}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, json.loads(response.read() or b'null')
+    except urllib.error.HTTPError as error:
+        return error.code, None
+
+
+def wait_until_up(url, process, deadline=30):
+    start = time.monotonic()
+    while time.monotonic() - start < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn exited during startup')
+        try:
+            urllib.request.urlopen(url, timeout=1)
+            return time.monotonic() - start
+        except urllib.error.HTTPError:
+            return time.monotonic() - start
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError('gunicorn did not come up')
+
+
+def load(clients, requests, send):
+    def timed(i):
+        start = time.perf_counter()
+        status = send(i)
+        return time.perf_counter() - start, status >= 400
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        results = list(pool.map(timed, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    return {'rps': requests / elapsed,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'errors': sum(error for _, error in results)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=8,
+                        help='concurrent clients')
+    parser.add_argument('--requests', type=int, default=200,
+                        help='requests per scenario')
+    parser.add_argument('--config', action='append', choices=sorted(CONFIGS),
+                        help='configuration to run, repeatable (default: '
+                             'all)')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    env = {**os.environ,
+           'DATABASE_URL': f'sqlite:///{directory}/bench.sqlite3',
+           'DJANGO_SETTINGS_MODULE': 'backend.settings_api',
+           'AUTH_THROTTLE_IP_RATE': '1000000/s',
+           'AUTH_THROTTLE_USERNAME_RATE': '1000000/s',
+           'AUTH_THROTTLE_VERIFY_TOKEN_RATE': '1000000/s'}
+    manage = [sys.executable, 'manage.py']
+    subprocess.run([*manage, 'migrate', '-v', '0'], env=env, check=True)
+    subprocess.run([*manage, 'seed', '--boards', '3', '--tasks', '10',
+                    '--prefix', 'bench'], env=env, check=True,
+                   stdout=subprocess.DEVNULL)
+    credentials = {'username': 'bench0admin', 'password': 'barbarbar'}
+
+    rows = []
+    for name in args.config or CONFIGS:
+        port = free_port()
+        url = f'http://127.0.0.1:{port}'
+        process = subprocess.Popen(
+            ['gunicorn', '-c', 'gunicorn.conf.py', '--bind',
+             f'127.0.0.1:{port}'],
+            env={**env, **CONFIGS[name]},
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            boot = wait_until_up(f'{url}/boards/', process)
+            _, user = call(f'{url}/login/', credentials)
+            headers = {'AUTH-USER': user['username'],
+                       'AUTH-TOKEN': user['token']}
+            _, boards = call(f'{url}/boards/?team_id={user["teamId"]}',
+                             headers=headers)
+            scenarios = {
+                'login': lambda i: call(f'{url}/login/', credentials)[0],
+                'board-read': lambda i: call(
+                    f'{url}/boards/?id={boards[i % len(boards)]["id"]}',
+                    headers=headers
+                )[0],
+            }
+            for scenario, send in scenarios.items():
+                result = load(args.clients, args.requests, send)
+                rows.append((name, scenario, f'{boot * 1000:.0f}',
+                             f'{result["rps"]:.1f}',
+                             f'{result["p50_ms"]:.1f}',
+                             f'{result["p99_ms"]:.1f}', result['errors']))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f'cpus: {CPUS}, clients: {args.clients}, '
+          f'requests: {args.requests}')
+    print_table(('config', 'scenario', 'boot ms', 'rps', 'p50 ms', 'p99 ms',
+                 'errors'), rows)
+
+
+if __name__ == '__main__':
+    main()
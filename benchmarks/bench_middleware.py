@@ -0,0 +1,74 @@
+"""Measure what the browser middleware costs an API request.
+
+Runs the same requests through the full handler with the old flat MIDDLEWARE
+list (sessions, CSRF, auth, messages and clickjacking on every route) and
+with the current one, where main.middleware.BrowserMiddleware skips them for
+API routes, and reports the time per request and the difference.
+
+    python -m benchmarks.bench_middleware [--number 2000]
+"""
+import argparse
+
+from . import setup, scratch_database, best_of, print_table
+
+FLAT_MIDDLEWARE = [
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'main.middleware.CompressionMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware'
+]
+
+# cheap requests, so the middleware is a visible share of the total
+REQUESTS = [
+    ('GET /login/ (405)', 'get', '/login/', {}),
+    ('POST /boards/ (no auth)', 'post', '/boards/', {'data': {},
+                                                     'format': 'json'}),
+    ('GET /missing/ (404)', 'get', '/missing/', {}),
+]
+
+
+# a client whose handler has loaded the given middleware
+def make_client(middleware):
+    from django.test import override_settings
+    from rest_framework.test import APIClient
+
+    client = APIClient()
+    with override_settings(MIDDLEWARE=middleware):
+        client.get('/login/')
+    return client
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    setup()
+
+    from django.conf import settings
+
+    with scratch_database():
+        flat = make_client(FLAT_MIDDLEWARE)
+        trimmed = make_client(settings.MIDDLEWARE)
+        rows = []
+        for name, method, path, kwargs in REQUESTS:
+            times = [best_of(lambda: getattr(client, method)(path, **kwargs),
+                             number=args.number)
+                     for client in (flat, trimmed)]
+            rows.append((name, f'{times[0] * 1e6:.1f}',
+                         f'{times[1] * 1e6:.1f}',
+                         f'{(times[0] - times[1]) * 1e6:.1f}',
+                         f'{1 - times[1] / times[0]:.0%}'))
+
+    print_table(('request', 'flat us', 'trimmed us', 'saved us', 'saved'),
+                rows)
+
+
+if __name__ == '__main__':
+    main()
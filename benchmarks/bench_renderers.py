@@ -0,0 +1,76 @@
+"""Compare the stock DRF JSON renderer/parser with the fast pair.
+
+    python -m benchmarks.bench_renderers [--tasks 500] [--subtasks 5]
+"""
+import argparse
+import io
+import uuid
+
+from . import setup, best_of, print_table
+
+
+# a nested board payload shaped like GET /boards/?id=
+def nested_board(tasks, subtasks):
+    return {'id': 1, 'columns': [{
+        'id': column,
+        'order': column,
+        'tasks': [{
+            'id': task,
+            'title': f'Task #{task}',
+            'description': 'Lorem ipsum dolor sit amet, consectetur '
+                           'adipiscing elit. ' * 4,
+            'order': task,
+            'user': 'teammember',
+            'subtasks': [{'id': subtask,
+                          'title': f'Subtask #{subtask}',
+                          'order': subtask,
+                          'done': subtask % 2 == 0}
+                         for subtask in range(subtasks)]
+        } for task in range(tasks // 4)]
+    } for column in range(4)]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tasks', type=int, default=500)
+    parser.add_argument('--subtasks', type=int, default=5)
+    args = parser.parse_args()
+
+    setup()
+
+    from rest_framework.exceptions import ErrorDetail
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from main.parsers import FastJSONParser
+    from main.renderers import FastJSONRenderer
+    from main import fastjson
+
+    payloads = [
+        ('nested board', nested_board(args.tasks, args.subtasks)),
+        ('team', {'id': 1, 'inviteCode': uuid.uuid4()}),
+        ('errors', {'title': [ErrorDetail(string='Title cannot be empty.',
+                                          code='blank')]}),
+    ]
+
+    rows = []
+    for name, data in payloads:
+        body = JSONRenderer().render(data)
+        results = []
+        for renderer, parser in ((JSONRenderer(), JSONParser()),
+                                 (FastJSONRenderer(), FastJSONParser())):
+            results.append(best_of(lambda: renderer.render(data)))
+            results.append(best_of(lambda: parser.parse(io.BytesIO(body))))
+        stock_render, stock_parse, fast_render, fast_parse = results
+        rows.append((name, len(body),
+                     f'{stock_render * 1000:.3f}', f'{fast_render * 1000:.3f}',
+                     f'{stock_render / fast_render:.1f}x',
+                     f'{stock_parse * 1000:.3f}', f'{fast_parse * 1000:.3f}',
+                     f'{stock_parse / fast_parse:.1f}x'))
+
+    print(f'fast backend: {"orjson" if fastjson.orjson else "stdlib json"}')
+    print_table(('payload', 'bytes', 'render ms', 'fast ms', 'speedup',
+                 'parse ms', 'fast ms', 'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Compare the DRF serializer path with the values() fast path.
+
+    python -m benchmarks.bench_serializers [--rows 1000]
+"""
+import argparse
+
+from . import setup, scratch_database, best_of, print_table
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000)
+    args = parser.parse_args()
+
+    setup()
+
+    from main.models import Team, Board, Column, Task, Subtask
+    from main.serializers.ser_board import BoardSerializer, boards_data
+    from main.serializers.ser_column import ColumnSerializer, columns_data
+    from main.serializers.ser_task import TaskSerializer, tasks_data
+    from main.serializers.ser_subtask import SubtaskSerializer, subtasks_data
+
+    with scratch_database():
+        team = Team.objects.create()
+        Board.objects.bulk_create([
+            Board(name=f'Board #{i}', team=team) for i in range(args.rows)
+        ])
+        board = Board.objects.filter(team=team).first()
+        Column.objects.bulk_create([
+            Column(order=i, board=board) for i in range(args.rows)
+        ])
+        column = Column.objects.filter(board=board).first()
+        Task.objects.bulk_create([
+            Task(title=f'Task #{i}', description='Lorem ipsum ' * 10,
+                 order=i, column=column) for i in range(args.rows)
+        ])
+        task = Task.objects.filter(column=column).first()
+        Subtask.objects.bulk_create([
+            Subtask(title=f'Subtask #{i}', order=i, task=task)
+            for i in range(args.rows)
+        ])
+
+        # the serializer each list endpoint ran before the fast path, with all
+        # of its fields, and the keys it then picked from every item
+        cases = [
+            ('boards', Board.objects.filter(team=team),
+             BoardSerializer, ('id', 'name'), boards_data),
+            ('columns', Column.objects.filter(board=board),
+             ColumnSerializer, ('id', 'order'), columns_data),
+            ('tasks', Task.objects.filter(column=column),
+             TaskSerializer, ('id', 'order', 'title', 'description'),
+             tasks_data),
+            ('subtasks', Subtask.objects.filter(task=task),
+             SubtaskSerializer, ('id', 'order', 'title', 'done'),
+             subtasks_data),
+        ]
+
+        rows = []
+        for name, queryset, serializer_class, keys, fast in cases:
+            def fast_path():
+                return fast(queryset.all())
+
+            def serializer_path():
+                return [{key: item[key] for key in keys} for item in
+                        serializer_class(queryset.all(), many=True).data]
+
+            # the fast path may add fields, e.g. counters, but has to agree
+            # on the old ones
+            assert serializer_path() == [{key: item[key] for key in keys}
+                                         for item in fast_path()]
+
+            slow, quick = best_of(serializer_path), best_of(fast_path)
+            rows.append((name, args.rows, f'{slow * 1000:.2f}',
+                         f'{quick * 1000:.2f}', f'{slow / quick:.1f}x'))
+
+        print_table(('endpoint', 'rows', 'serializer ms', 'values() ms',
+                     'speedup'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Reproducible load test for the main API.
+
+Seeds a team with main.seed in a scratch database, then replays each scenario
+in-process through the Django test client and reports p50/p99 latency,
+queries per request and requests per second.
+
+    python -m benchmarks.loadtest [--boards 3] [--tasks 25] [--subtasks 3]
+        [--requests 50] [--scenario nested-board-read ...]
+        [--seed 0] [--token-rounds 12] [--json report.json]
+
+Point DATABASE_URL at a local Postgres to benchmark against it instead of
+SQLite.
+"""
+import argparse
+import json
+import time
+
+from . import setup, scratch_database, print_table
+from .scenarios import SCENARIOS
+
+
+# nearest-rank percentile of an already sorted list
+def percentile(values, p):
+    if not values:
+        return 0
+    index = max(0, min(len(values) - 1, round(p / 100 * len(values)) - 1))
+    return values[index]
+
+
+def run_scenario(client, fixture, scenario, requests):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    headers = {'HTTP_AUTH_USER': fixture['admin']['username'],
+               'HTTP_AUTH_TOKEN': fixture['admin']['token']}
+    latencies, queries, errors = [], [], 0
+    elapsed = 0
+    for i in range(requests):
+        method, path, data = scenario(fixture, i)
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = getattr(client, method)(path, data, format='json',
+                                               **headers)
+            latency = time.perf_counter() - start
+        elapsed += latency
+        latencies.append(latency)
+        queries.append(len(captured))
+        if response.status_code >= 400:
+            errors += 1
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': errors,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'queries_mean': sum(queries) / len(queries),
+        'queries_max': max(queries),
+        'rps': requests / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--boards', type=int, default=3)
+    parser.add_argument('--tasks', type=int, default=25,
+                        help='tasks per column')
+    parser.add_argument('--subtasks', type=int, default=3,
+                        help='subtasks per task')
+    parser.add_argument('--members', type=int, default=5)
+    parser.add_argument('--requests', type=int, default=50,
+                        help='requests per scenario')
+    parser.add_argument('--scenario', action='append',
+                        choices=sorted(SCENARIOS),
+                        help='scenario to run, repeatable (default: all)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the generated data')
+    parser.add_argument('--token-rounds', type=int, default=12,
+                        help='bcrypt rounds of the auth token; every '
+                             'authenticated request pays this cost')
+    parser.add_argument('--json', help='also write the report to this file')
+    args = parser.parse_args()
+
+    setup()
+
+    from django.db import connection
+    from django.test import override_settings
+    from rest_framework.test import APIClient
+    from main.hashing import make_token
+    from main.models import User
+    from main.seed import seed
+
+    with scratch_database():
+        [fixture] = seed(1, args.boards, args.tasks, args.subtasks,
+                         members=args.members, seed=args.seed,
+                         prefix='loadtest')
+        admin = User.objects.get(username=fixture['admin']['username'])
+        fixture['admin']['token'] = make_token(admin,
+                                               rounds=args.token_rounds)
+        client = APIClient()
+
+        report = {
+            'database': connection.vendor,
+            'fixture': {'boards': args.boards, 'tasks': args.tasks,
+                        'subtasks': args.subtasks, 'members': args.members,
+                        'seed': args.seed},
+            'scenarios': {},
+        }
+        # the auth throttles would turn most logins into 429s
+        with override_settings(AUTH_THROTTLE_RATES={'ip': None,
+                                                    'username': None,
+                                                    'verify_token': None}):
+            for name in args.scenario or SCENARIOS:
+                report['scenarios'][name] = run_scenario(
+                    client, fixture, SCENARIOS[name], args.requests
+                )
+
+    print(f'database: {report["database"]}, fixture: {report["fixture"]}')
+    print_table(
+        ('scenario', 'requests', 'errors', 'p50 ms', 'p99 ms',
+         'queries/req', 'max queries', 'rps'),
+        [(name, result['requests'], result['errors'],
+          f'{result["p50_ms"]:.2f}', f'{result["p99_ms"]:.2f}',
+          f'{result["queries_mean"]:.1f}', result['queries_max'],
+          f'{result["rps"]:.1f}')
+         for name, result in report['scenarios'].items()]
+    )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Scenarios exercised by the load test.
+
+Each scenario takes the team seeded by main.seed.seed (plus the admin's
+token) and a request counter, and returns the (method, path, data) of the
+next request to send.
+"""
+
+
+def nested_board_read(fixture, i):
+    board = fixture['boards'][i % len(fixture['boards'])]
+    return 'get', f'/boards/?id={board.id}', None
+
+
+def drag_reorder(fixture, i):
+    from main.models import Task
+
+    column = fixture['columns'][i % len(fixture['columns'])]
+    tasks = list(Task.objects.filter(column=column)
+                 .order_by('-order').values('id', 'user'))
+    return 'patch', f'/columns/?id={column.id}', [
+        {'id': task['id'], 'order': order, 'user': task['user']}
+        for order, task in enumerate(tasks)
+    ]
+
+
+def task_creation(fixture, i):
+    column = fixture['columns'][i % len(fixture['columns'])]
+    return 'post', '/tasks/', {
+        'column': column.id,
+        'title': f'New Task #{i}',
+        'description': 'Created by the load test.',
+        'subtasks': [f'New Subtask #{j}' for j in range(3)],
+    }
+
+
+def login(fixture, i):
+    return 'post', '/login/', {
+        'username': fixture['admin']['username'],
+        'password': fixture['admin']['password'],
+    }
+
+
+SCENARIOS = {
+    'nested-board-read': nested_board_read,
+    'drag-reorder': drag_reorder,
+    'task-creation': task_creation,
+    'login': login,
+}
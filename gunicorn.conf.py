@@ -0,0 +1,69 @@
+"""Gunicorn settings, picked up from the working directory by ``gunicorn``.
+
+The application comes from wsgi_app below; leave it off the command line,
+where it would take precedence over the worker class's choice.
+
+Every knob can be overridden from the environment:
+
+    GUNICORN_WORKER_CLASS  sync (default), gthread or uvicorn
+    WEB_CONCURRENCY        worker processes (default: 2 per CPU + 1)
+    GUNICORN_THREADS       threads per gthread worker (default: 4)
+    GUNICORN_PRELOAD       load the app in the master before forking
+                           (default: true)
+    GUNICORN_MAX_REQUESTS  recycle a worker after this many requests
+                           (default: 1000, 0 to disable)
+    GUNICORN_TIMEOUT       seconds a worker may stay silent (default: 60)
+
+Compare configurations with ``python -m benchmarks.bench_gunicorn``.
+"""
+import multiprocessing
+import os
+
+WORKER_CLASSES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    # serves the ASGI application instead; the h11 worker runs on the plain
+    # uvicorn of requirements.txt, without uvloop or httptools
+    'uvicorn': 'uvicorn.workers.UvicornH11Worker',
+}
+
+_worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+if _worker_class not in WORKER_CLASSES:
+    raise RuntimeError(f'GUNICORN_WORKER_CLASS must be one of '
+                       f'{", ".join(WORKER_CLASSES)}.')
+
+worker_class = WORKER_CLASSES[_worker_class]
+wsgi_app = 'backend.asgi:application' if _worker_class == 'uvicorn' \
+    else 'backend.wsgi:application'
+
+# bcrypt releases the GIL, so login/register scale with threads as well as
+# with processes; sync workers serve one request at a time
+workers = int(os.environ.get('WEB_CONCURRENCY',
+                             multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4)) \
+    if _worker_class == 'gthread' else 1
+
+# import Django and the app once in the master so that workers share its
+# memory copy-on-write and boot instantly
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true') == 'true'
+
+# recycle workers to cap slow leaks, staggered so they don't all restart at
+# once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+# a login costs one 12-round bcrypt check (~0.25 s of CPU) and a burst of
+# them can queue behind each other, so allow well beyond the 30 s default
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+
+def when_ready(server):
+    # Connections opened while preloading would be inherited by every worker.
+    # Close them once here in the master, before the first fork: a worker
+    # closing its copy could send Postgres a terminate message on the socket
+    # its siblings share.
+    if server.cfg.preload_app:
+        from django.db import connections
+        connections.close_all()
@@ -7,3 +7,4 @@ admin.site.register(Board)
 admin.site.register(Column)
 admin.site.register(Task)
 admin.site.register(Subtask)
+admin.site.register(Job)
@@ -1,13 +1,18 @@
-from rest_framework.decorators import api_view
+from django.db import transaction
+from rest_framework.decorators import api_view, throttle_classes
 from rest_framework.response import Response
 from rest_framework.exceptions import ErrorDetail
-import bcrypt
 
-from ..serializers.ser_user import UserSerializer
+from ..serializers.ser_user import UserSerializer, LoginSerializer
 from ..models import User
+from ..hashing import check_password, make_token, check_token
+from ..throttling import AuthThrottle, VerifyTokenThrottle
+from ..replicas import pin
+from ..util import create_board
 
 
 @api_view(['POST'])
+@throttle_classes([AuthThrottle])
 def register(request):
     invite_code = request.query_params.get('invite_code')
 
@@ -21,35 +26,40 @@ def register(request):
     serializer = UserSerializer(data=data)
     if not serializer.is_valid():
         return Response(serializer.errors, 400)
-    user = serializer.save()
+    with transaction.atomic():
+        user = serializer.save()
+        # a new team starts out with one board
+        if user.is_admin:
+            create_board(user.team_id, 'New Board')
+    # the client reads as the new user next, before the replicas may have it
+    pin(user.username)
 
     return Response({
         'msg': 'Registration successful.',
         'username': user.username,
-        'token': bcrypt.hashpw(
-            bytes(user.username, 'utf-8') + user.password,
-            bcrypt.gensalt()
-        ).decode('utf-8'),
+        'token': make_token(user),
         'teamId': user.team_id,
         'isAdmin': user.is_admin
     }, 201)
 
 
 @api_view(['POST'])
+@throttle_classes([AuthThrottle])
 def login(request):
-    serializer = UserSerializer(data=request.data)
+    serializer = LoginSerializer(data=request.data)
     if not serializer.is_valid():
         return Response(serializer.errors, 400)
+    username = serializer.validated_data['username']
+    password = serializer.validated_data['password']
 
     try:
-        user = User.objects.get(username=request.data.get('username'))
+        user = User.objects.get(username=username)
     except User.DoesNotExist:
         return Response({
             'username': ErrorDetail(string='Invalid username.', code='invalid')
         }, 400)
 
-    pw_bytes = bytes(request.data.get('password'), 'utf-8')
-    if not bcrypt.checkpw(pw_bytes, bytes(user.password)):
+    if not check_password(password, user.password):
         return Response({
             'password': ErrorDetail(string='Invalid password.', code='invalid')
         }, 400)
@@ -57,27 +67,21 @@ def login(request):
     return Response({
         'msg': 'Login successful.',
         'username': user.username,
-        'token': bcrypt.hashpw(
-            bytes(user.username, 'utf-8') + user.password,
-            bcrypt.gensalt()
-        ).decode('utf-8'),
+        'token': make_token(user),
         'teamId': user.team_id,
         'isAdmin': user.is_admin,
     }, 200)
 
 
 @api_view(['POST'])
+@throttle_classes([VerifyTokenThrottle])
 def verify_token(request):
     failure_response = Response({'msg': 'Token verification failure.'}, 400)
     try:
         user = User.objects.get(username=request.data.get('username'))
-        valid_token = bytes(user.username, 'utf-8') + user.password
-        request_token_raw = request.data.get('token')
-        request_token = bytes(request_token_raw, 'utf-8')
-        match = bcrypt.checkpw(valid_token, request_token)
-        if not match:
+        if not check_token(user, request.data.get('token')):
             return failure_response
-    except (ValueError, User.DoesNotExist):
+    except (ValueError, AttributeError, User.DoesNotExist):
         return failure_response
 
     return Response({
@@ -1,14 +1,21 @@
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.exceptions import ErrorDetail
-from ..serializers.ser_board import BoardSerializer
-from ..models import Board, Column, Task, Subtask, User
+from ..serializers.ser_board import BoardSerializer, boards_data
+from ..models import Board, Column, Task, Team, User
 from ..validation.val_auth import \
     authenticate, authorize, not_authenticated_response, \
     not_authorized_response
 from ..validation.val_team import validate_team_id
 from ..validation.val_board import validate_board_id
 from ..util import create_board
+from ..deletion import purge_board
+from ..transfer import export_board, import_board
+from ..counters import refresh_users
 
 
 @api_view(['GET', 'POST', 'DELETE', 'PATCH'])
@@ -46,7 +53,8 @@ def boards(request):
                             'title': task.title,
                             'description': task.description,
                             'order': task.order,
-                            'user': task.user.username if task.user else '',
+                            # username is the primary key of User
+                            'user': task.user_id or '',
                             'subtasks': list(map(
                                 lambda subtask: {
                                     'id': subtask.id,
@@ -54,13 +62,16 @@ def boards(request):
                                     'order': subtask.order,
                                     'done': subtask.done
                                 },
-                                Subtask.objects.filter(task_id=task.id)
+                                task.subtask_set.all()
                             ))
                         },
-                        Task.objects.filter(column_id=column.id)
+                        column.task_set.all()
                     ))
                 },
-                Column.objects.filter(board_id=board.id)
+                Column.objects.filter(board_id=board.id).prefetch_related(
+                    Prefetch('task_set', queryset=Task.objects.alive()),
+                    'task_set__subtask_set'
+                )
             ))
             return Response({'id': board.id, 'columns': columns}, 200)
 
@@ -74,42 +85,21 @@ def boards(request):
                 return not_authenticated_response
 
             if user.is_admin:
-                queryset = Board.objects.filter(team=team.id)
+                queryset = Board.objects.alive().filter(team=team.id)
             else:
-                queryset = Board.objects.filter(team=team.id, user=user)
-
-            # create a board if none exists for the team and the user is admin
-            if not queryset:
-                if not authorize(username):
-                    board, create_response = create_board(team.id, 'New Board')
-                    if create_response:
-                        return create_response
-
-                    # return a list containing only the new board
-                    return Response([{
-                        'id': board.id, 'name': board.name
-                    }], 201)
+                queryset = Board.objects.alive().filter(team=team.id,
+                                                        user=user)
 
+            team_boards = boards_data(queryset)
+            if not team_boards:
                 return Response({
                     'team_id': ErrorDetail(string='Boards not found.',
                                            code='not_found')
                 }, 404)
 
-            return Response(list(map(
-                lambda board_data: {
-                    'id': board_data['id'],
-                    'name': board_data['name']
-                },
-                BoardSerializer(queryset, many=True).data
-            )), 200)
+            return Response(team_boards, 200)
 
-        return Response(list(map(
-            lambda board_data: {
-                'id': board_data['id'],
-                'name': board_data['name']
-            },
-            BoardSerializer(Board.objects.all(), many=True).data
-        )), 200)
+        return Response(boards_data(Board.objects.alive()), 200)
 
     if request.method == 'POST':
         authorization_response = authorize(username)
@@ -151,7 +141,22 @@ def boards(request):
         if board.team.id != user.team.id:
             return not_authenticated_response
 
-        board.delete()
+        # tombstone the board and leave reclaiming its rows to a worker
+        with transaction.atomic():
+            # deletes in one team take turns, so that they can't both see
+            # the other's board and leave the team without any
+            Team.objects.select_for_update().get(id=board.team_id)
+            Board.objects.filter(id=board.id).update(deleted_at=timezone.now())
+            # GET /boards/?team_id= expects every team to have a board
+            if not Board.objects.alive().filter(team_id=board.team_id) \
+                    .exists():
+                create_board(board.team_id, 'New Board')
+            # tasks on a deleted board no longer count as assigned
+            refresh_users(User.objects.filter(
+                username__in=Task.objects.filter(column__board_id=board.id)
+                .values('user')
+            ))
+            purge_board.delay(board_id=board.id)
 
         return Response({
             'msg': 'Board deleted successfully.',
@@ -182,3 +187,57 @@ def boards(request):
         }, 200)
 
 
+@api_view(['GET'])
+def board_export(request):
+    username = request.META.get('HTTP_AUTH_USER')
+    token = request.META.get('HTTP_AUTH_TOKEN')
+
+    user, authentication_response = authenticate(username, token)
+    if authentication_response:
+        return authentication_response
+
+    board_id = request.query_params.get('id')
+    board, validation_response = validate_board_id(board_id)
+    if validation_response:
+        return validation_response
+
+    if board.team_id != user.team_id:
+        return not_authenticated_response
+
+    if not user.is_admin and not board.user.filter(username=user.username):
+        return not_authorized_response
+
+    response = StreamingHttpResponse(export_board(board),
+                                     content_type='application/x-ndjson')
+    response['Content-Disposition'] = \
+        f'attachment; filename="board-{board.id}.ndjson"'
+    return response
+
+
+@api_view(['POST'])
+def board_import(request):
+    username = request.META.get('HTTP_AUTH_USER')
+    token = request.META.get('HTTP_AUTH_TOKEN')
+
+    user, authentication_response = authenticate(username, token)
+    if authentication_response:
+        return authentication_response
+
+    if not user.is_admin:
+        return not_authorized_response
+
+    # the body is read line by line, never as a whole
+    try:
+        board, task_count = import_board(request.stream or [],
+                                         user.team,
+                                         request.query_params.get('name'))
+    except ValueError as exc:
+        return Response({
+            'import': ErrorDetail(string=str(exc), code='invalid')
+        }, 400)
+
+    return Response({
+        'msg': 'Board import successful.',
+        'id': board.id,
+        'tasks': task_count,
+    }, 201)
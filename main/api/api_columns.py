@@ -1,13 +1,18 @@
+from django.db import transaction
+from django.db.models import Max
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.exceptions import ErrorDetail
-from ..models import Column, Task
-from ..serializers.ser_column import ColumnSerializer
+from ..models import User, Board, Column, Task
+from ..serializers.ser_column import columns_data
 from ..serializers.ser_task import TaskSerializer
 from ..validation.val_auth import \
     authenticate, authorize, not_authenticated_response
 from ..validation.val_board import validate_board_id
 from ..validation.val_column import validate_column_id
+from ..validation.val_task import validate_task_id
+from ..counters import refresh_columns, refresh_boards, refresh_users
+from ..ordering import changed_values, lock, update
 
 
 @api_view(['GET', 'PATCH'])
@@ -27,22 +32,9 @@ def columns(request):
         if board.team.id != user.team.id:
             return not_authenticated_response
 
-        board_columns = Column.objects.filter(board_id=board_id)
-        if not board_columns:
-            board_columns = [
-                Column.objects.create(
-                    order=i,
-                    board_id=board_id
-                ) for i in range(0, 4)
-            ]
+        board_columns = columns_data(Column.objects.filter(board_id=board_id))
 
-        serializer = ColumnSerializer(board_columns, many=True)
-        return Response({
-            'columns': list(
-                map(lambda column: {'id': column['id'], 'order': column['order']},
-                    serializer.data)
-            )
-        }, 200)
+        return Response({'columns': board_columns}, 200)
 
     if request.method == 'PATCH':
         authorization_response = authorize(username)
@@ -54,29 +46,100 @@ def columns(request):
         if column.board.team.id != user.team.id:
             return not_authenticated_response
 
-        for task in request.data:
-            try:
-                task_id = task.pop('id')
-            except KeyError:
-                return Response({
-                    'task.id': ErrorDetail(string='Task ID cannot be empty.',
-                                           code='blank')
-                }, 400)
-
-            existing_task = Task.objects.get(id=task_id)
-
-            if authorization_response \
-                    and task['user'] != user.username \
-                    and column.id != existing_task.column.id:
-                return authorization_response
-
-            serializer = TaskSerializer(existing_task,
-                                        data={**task, 'column': column.id},
-                                        partial=True)
-            if not serializer.is_valid():
-                return Response(serializer.errors, 400)
-
-            serializer.save()
+        with transaction.atomic():
+            # lock the column, as POST /tasks/ does, then the listed tasks in
+            # one go, and write them back with one UPDATE once all are valid
+            lock(Column.objects.filter(id=column.id))
+            task_ids = []
+            for task in request.data:
+                try:
+                    task_ids.append(int(task['id']))
+                except (KeyError, TypeError, ValueError):
+                    pass
+            locked = lock(Task.objects.alive().filter(
+                id__in=task_ids, column__board__deleted_at__isnull=True
+            ))
+
+            columns, users, changes, orders = {column.id}, set(), {}, set()
+            for task in request.data:
+                try:
+                    task_id = task.pop('id')
+                except KeyError:
+                    transaction.set_rollback(True)
+                    return Response({
+                        'task.id': ErrorDetail(
+                            string='Task ID cannot be empty.', code='blank'
+                        )
+                    }, 400)
+
+                try:
+                    existing_task = locked.get(int(task_id))
+                except (TypeError, ValueError):
+                    existing_task = None
+                if existing_task is None:
+                    existing_task, validation_response = \
+                        validate_task_id(task_id)
+                    if validation_response:
+                        transaction.set_rollback(True)
+                        return validation_response
+
+                if authorization_response \
+                        and task['user'] != user.username \
+                        and column.id != existing_task.column.id:
+                    transaction.set_rollback(True)
+                    return authorization_response
+
+                columns.add(existing_task.column_id)
+                old_user_id = existing_task.user_id
+
+                serializer = TaskSerializer(existing_task,
+                                            data={**task, 'column': column.id},
+                                            partial=True)
+                if not serializer.is_valid():
+                    transaction.set_rollback(True)
+                    return Response(serializer.errors, 400)
+
+                order = serializer.validated_data.get('order',
+                                                      existing_task.order)
+                if order in orders:
+                    transaction.set_rollback(True)
+                    return Response({
+                        'order': ErrorDetail(
+                            string='Task orders must be unique.',
+                            code='unique'
+                        )
+                    }, 400)
+                orders.add(order)
+
+                values = changed_values(existing_task,
+                                        serializer.validated_data)
+                changes[existing_task.id] = values
+                new_user_id = values.get('user_id', old_user_id)
+                if new_user_id != old_user_id:
+                    users.update({old_user_id, new_user_id})
+
+            # tasks left in the column that hold one of the new orders move
+            # to its end
+            in_the_way = lock(Task.objects.alive().filter(
+                column=column, order__in=orders
+            ).exclude(id__in=changes))
+            if in_the_way:
+                last = max(orders | {Task.objects.alive().filter(
+                    column=column
+                ).aggregate(last=Max('order'))['last']})
+                for task in sorted(in_the_way.values(),
+                                   key=lambda task: task.order):
+                    last += 1
+                    changes[task.id] = {'order': last}
+            update(Task, changes)
+
+            # tasks may have moved in from other columns and boards
+            if len(columns) > 1:
+                refresh_columns(Column.objects.filter(id__in=columns))
+                refresh_boards(Board.objects.filter(column__id__in=columns))
+            users.discard(None)
+            if users:
+                refresh_users(User.objects.filter(username__in=users))
 
         return Response({
             'msg': 'Column and all its tasks updated successfully.',
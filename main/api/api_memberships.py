@@ -0,0 +1,52 @@
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from ..models import Board
+from ..validation.val_auth import authenticate, not_authorized_response
+from ..validation.val_membership import validate_memberships
+
+
+@api_view(['POST'])
+def memberships(request):
+    auth_user = request.META.get('HTTP_AUTH_USER')
+    auth_token = request.META.get('HTTP_AUTH_TOKEN')
+
+    auth_user, authentication_response = authenticate(auth_user, auth_token)
+    if authentication_response:
+        return authentication_response
+
+    if not auth_user.is_admin:
+        return not_authorized_response
+
+    validated, validation_response = validate_memberships(
+        request.data, auth_user.team_id
+    )
+    if validation_response:
+        return validation_response
+
+    Membership = Board.user.through
+    added = [Membership(board_id=board_id, user_id=username)
+             for (username, board_id), is_active in validated.items()
+             if is_active]
+
+    # one OR-ed condition per board rather than per membership
+    removed = {}
+    for (username, board_id), is_active in validated.items():
+        if not is_active:
+            removed.setdefault(board_id, []).append(username)
+    removed_filter = Q()
+    for board_id, usernames in removed.items():
+        removed_filter |= Q(board_id=board_id, user_id__in=usernames)
+
+    with transaction.atomic():
+        if added:
+            Membership.objects.bulk_create(added, ignore_conflicts=True)
+        if removed:
+            Membership.objects.filter(removed_filter).delete()
+
+    return Response({
+        'msg': 'Board memberships updated successfully.',
+        'added': len(added),
+        'removed': sum(len(usernames) for usernames in removed.values()),
+    }, 200)
@@ -0,0 +1,36 @@
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework.exceptions import ErrorDetail
+from ..validation.val_auth import authenticate
+from ..search import search_tasks
+
+
+@api_view(['GET'])
+def search(request):
+    username = request.META.get('HTTP_AUTH_USER')
+    token = request.META.get('HTTP_AUTH_TOKEN')
+
+    user, authentication_response = authenticate(username, token)
+    if authentication_response:
+        return authentication_response
+
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({
+            'q': ErrorDetail(string='Search query cannot be empty.',
+                             code='blank')
+        }, 400)
+
+    try:
+        page = int(request.query_params.get('page', 1))
+        if page < 1:
+            raise ValueError
+    except ValueError:
+        return Response({
+            'page': ErrorDetail(string='Invalid page.', code='invalid')
+        }, 400)
+
+    hits, has_next = search_tasks(user, query, page)
+    return Response({'tasks': hits,
+                     'page': page,
+                     'next': page + 1 if has_next else None}, 200)
@@ -1,12 +1,15 @@
+from django.db import transaction
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.exceptions import ErrorDetail
-from ..models import Subtask
-from ..serializers.ser_subtask import SubtaskSerializer
+from ..models import Task, Subtask
+from ..serializers.ser_subtask import SubtaskSerializer, subtasks_data
 from ..validation.val_auth import \
     authenticate, authorize, not_authenticated_response
 from ..validation.val_task import validate_task_id
 from ..validation.val_subtask import validate_subtask_id
+from ..counters import count_done, refresh_tasks
+from ..ordering import changed_values, lock, make_room, update
 
 
 @api_view(['GET', 'PATCH'])
@@ -29,20 +32,7 @@ def subtasks(request):
             return not_authenticated_response
 
         task_subtasks = Subtask.objects.filter(task_id=task_id)
-        serializer = SubtaskSerializer(task_subtasks, many=True)
-        return Response({
-            'subtasks': list(
-                map(
-                    lambda st: {
-                        'id': st['id'],
-                        'order': st['order'],
-                        'title': st['title'],
-                        'done': st['done']
-                    },
-                    serializer.data
-                )
-            )
-        }, 200)
+        return Response({'subtasks': subtasks_data(task_subtasks)}, 200)
 
     if request.method == 'PATCH':
         subtask_id = request.query_params.get('id')
@@ -83,13 +73,38 @@ def subtasks(request):
                                      code='blank')
             }, 400)
 
-        serializer = SubtaskSerializer(Subtask.objects.get(id=subtask_id),
-                                       data=request.data,
+        serializer = SubtaskSerializer(subtask, data=request.data,
                                        partial=True)
         if not serializer.is_valid():
             return Response(serializer.errors, 400)
-
-        subtask = serializer.save()
+        task = serializer.validated_data.get('task', subtask.task)
+
+        with transaction.atomic():
+            # lock the task the subtask ends up in, then the subtask
+            lock(Task.objects.filter(id=task.id))
+            subtask = lock(Subtask.objects.filter(id=subtask.id)) \
+                .get(subtask.id)
+            if subtask is None:
+                return validate_subtask_id(subtask_id)[1]
+            if 'task' not in request.data and subtask.task_id != task.id:
+                # moved by someone else in the meantime
+                task = subtask.task
+                lock(Task.objects.filter(id=task.id))
+
+            data = serializer.validated_data
+            if 'order' in data or 'task' in data:
+                make_room(Subtask.objects.filter(task=task)
+                          .exclude(id=subtask.id),
+                          data.get('order', subtask.order))
+            values = changed_values(subtask, data)
+            update(Subtask, {subtask.id: values})
+
+            if task.id != subtask.task_id:
+                refresh_tasks(Task.objects.filter(
+                    id__in=[subtask.task_id, task.id]
+                ))
+            elif values.get('done', subtask.done) != subtask.done:
+                count_done(task.id, 1 if values['done'] else -1)
         return Response({
             'msg': 'Subtask update successful.',
             'id': subtask.id
@@ -1,13 +1,23 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.exceptions import ErrorDetail
 from ..models import Column, Task, Subtask
-from ..serializers.ser_task import TaskSerializer
+from ..serializers.ser_task import \
+    TaskSerializer, tasks_data, assigned_tasks_data
 from ..serializers.ser_subtask import SubtaskSerializer
 from ..validation.val_auth import \
     authenticate, authorize, not_authenticated_response
 from ..validation.val_column import validate_column_id
 from ..validation.val_task import validate_task_id
+from ..counters import \
+    count_task, count_assignment, move_task, refresh_tasks
+from ..search import visible_boards
+from ..ordering import changed_values, lock, make_room, update
+
+ASSIGNED_PAGE_SIZE = 50
 
 
 @api_view(['GET', 'POST', 'PATCH', 'DELETE'])
@@ -19,6 +29,38 @@ def tasks(request):
     if authentication_response:
         return authentication_response
 
+    if request.method == 'GET' and 'assignee' in request.query_params:
+        assignee = request.query_params.get('assignee')
+        if not assignee:
+            return Response({
+                'assignee': ErrorDetail(string='Assignee cannot be empty.',
+                                        code='blank')
+            }, 400)
+
+        cursor = request.query_params.get('cursor')
+        try:
+            cursor = int(cursor) if cursor else 0
+        except ValueError:
+            return Response({
+                'cursor': ErrorDetail(string='Invalid cursor.',
+                                      code='invalid')
+            }, 400)
+
+        # one query joining tasks to their column and board, paged by id
+        assigned_tasks = assigned_tasks_data(
+            Task.objects.alive().filter(
+                user_id=assignee,
+                id__gt=cursor,
+                column__board__in=visible_boards(user)
+            ).order_by('id')[:ASSIGNED_PAGE_SIZE + 1]
+        )
+        has_next = len(assigned_tasks) > ASSIGNED_PAGE_SIZE
+        assigned_tasks = assigned_tasks[:ASSIGNED_PAGE_SIZE]
+        return Response({
+            'tasks': assigned_tasks,
+            'next': assigned_tasks[-1]['id'] if has_next else None
+        }, 200)
+
     if request.method == 'GET':
         column_id = request.query_params.get('column_id')
 
@@ -29,17 +71,8 @@ def tasks(request):
         if column.board.team_id != user.team.id:
             return not_authenticated_response
 
-        column_tasks = Task.objects.filter(column_id=column_id)
-        serializer = TaskSerializer(column_tasks, many=True)
-        return Response({
-            'tasks': list(map(
-                lambda t: {'id': t['id'],
-                           'order': t['order'],
-                           'title': t['title'],
-                           'description': t['description']}
-                , serializer.data
-            ))
-        }, 200)
+        column_tasks = Task.objects.alive().filter(column_id=column_id)
+        return Response({'tasks': tasks_data(column_tasks)}, 200)
 
     if request.method == 'POST':
         authorization_response = authorize(username)
@@ -54,35 +87,42 @@ def tasks(request):
         if column.board.team.id != user.team.id:
             return not_authenticated_response
 
-        column_tasks = Task.objects.filter(column_id=column_id)
-        for task in column_tasks:
-            task.order += 1
-            task.save()
-
-        task_serializer = TaskSerializer(
-            data={'title': request.data.get('title'),
-                  'description': request.data.get('description'),
-                  'order': 0,
-                  'column': request.data.get('column')}
-        )
-        if not task_serializer.is_valid():
-            return Response(task_serializer.errors, 400)
-        task = task_serializer.save()
-
-        subtasks = request.data.get('subtasks')
-        if subtasks:
-            for i, subtask in enumerate(subtasks):
-                subtask_serializer = SubtaskSerializer(
-                    data={'title': subtask,
-                          'order': i,
-                          'task': task.id}
-                )
-                if not subtask_serializer.is_valid():
-                    task.delete()
-                    return Response({
-                        'subtask': subtask_serializer.errors
-                    }, 400)
-                subtask_serializer.save()
+        with transaction.atomic():
+            # a new task goes on top and moves every other task in the column
+            # down, so inserts into one column take turns on its row
+            lock(Column.objects.filter(id=column.id))
+            Task.objects.alive().filter(column_id=column_id) \
+                .update(order=F('order') + 1)
+
+            task_serializer = TaskSerializer(
+                data={'title': request.data.get('title'),
+                      'description': request.data.get('description'),
+                      'order': 0,
+                      'column': request.data.get('column')}
+            )
+            if not task_serializer.is_valid():
+                transaction.set_rollback(True)
+                return Response(task_serializer.errors, 400)
+            task = task_serializer.save()
+
+            subtasks = request.data.get('subtasks')
+            if subtasks:
+                for i, subtask in enumerate(subtasks):
+                    subtask_serializer = SubtaskSerializer(
+                        data={'title': subtask,
+                              'order': i,
+                              'task': task.id}
+                    )
+                    if not subtask_serializer.is_valid():
+                        transaction.set_rollback(True)
+                        return Response({
+                            'subtask': subtask_serializer.errors
+                        }, 400)
+                    subtask_serializer.save()
+                Task.objects.filter(id=task.id) \
+                    .update(subtask_count=len(subtasks))
+
+            count_task(column, None)
 
         return Response({
             'msg': 'Task creation successful.',
@@ -116,37 +156,73 @@ def tasks(request):
                                      code='blank')
             }, 400)
 
+        column = task.column
         if 'column' in request.data.keys():
             column_id = request.data.get('column')
-            _, validation_response = validate_column_id(column_id)
+            column, validation_response = validate_column_id(column_id)
             if validation_response:
                 return validation_response
 
         subtasks = request.data.pop('subtasks') \
             if 'subtasks' in request.data.keys() else None
 
-        task_serializer = TaskSerializer(Task.objects.get(id=task_id),
-                                         data=request.data,
-                                         partial=True)
-        if not task_serializer.is_valid():
-            return Response(task_serializer.errors, 400)
-        task = task_serializer.save()
-
-        if subtasks:
-            Subtask.objects.filter(task_id=task.id).delete()
-
-            for subtask in subtasks:
-                subtask_serializer = SubtaskSerializer(
-                    data={'title': subtask['title'],
-                          'order': subtask['order'],
-                          'task': task.id,
-                          'done': subtask['done']}
-                )
-                if not subtask_serializer.is_valid():
-                    return Response({
-                        'subtasks': subtask_serializer.errors
-                    }, 400)
-                subtask_serializer.save()
+        with transaction.atomic():
+            # lock the column the task ends up in, as POST does, then the task
+            lock(Column.objects.filter(id=column.id))
+            task = lock(Task.objects.alive().filter(id=task.id)).get(task.id)
+            if task is None:
+                return validate_task_id(task_id)[1]
+            if 'column' not in request.data and task.column_id != column.id:
+                # moved by someone else in the meantime
+                column = task.column
+                lock(Column.objects.filter(id=column.id))
+
+            task_serializer = TaskSerializer(task, data=request.data,
+                                             partial=True)
+            if not task_serializer.is_valid():
+                return Response(task_serializer.errors, 400)
+            data = task_serializer.validated_data
+            if 'order' in data or 'column' in data:
+                make_room(Task.objects.alive().filter(column=column)
+                          .exclude(id=task.id), data.get('order', task.order))
+            values = changed_values(task, data)
+            update(Task, {task.id: values})
+
+            move_task(task.column, column)
+            old_user_id = task.user_id
+            new_user_id = values.get('user_id', old_user_id)
+            if new_user_id != old_user_id:
+                if old_user_id:
+                    count_assignment(old_user_id, -1)
+                if new_user_id:
+                    count_assignment(new_user_id)
+
+            if subtasks:
+                Subtask.objects.filter(task_id=task.id).delete()
+
+                orders = set()
+                for subtask in subtasks:
+                    subtask_serializer = SubtaskSerializer(
+                        data={'title': subtask['title'],
+                              'order': subtask['order'],
+                              'task': task.id,
+                              'done': subtask['done']}
+                    )
+                    if not subtask_serializer.is_valid():
+                        transaction.set_rollback(True)
+                        return Response({
+                            'subtasks': subtask_serializer.errors
+                        }, 400)
+                    order = subtask_serializer.validated_data['order']
+                    if order in orders:
+                        transaction.set_rollback(True)
+                        return Response({'subtasks': {'order': [ErrorDetail(
+                            string='Subtask orders must be unique.',
+                            code='unique'
+                        )]}}, 400)
+                    orders.add(order)
+                    subtask_serializer.save()
+                refresh_tasks(Task.objects.filter(id=task.id))
 
         return Response({
             'msg': 'Task update successful.',
@@ -167,7 +243,12 @@ def tasks(request):
         if task.column.board.team.id != user.team.id:
             return not_authenticated_response
 
-        task.delete()
+        # tombstone the task, out of the way of the column's orders;
+        # purge_deleted reclaims its rows later
+        with transaction.atomic():
+            if Task.objects.alive().filter(id=task.id) \
+                    .update(deleted_at=timezone.now(), order=-F('id')):
+                count_task(task.column, task.user_id, -1)
 
         return Response({
             'msg': 'Task deleted successfully.',
@@ -1,13 +1,15 @@
+from django.db.models import Exists, OuterRef
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework.exceptions import ErrorDetail
-from ..models import User
+from ..models import User, Board
 from ..validation.val_auth import \
     authenticate, authorize, not_authenticated_response, \
     not_authorized_response
 from ..validation.val_team import validate_team_id
 from ..validation.val_board import validate_board_id
 from ..validation.val_user import validate_username, validate_is_active
+from ..deletion import delete_user
 
 
 @api_view(['GET', 'POST', 'DELETE'])
@@ -35,20 +37,28 @@ def users(request):
             if validation_response:
                 return validation_response
 
-            board_members = User.objects.filter(board=board)
+            # board membership is resolved by the database in the same query
+            members = members.annotate(is_active=Exists(
+                Board.user.through.objects.filter(
+                    board_id=board.id, user_id=OuterRef('username')
+                )
+            ))
 
             return Response(list(map(
-                lambda member: {'username': member.username,
-                                'isActive': member in board_members,
-                                'isAdmin': member.is_admin},
-                members
+                lambda member: {'username': member['username'],
+                                'isActive': member['is_active'],
+                                'isAdmin': member['is_admin'],
+                                'taskCount': member['assigned_task_count']},
+                members.values('username', 'is_active', 'is_admin',
+                               'assigned_task_count')
             )), 200)
 
         return Response(list(map(
-            lambda member: {'username': member.username,
+            lambda member: {'username': member['username'],
                             'isActive': None,
-                            'isAdmin': member.is_admin},
-            members
+                            'isAdmin': member['is_admin'],
+                            'taskCount': member['assigned_task_count']},
+            members.values('username', 'is_admin', 'assigned_task_count')
         )), 200)
 
     if request.method == 'POST':
@@ -105,7 +115,7 @@ def users(request):
                 )
             }, 403)
 
-        user.delete()
+        delete_user(user)
 
         return Response({
             'msg': 'Member has been deleted successfully.',
@@ -0,0 +1,123 @@
+"""Denormalized counters.
+
+``Column.task_count`` and ``Board.task_count`` count the alive tasks in a
+column or board, ``Task.subtask_count``/``done_subtask_count`` its subtasks
+and ``User.assigned_task_count`` the alive tasks on alive boards assigned to
+a user. Handlers that write a single task adjust them with F() increments in
+the same transaction as the write; handlers that write many rows recount the
+affected rows with one correlated subquery per table. ``reconcile`` fixes
+whatever drifted (see the reconcile_counters command).
+"""
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from .models import User, Board, Column, Task, Subtask
+
+CHUNK_SIZE = 1000
+
+
+# correlated COUNT(*) of the rows of queryset whose field is the outer row
+def _count(queryset, field):
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('pk')}).order_by()
+        .values(field).annotate(count=Count('pk')).values('count')
+    ), 0)
+
+
+def _assigned_tasks():
+    return Task.objects.alive().filter(column__board__deleted_at__isnull=True)
+
+
+# counter field -> (model, actual value)
+def _counters():
+    return {
+        'column.task_count':
+            (Column, _count(Task.objects.alive(), 'column')),
+        'board.task_count':
+            (Board, _count(Task.objects.alive(), 'column__board')),
+        'task.subtask_count':
+            (Task, _count(Subtask.objects.all(), 'task')),
+        'task.done_subtask_count':
+            (Task, _count(Subtask.objects.filter(done=True), 'task')),
+        'user.assigned_task_count':
+            (User, _count(_assigned_tasks(), 'user')),
+    }
+
+
+def count_task(column, user_id, delta=1):
+    Column.objects.filter(id=column.id) \
+        .update(task_count=F('task_count') + delta)
+    Board.objects.filter(id=column.board_id) \
+        .update(task_count=F('task_count') + delta)
+    if user_id:
+        count_assignment(user_id, delta)
+
+
+def count_assignment(user_id, delta=1):
+    User.objects.filter(username=user_id) \
+        .update(assigned_task_count=F('assigned_task_count') + delta)
+
+
+def move_task(old_column, new_column):
+    if old_column.id == new_column.id:
+        return
+    Column.objects.filter(id=old_column.id) \
+        .update(task_count=F('task_count') - 1)
+    Column.objects.filter(id=new_column.id) \
+        .update(task_count=F('task_count') + 1)
+    if old_column.board_id != new_column.board_id:
+        Board.objects.filter(id=old_column.board_id) \
+            .update(task_count=F('task_count') - 1)
+        Board.objects.filter(id=new_column.board_id) \
+            .update(task_count=F('task_count') + 1)
+
+
+def count_done(task_id, delta=1):
+    Task.objects.filter(id=task_id) \
+        .update(done_subtask_count=F('done_subtask_count') + delta)
+
+
+def refresh_columns(columns):
+    columns.update(task_count=_counters()['column.task_count'][1])
+
+
+def refresh_boards(boards):
+    boards.update(task_count=_counters()['board.task_count'][1])
+
+
+def refresh_tasks(tasks):
+    counters = _counters()
+    tasks.update(subtask_count=counters['task.subtask_count'][1],
+                 done_subtask_count=counters['task.done_subtask_count'][1])
+
+
+def refresh_users(users):
+    users.update(assigned_task_count=_counters()['user.assigned_task_count'][1])
+
+
+# recount every row of the board, e.g. after a bulk insert into it
+def refresh_board(board):
+    refresh_boards(Board.objects.filter(id=board.id))
+    refresh_columns(Column.objects.filter(board_id=board.id))
+    refresh_tasks(Task.objects.filter(column__board_id=board.id))
+    refresh_users(User.objects.filter(team_id=board.team_id))
+
+
+# fix drifted counters chunk by chunk, return {counter: rows fixed}
+def reconcile(chunk_size=CHUNK_SIZE):
+    fixed = {}
+    for name, (model, actual) in _counters().items():
+        field = name.split('.')[1]
+        drifted = model.objects.annotate(actual=actual) \
+            .exclude(**{field: F('actual')}) \
+            .order_by('pk').values_list('pk', flat=True)
+        fixed[name], last_pk = 0, None
+        while True:
+            chunk = drifted if last_pk is None \
+                else drifted.filter(pk__gt=last_pk)
+            pks = list(chunk[:chunk_size])
+            if not pks:
+                break
+            model.objects.filter(pk__in=pks).update(**{field: actual})
+            fixed[name] += len(pks)
+            last_pk = pks[-1]
+    return fixed
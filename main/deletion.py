@@ -0,0 +1,78 @@
+from datetime import timedelta
+from django.db import transaction
+from django.utils import timezone
+from .models import Board, Column, Task, Subtask
+from .jobs import job, report_progress
+
+# Rows deleted per transaction. Keeps memory flat and row locks short no
+# matter how large the board is.
+CHUNK_SIZE = 1000
+
+
+# Delete the tasks matched by `tasks` bottom-up, `chunk_size` tasks at a time.
+# Django's cascade collector would otherwise load every task and subtask into
+# memory before issuing a single transaction of deletes.
+def delete_tasks(tasks, chunk_size=CHUNK_SIZE, progress=None):
+    total = tasks.count() if progress else None
+    deleted = 0
+    while True:
+        task_ids = list(tasks.values_list('id', flat=True)[:chunk_size])
+        if not task_ids:
+            break
+        with transaction.atomic():
+            # subtasks have no dependents, so this is a single DELETE
+            Subtask.objects.filter(task_id__in=task_ids).delete()
+            Task.objects.filter(id__in=task_ids).delete()
+        deleted += len(task_ids)
+        if progress:
+            progress(deleted, total)
+    return deleted
+
+
+def delete_board(board_id, chunk_size=CHUNK_SIZE, progress=None):
+    delete_tasks(Task.objects.filter(column__board_id=board_id),
+                 chunk_size, progress)
+    with transaction.atomic():
+        Column.objects.filter(board_id=board_id).delete()
+        Board.objects.filter(id=board_id).delete()
+
+
+def delete_user(user):
+    with transaction.atomic():
+        # one UPDATE instead of loading every assigned task for SET_NULL
+        Task.objects.filter(user=user).update(user=None)
+        user.delete()
+
+
+# Reclaim the rows of boards and tasks tombstoned at least `grace` ago. Boards
+# are purged one at a time and tasks `chunk_size` at a time, so no single
+# transaction grows with the amount of tombstoned data. `progress` is called
+# with (name, deleted, total).
+def purge_tombstones(grace=timedelta(0), chunk_size=CHUNK_SIZE,
+                     progress=None):
+    cutoff = timezone.now() - grace
+
+    def report(name):
+        if progress:
+            return lambda deleted, total: progress(name, deleted, total)
+
+    board_ids = list(Board.objects.tombstoned()
+                     .filter(deleted_at__lte=cutoff)
+                     .values_list('id', flat=True))
+    for board_id in board_ids:
+        delete_board(board_id, chunk_size, report(f'board {board_id}'))
+
+    task_count = delete_tasks(
+        Task.objects.tombstoned().filter(deleted_at__lte=cutoff),
+        chunk_size, report('deleted tasks')
+    )
+    return len(board_ids), task_count
+
+
+# Deferred purge of a single tombstoned board, enqueued by DELETE /boards/.
+@job(concurrency=2)
+def purge_board(job, board_id):
+    if Board.objects.tombstoned().filter(id=board_id).exists():
+        delete_board(board_id,
+                     progress=lambda done, total:
+                     report_progress(job, done, total))
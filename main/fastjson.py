@@ -0,0 +1,37 @@
+import json
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# DRF's encoder knows how to turn lazy strings, querysets, decimals etc. into
+# JSON-friendly values. orjson calls it for any type it can't handle itself.
+_encoder = JSONEncoder()
+
+
+def dumps(data, indent=False):
+    if orjson is None:
+        return json.dumps(
+            data, cls=JSONEncoder, ensure_ascii=False, allow_nan=False,
+            indent=2 if indent else None,
+            separators=(',', ': ') if indent else (',', ':')
+        ).encode('utf-8')
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_encoder.default, option=option)
+
+
+def loads(data):
+    if orjson is None:
+        return json.loads(data, parse_constant=_reject_constant)
+    return orjson.loads(data)
+
+
+def _reject_constant(constant):
+    raise ValueError(f'Out of range float values are not JSON compliant: '
+                     f'{constant}')
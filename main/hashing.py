@@ -0,0 +1,38 @@
+"""Password hashing and auth tokens.
+
+Every bcrypt call of the app goes through here so that the cost can be set
+per settings profile: ``PASSWORD_HASH_ROUNDS`` for stored passwords and
+``AUTH_TOKEN_ROUNDS`` for the tokens handed out at register/login. The test
+profile (backend.settings_test) lowers both to bcrypt's minimum. Checking a
+hash always uses the cost stored in the hash itself, so passwords and tokens
+made under one profile stay valid under the other.
+"""
+from django.conf import settings
+import bcrypt
+
+
+def hash_password(password):
+    return bcrypt.hashpw(bytes(password, 'utf-8'),
+                         bcrypt.gensalt(settings.PASSWORD_HASH_ROUNDS))
+
+
+# raises ValueError if the stored hash is malformed
+def check_password(password, hashed):
+    return bcrypt.checkpw(bytes(password, 'utf-8'), bytes(hashed))
+
+
+# `rounds` overrides the profile's cost, e.g. for benchmarks.loadtest
+def make_token(user, rounds=None):
+    return bcrypt.hashpw(
+        bytes(user.username, 'utf-8') + bytes(user.password),
+        bcrypt.gensalt(rounds or settings.AUTH_TOKEN_ROUNDS)
+    ).decode('utf-8')
+
+
+def check_token(user, token):
+    try:
+        return bcrypt.checkpw(bytes(user.username, 'utf-8') +
+                              bytes(user.password),
+                              bytes(token, 'utf-8'))
+    except (ValueError, TypeError):
+        return False
@@ -0,0 +1,120 @@
+import logging
+import traceback
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# seconds before the first retry; doubled on every further attempt
+RETRY_DELAY = 10
+
+
+# Mark a function as a job. It's called with the Job row as the first
+# argument, followed by the keyword arguments it was enqueued with.
+# `concurrency` caps how many of these jobs run at once across all workers.
+def job(max_attempts=3, concurrency=None):
+    def decorator(func):
+        func.job_name = f'{func.__module__}.{func.__qualname__}'
+        func.max_attempts = max_attempts
+        func.concurrency = concurrency
+        func.delay = lambda **kwargs: enqueue(func, **kwargs)
+        return func
+    return decorator
+
+
+def enqueue(func, run_after=None, **kwargs):
+    return Job.objects.create(name=func.job_name,
+                              kwargs=kwargs,
+                              max_attempts=func.max_attempts,
+                              run_after=run_after or timezone.now())
+
+
+def report_progress(job, done, total):
+    job.progress = {'done': done, 'total': total}
+    Job.objects.filter(id=job.id).update(progress=job.progress,
+                                         updated_at=timezone.now())
+
+
+# Claim the next runnable job for `worker_id`, or return None. Claiming is a
+# conditional UPDATE on the status, so two workers can never both claim the
+# same job, on any database backend.
+def claim(worker_id):
+    now = timezone.now()
+    candidates = Job.objects.filter(status=Job.QUEUED, run_after__lte=now) \
+        .order_by('run_after', 'id') \
+        .values_list('id', 'name')[:20]
+    for job_id, name in candidates:
+        concurrency = getattr(_resolve(name), 'concurrency', None)
+        with transaction.atomic():
+            queued = Job.objects.filter(id=job_id, status=Job.QUEUED)
+            if concurrency:
+                # claimers of one name lock the same rows and take turns; the
+                # UPDATE only goes through if fewer than `concurrency` run
+                list(Job.objects.select_for_update()
+                     .filter(name=name, status__in=(Job.QUEUED, Job.RUNNING))
+                     .order_by('id').values_list('id'))
+                running = Job.objects.filter(name=name, status=Job.RUNNING)
+                queued = queued.exclude(name__in=running.order_by('id')
+                                        .values('name')[concurrency - 1:])
+            claimed = queued.update(
+                status=Job.RUNNING,
+                locked_by=worker_id,
+                locked_at=now,
+                attempts=F('attempts') + 1,
+                updated_at=now
+            )
+        if claimed:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def run(job):
+    try:
+        _resolve(job.name)(job, **job.kwargs)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            logger.warning('Job %s (%s) failed, retrying.', job.id, job.name)
+            job.status = Job.QUEUED
+            job.run_after = timezone.now() + timedelta(
+                seconds=RETRY_DELAY * 2 ** (job.attempts - 1)
+            )
+        else:
+            logger.error('Job %s (%s) failed.', job.id, job.name)
+            job.status = Job.FAILED
+    else:
+        job.status = Job.DONE
+    job.locked_by = ''
+    job.locked_at = None
+    job.save(update_fields=['status', 'run_after', 'last_error', 'locked_by',
+                            'locked_at', 'updated_at'])
+    return job
+
+
+# run jobs until none are runnable; return how many ran
+def run_pending(worker_id):
+    count = 0
+    while True:
+        job = claim(worker_id)
+        if not job:
+            return count
+        run(job)
+        count += 1
+
+
+# Put jobs whose worker died mid-run back on the queue.
+def requeue_stale(timeout=timedelta(hours=1)):
+    return Job.objects.filter(
+        status=Job.RUNNING, locked_at__lt=timezone.now() - timeout
+    ).update(status=Job.QUEUED, locked_by='', locked_at=None)
+
+
+def _resolve(name):
+    try:
+        return import_string(name)
+    except ImportError:
+        return None
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+from main.deletion import CHUNK_SIZE, delete_board
+from main.models import Board
+
+
+class Command(BaseCommand):
+    help = 'Delete a board and everything on it in chunks, reporting progress.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_id', type=int)
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        board_id = options['board_id']
+        if not Board.objects.filter(id=board_id).exists():
+            raise CommandError(f'Board {board_id} not found.')
+
+        def progress(deleted, total):
+            self.stdout.write(f'Deleted {deleted}/{total} tasks.')
+
+        delete_board(board_id, options['chunk_size'], progress)
+        self.stdout.write(self.style.SUCCESS(f'Board {board_id} deleted.'))
@@ -0,0 +1,29 @@
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from main.models import Board
+from main.transfer import CHUNK_SIZE, export_board
+
+
+class Command(BaseCommand):
+    help = 'Stream a board, its columns, tasks and subtasks as NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('board_id', type=int)
+        parser.add_argument('--output', '-o',
+                            help='file to write to (default: stdout)')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            board = Board.objects.alive().get(id=options['board_id'])
+        except Board.DoesNotExist:
+            raise CommandError(f'Board {options["board_id"]} not found.')
+
+        output = open(options['output'], 'wb') if options['output'] \
+            else sys.stdout.buffer
+        try:
+            for line in export_board(board, options['chunk_size']):
+                output.write(line)
+        finally:
+            if options['output']:
+                output.close()
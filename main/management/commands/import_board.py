@@ -0,0 +1,36 @@
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from main.models import Team
+from main.transfer import BATCH_SIZE, import_board
+
+
+class Command(BaseCommand):
+    help = 'Create a board for a team from an NDJSON board export.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('team_id', type=int)
+        parser.add_argument('input', nargs='?',
+                            help='file to read from (default: stdin)')
+        parser.add_argument('--name', help='name of the new board')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            team = Team.objects.get(id=options['team_id'])
+        except Team.DoesNotExist:
+            raise CommandError(f'Team {options["team_id"]} not found.')
+
+        lines = open(options['input'], 'rb') if options['input'] \
+            else sys.stdin.buffer
+        try:
+            board, task_count = import_board(lines, team, options['name'],
+                                             options['batch_size'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        finally:
+            if options['input']:
+                lines.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported board {board.id} with {task_count} tasks.'
+        ))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+from main.models import Job
+
+
+class Command(BaseCommand):
+    help = 'Show the status of background jobs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ids', nargs='*', type=int,
+                            help='show these jobs in detail')
+        parser.add_argument('--status', choices=[Job.QUEUED, Job.RUNNING,
+                                                 Job.DONE, Job.FAILED],
+                            help='list the jobs with this status')
+
+    def handle(self, *args, **options):
+        if options['ids']:
+            for job in Job.objects.filter(id__in=options['ids']):
+                self.stdout.write(
+                    f'Job {job.id}: {job.name} {job.status}\n'
+                    f'  kwargs: {job.kwargs}\n'
+                    f'  attempts: {job.attempts}/{job.max_attempts}\n'
+                    f'  progress: {job.progress}\n'
+                    f'  run after: {job.run_after}\n'
+                    f'  locked by: {job.locked_by or "-"}\n'
+                    f'  updated: {job.updated_at}'
+                )
+                if job.last_error:
+                    self.stdout.write(f'  last error:\n{job.last_error}')
+            return
+
+        if options['status']:
+            for job in Job.objects.filter(status=options['status']) \
+                    .order_by('-updated_at')[:100]:
+                self.stdout.write(f'{job.id}\t{job.name}\t{job.attempts}'
+                                  f'/{job.max_attempts}\t{job.updated_at}')
+            return
+
+        for row in Job.objects.values('name', 'status') \
+                .annotate(count=Count('id')).order_by('name', 'status'):
+            self.stdout.write(f'{row["name"]}\t{row["status"]}\t'
+                              f'{row["count"]}')
@@ -0,0 +1,33 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from main.deletion import CHUNK_SIZE, purge_tombstones
+
+
+class Command(BaseCommand):
+    help = 'Reclaim the rows of soft-deleted boards and tasks in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+        parser.add_argument('--grace', type=int, default=0,
+                            help='only purge rows deleted at least this many '
+                                 'seconds ago')
+        parser.add_argument('--interval', type=int, default=0,
+                            help='keep running, purging every this many '
+                                 'seconds')
+
+    def handle(self, *args, **options):
+        def progress(name, deleted, total):
+            self.stdout.write(f'Purged {deleted}/{total} tasks of {name}.')
+
+        while True:
+            boards, tasks = purge_tombstones(
+                timedelta(seconds=options['grace']),
+                options['chunk_size'],
+                progress if options['verbosity'] > 1 else None
+            )
+            self.stdout.write(f'Purged {boards} boards and {tasks} tasks.')
+
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from main.counters import CHUNK_SIZE, reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recount the denormalized task and subtask counters and fix ' \
+           'the ones that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        for name, fixed in reconcile(options['chunk_size']).items():
+            self.stdout.write(f'Fixed {fixed} {name} counters.')
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from main.models import User
+from main.seed import PASSWORD_RAW, seed
+
+
+class Command(BaseCommand):
+    help = 'Generate teams full of boards, tasks and subtasks for ' \
+           'benchmarks and load tests.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--teams', type=int, default=1)
+        parser.add_argument('--boards', type=int, default=3,
+                            help='boards per team')
+        parser.add_argument('--tasks', type=int, default=25,
+                            help='tasks per column')
+        parser.add_argument('--subtasks', type=int, default=3,
+                            help='subtasks per task')
+        parser.add_argument('--members', type=int, default=5,
+                            help='members per team')
+        parser.add_argument('--seed', type=int, default=0,
+                            help='the same seed generates the same data')
+        parser.add_argument('--prefix', default='seed',
+                            help='usernames start with this prefix')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if User.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(f'Users prefixed "{prefix}" already exist, '
+                               f'pick another --prefix.')
+
+        with transaction.atomic():
+            fixtures = seed(options['teams'], options['boards'],
+                            options['tasks'], options['subtasks'],
+                            options['members'], options['seed'], prefix)
+
+        for fixture in fixtures:
+            self.stdout.write(f'Team {fixture["team"].id}: '
+                              f'{len(fixture["boards"])} boards, admin '
+                              f'{fixture["admin"]["username"]}.')
+        self.stdout.write(f'Seeded {len(fixtures)} teams, every password is '
+                          f'"{PASSWORD_RAW}".')
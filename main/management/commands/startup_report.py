@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# what a fresh worker does before serving its first request, then print its
+# peak RSS (kB on Linux)
+BOOT = ('import django; django.setup(); '
+        'from django.core.wsgi import get_wsgi_application; '
+        'get_wsgi_application(); '
+        'from django.urls import get_resolver; '
+        'get_resolver().url_patterns; '
+        'import resource; '
+        'print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)')
+
+
+# -X importtime lines look like
+# "import time:   self [us] | cumulative | imported package"
+def parse_importtime(stderr):
+    packages = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        if not self_us.strip().isdigit():
+            continue
+        packages[name.strip().split('.')[0]] += int(self_us)
+    return packages
+
+
+class Command(BaseCommand):
+    help = 'Boot a worker under each settings module with -X importtime ' \
+           'and report boot time, peak memory and the slowest imports.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('modules', nargs='*',
+                            help='settings modules to compare (default: '
+                                 'the current one)')
+        parser.add_argument('--top', type=int, default=10,
+                            help='packages to list per module')
+
+    def boot(self, module):
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': module}
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', BOOT],
+            env=env, capture_output=True, text=True
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode:
+            raise CommandError(f'{module} failed to boot:\n'
+                               f'{result.stderr[-2000:]}')
+        rss = int(result.stdout.split()[-1])
+        return elapsed, rss, parse_importtime(result.stderr)
+
+    def handle(self, *args, **options):
+        for module in options['modules'] or [settings.SETTINGS_MODULE]:
+            elapsed, rss, packages = self.boot(module)
+            self.stdout.write(
+                f'{module}: booted in {elapsed * 1000:.0f} ms, '
+                f'{sum(packages.values()) / 1000:.0f} ms importing '
+                f'{len(packages)} packages, peak RSS {rss / 1024:.1f} MB'
+            )
+            ranked = sorted(packages.items(), key=lambda item: -item[1])
+            for name, self_us in ranked[:options['top']]:
+                self.stdout.write(f'  {self_us / 1000:8.1f} ms  {name}')
@@ -0,0 +1,62 @@
+import os
+import socket
+import threading
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import connection
+from main import jobs
+
+
+class Command(BaseCommand):
+    help = 'Run queued background jobs.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=1,
+                            help='jobs to run in parallel in this process')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='seconds to wait when the queue is empty')
+        parser.add_argument('--stale-timeout', type=int, default=3600,
+                            help='requeue jobs running longer than this many '
+                                 'seconds, assuming their worker died')
+        parser.add_argument('--once', action='store_true',
+                            help='exit once the queue is empty')
+
+    def handle(self, *args, **options):
+        worker_id = f'{socket.gethostname()}:{os.getpid()}'
+        requeued = jobs.requeue_stale(
+            timedelta(seconds=options['stale_timeout'])
+        )
+        if requeued:
+            self.stdout.write(f'Requeued {requeued} stale jobs.')
+
+        if options['threads'] == 1:
+            self.work(worker_id, options)
+            return
+
+        threads = [
+            threading.Thread(target=self.work,
+                             args=(f'{worker_id}:{i}', options))
+            for i in range(options['threads'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def work(self, worker_id, options):
+        try:
+            while True:
+                job = jobs.claim(worker_id)
+                if job:
+                    job = jobs.run(job)
+                    self.stdout.write(f'{worker_id}: job {job.id} '
+                                      f'({job.name}) {job.status}.')
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll_interval'])
+        finally:
+            # every thread has its own connection
+            if threading.current_thread() is not threading.main_thread():
+                connection.close()
@@ -0,0 +1,40 @@
+import logging
+import os
+import threading
+from collections import defaultdict
+from time import monotonic
+from django.conf import settings
+
+# In-process counters. Each worker keeps its own; read them with snapshot().
+# With METRICS_LOG_INTERVAL set, every worker also logs its counters at most
+# once per that many seconds, on the first incr() after the interval.
+logger = logging.getLogger(__name__)
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_logged_at = monotonic()
+
+
+def incr(name, value=1):
+    global _logged_at
+    with _lock:
+        _counters[name] += value
+        interval = getattr(settings, 'METRICS_LOG_INTERVAL', 0)
+        if not interval or monotonic() - _logged_at < interval:
+            return
+        _logged_at = monotonic()
+        counters = dict(_counters)
+    logger.info('Metrics of process %s: %s', os.getpid(), ' '.join(
+        f'{name}={value}' for name, value in sorted(counters.items())
+    ))
+
+
+def snapshot():
+    with _lock:
+        return dict(_counters)
+
+
+def reset():
+    global _logged_at
+    with _lock:
+        _counters.clear()
+        _logged_at = monotonic()
@@ -0,0 +1,249 @@
+import gzip
+import io
+from functools import lru_cache
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.urls import Resolver404, resolve
+from django.utils.cache import patch_vary_headers
+from django.utils.module_loading import import_string
+from rest_framework.views import APIView
+from . import metrics, replicas
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# return the encodings accepted by the client, mapped to their q-values
+def parse_accept_encoding(header):
+    accepted = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    Compress API responses with brotli or gzip, whichever the client prefers
+    and the server supports. Responses below COMPRESSION_MIN_SIZE are left
+    alone, as are responses that already have a Content-Encoding.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.gzip_level = getattr(settings, 'COMPRESSION_GZIP_LEVEL', 6)
+        self.brotli_quality = getattr(settings,
+                                      'COMPRESSION_BROTLI_QUALITY', 5)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+        if response.has_header('Content-Encoding'):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = self.negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if not encoding:
+            return response
+
+        if response.streaming:
+            # the compressed size is unknown until the stream is consumed
+            response.streaming_content = self.compress_stream(
+                encoding, response.streaming_content
+            )
+            del response['Content-Length']
+        else:
+            content = self.compress(encoding, response.content)
+            if len(content) >= len(response.content):
+                return response
+            metrics.incr(f'compression.{encoding}.responses')
+            metrics.incr(f'compression.{encoding}.bytes_in',
+                         len(response.content))
+            metrics.incr(f'compression.{encoding}.bytes_out', len(content))
+            response.content = content
+            response['Content-Length'] = str(len(content))
+
+        # The representation changed, so a strong ETag has to become weak
+        # (RFC 7232 section 2.1). Weak comparison still lets If-None-Match
+        # requests match it.
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+
+        return response
+
+    @staticmethod
+    def negotiate(header):
+        accepted = parse_accept_encoding(header)
+        wildcard = accepted.get('*', 0)
+        candidates = ('br', 'gzip') if brotli else ('gzip',)
+        encoding, best_q = None, 0
+        for coding in candidates:
+            q = accepted.get(coding, wildcard)
+            if q > best_q:
+                encoding, best_q = coding, q
+        return encoding
+
+    def compress(self, encoding, content):
+        if encoding == 'br':
+            return brotli.compress(content, quality=self.brotli_quality)
+        return gzip.compress(content, compresslevel=self.gzip_level, mtime=0)
+
+    def compress_stream(self, encoding, chunks):
+        bytes_in = bytes_out = 0
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=self.brotli_quality)
+            for chunk in chunks:
+                bytes_in += len(chunk)
+                data = compressor.process(chunk)
+                if data:
+                    bytes_out += len(data)
+                    yield data
+            data = compressor.finish()
+            bytes_out += len(data)
+            yield data
+        else:
+            buffer = io.BytesIO()
+            with gzip.GzipFile(mode='wb', fileobj=buffer, mtime=0,
+                               compresslevel=self.gzip_level) as zfile:
+                for chunk in chunks:
+                    bytes_in += len(chunk)
+                    zfile.write(chunk)
+                    data = buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    if data:
+                        bytes_out += len(data)
+                        yield data
+            data = buffer.getvalue()
+            bytes_out += len(data)
+            yield data
+
+        metrics.incr(f'compression.{encoding}.responses')
+        metrics.incr(f'compression.{encoding}.bytes_in', bytes_in)
+        metrics.incr(f'compression.{encoding}.bytes_out', bytes_out)
+
+
+# whether path_info is routed to a DRF view, which authenticates with the
+# AUTH-USER/AUTH-TOKEN headers and never touches sessions or cookies
+@lru_cache(maxsize=1024)
+def is_api_path(path_info):
+    try:
+        match = resolve(path_info)
+    except Resolver404:
+        return False
+    view_class = getattr(match.func, 'cls', None)
+    return isinstance(view_class, type) and issubclass(view_class, APIView)
+
+
+def clear_api_paths(setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        is_api_path.cache_clear()
+
+
+setting_changed.connect(clear_api_paths)
+
+
+class BrowserMiddleware:
+    """
+    Run BROWSER_MIDDLEWARE (sessions, CSRF, auth, messages, clickjacking) for
+    everything except API routes, which go straight to the view.
+
+    Django only collects process_view, process_template_response and
+    process_exception from the entries in MIDDLEWARE, so the wrapped
+    middleware's hooks are forwarded from here, in the order Django would
+    have called them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.middleware = []
+        handler = get_response
+        for middleware_path in reversed(settings.BROWSER_MIDDLEWARE):
+            instance = import_string(middleware_path)(handler)
+            self.middleware.insert(0, instance)
+            handler = instance
+        self.browser_response = handler
+        self.view_hooks = [m.process_view for m in self.middleware
+                           if hasattr(m, 'process_view')]
+        self.template_response_hooks = [
+            m.process_template_response for m in reversed(self.middleware)
+            if hasattr(m, 'process_template_response')
+        ]
+        self.exception_hooks = [
+            m.process_exception for m in reversed(self.middleware)
+            if hasattr(m, 'process_exception')
+        ]
+
+    def __call__(self, request):
+        if is_api_path(request.path_info):
+            return self.get_response(request)
+        return self.browser_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if is_api_path(request.path_info):
+            return None
+        for hook in self.view_hooks:
+            response = hook(request, view_func, view_args, view_kwargs)
+            if response is not None:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if is_api_path(request.path_info):
+            return response
+        for hook in self.template_response_hooks:
+            response = hook(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        if is_api_path(request.path_info):
+            return None
+        for hook in self.exception_hooks:
+            response = hook(request, exception)
+            if response is not None:
+                return response
+        return None
+
+
+class ReplicaMiddleware:
+    """
+    Send the reads of GET, HEAD and OPTIONS requests to a read replica,
+    unless the client wrote within the last REPLICA_PIN_SECONDS, and pin
+    clients that write to the primary. See main.replicas.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        username = request.META.get('HTTP_AUTH_USER')
+        use_replicas = (
+            request.method in ('GET', 'HEAD', 'OPTIONS')
+            and bool(replicas.replica_aliases())
+            and not (username and replicas.is_pinned(username))
+        )
+        with replicas.request_routing(use_replicas) as state:
+            if username:
+                replicas.pin(username)
+            response = self.get_response(request)
+        if state.wrote and state.pins and replicas.replica_aliases():
+            replicas.pin_keys(state.pins)
+        return response
@@ -0,0 +1,82 @@
+# Generated by Django 3.1.7 on 2026-10-19 12:43
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Postgres only: the GIN index and the triggers that keep Task.search_vector
+# in sync. Task titles weigh more than descriptions, which weigh more than
+# subtask titles. Subtask writes touch their task's title so that the task
+# trigger recomputes the vector.
+FORWARD = """
+CREATE INDEX task_search_vector_idx ON main_task USING gin (search_vector);
+
+CREATE FUNCTION main_task_search_vector() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(
+            (SELECT string_agg(title, ' ') FROM main_subtask
+             WHERE task_id = NEW.id), ''
+        )), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER main_task_search_vector
+    BEFORE INSERT OR UPDATE OF title, description ON main_task
+    FOR EACH ROW EXECUTE PROCEDURE main_task_search_vector();
+
+CREATE FUNCTION main_subtask_search_vector() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE main_task SET title = title WHERE id = NEW.task_id;
+    END IF;
+    IF TG_OP <> 'INSERT' AND (TG_OP = 'DELETE' OR OLD.task_id <> NEW.task_id)
+    THEN
+        UPDATE main_task SET title = title WHERE id = OLD.task_id;
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER main_subtask_search_vector
+    AFTER INSERT OR DELETE OR UPDATE OF title, task_id ON main_subtask
+    FOR EACH ROW EXECUTE PROCEDURE main_subtask_search_vector();
+
+UPDATE main_task SET title = title;
+"""
+
+BACKWARD = """
+DROP TRIGGER main_subtask_search_vector ON main_subtask;
+DROP FUNCTION main_subtask_search_vector();
+DROP TRIGGER main_task_search_vector ON main_task;
+DROP FUNCTION main_task_search_vector();
+DROP INDEX task_search_vector_idx;
+"""
+
+
+def forward(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(FORWARD)
+
+
+def backward(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0016_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(forward, backward),
+    ]
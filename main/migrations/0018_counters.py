@@ -0,0 +1,67 @@
+# Generated by Django 3.1.7 on 2026-10-19 12:45
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(queryset, field):
+    return Coalesce(Subquery(
+        queryset.filter(**{field: OuterRef('pk')}).order_by()
+        .values(field).annotate(count=Count('pk')).values('count')
+    ), 0)
+
+
+def backfill(apps, schema_editor):
+    User = apps.get_model('main', 'User')
+    Board = apps.get_model('main', 'Board')
+    Column = apps.get_model('main', 'Column')
+    Task = apps.get_model('main', 'Task')
+    Subtask = apps.get_model('main', 'Subtask')
+
+    alive_tasks = Task.objects.filter(deleted_at__isnull=True)
+    Column.objects.update(task_count=_count(alive_tasks, 'column'))
+    Board.objects.update(task_count=_count(alive_tasks, 'column__board'))
+    Task.objects.update(
+        subtask_count=_count(Subtask.objects.all(), 'task'),
+        done_subtask_count=_count(Subtask.objects.filter(done=True), 'task')
+    )
+    User.objects.update(assigned_task_count=_count(
+        alive_tasks.filter(column__board__deleted_at__isnull=True), 'user'
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0017_task_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='task_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='column',
+            name='task_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='done_subtask_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='subtask_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='assigned_task_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-19 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0018_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(deleted_at__isnull=True), fields=['user', 'id'], name='task_alive_user_idx'),
+        ),
+    ]
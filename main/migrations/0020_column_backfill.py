@@ -0,0 +1,68 @@
+# Generated by Django 3.1.7 on 2026-10-19 13:01
+
+from django.db import migrations
+from django.db.models import Count, Max, Min
+
+
+# GET /columns/ and GET /boards/?team_id= used to create columns and a first
+# board on demand. Do it once here instead so they can be plain reads, and
+# merge the duplicate columns that concurrent requests could create so that
+# column_board_order_uniq (next migration) can be added.
+def backfill(apps, schema_editor):
+    Team = apps.get_model('main', 'Team')
+    Board = apps.get_model('main', 'Board')
+    Column = apps.get_model('main', 'Column')
+    Task = apps.get_model('main', 'Task')
+
+    duplicates = Column.objects.values('board', 'order').order_by().annotate(
+        count=Count('id'), keep=Min('id')
+    ).filter(count__gt=1)
+    for duplicate in duplicates:
+        keep = Column.objects.get(id=duplicate['keep'])
+        extra = Column.objects.filter(
+            board=duplicate['board'], order=duplicate['order']
+        ).exclude(id=keep.id)
+        # move their tasks below the kept column's
+        order = Task.objects.filter(column=keep).aggregate(
+            order=Max('order')
+        )['order']
+        order = -1 if order is None else order
+        for task in Task.objects.filter(column__in=extra).order_by('order',
+                                                                   'id'):
+            order += 1
+            task.column = keep
+            task.order = order
+            task.save(update_fields=['column', 'order'])
+        extra.delete()
+        keep.task_count = Task.objects.filter(
+            column=keep, deleted_at__isnull=True
+        ).count()
+        keep.save(update_fields=['task_count'])
+
+    Column.objects.bulk_create([
+        Column(board_id=board_id, order=order)
+        for board_id in Board.objects.filter(column__isnull=True)
+        .values_list('id', flat=True)
+        for order in range(0, 4)
+    ])
+
+    teams = Team.objects.filter(user__is_admin=True).exclude(
+        id__in=Board.objects.filter(deleted_at__isnull=True).values('team')
+    ).distinct()
+    for team in teams:
+        board = Board.objects.create(team=team, name='New Board')
+        board.user.add(*team.user_set.filter(is_admin=True))
+        Column.objects.bulk_create([
+            Column(board=board, order=order) for order in range(0, 4)
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0019_task_alive_user_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.7 on 2026-10-19 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0020_column_backfill'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='column',
+            constraint=models.UniqueConstraint(fields=('board', 'order'), name='column_board_order_uniq'),
+        ),
+    ]
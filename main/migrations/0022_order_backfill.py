@@ -0,0 +1,47 @@
+# Generated by Django 3.1.7 on 2026-10-19 13:04
+
+from django.db import migrations
+from django.db.models import Count, F
+
+
+# move rows that share an order down until each has its own, keeping their
+# relative order: orders 0, 0, 1, 3 become 0, 1, 2, 3
+def _spread(rows):
+    changed, last = [], None
+    for row in rows:
+        if last is not None and row.order <= last:
+            row.order = last + 1
+            changed.append(row)
+        last = row.order
+    return changed
+
+
+def backfill(apps, schema_editor):
+    Task = apps.get_model('main', 'Task')
+    Subtask = apps.get_model('main', 'Subtask')
+
+    # tombstones make way for task_column_order_uniq (next migration)
+    Task.objects.filter(deleted_at__isnull=False).update(order=-F('id'))
+
+    for model, parent in ((Task, 'column'), (Subtask, 'task')):
+        rows = model.objects.all()
+        if model is Task:
+            rows = rows.filter(deleted_at__isnull=True)
+        parents = rows.values(parent, 'order').order_by() \
+            .annotate(count=Count('id')).filter(count__gt=1) \
+            .values_list(parent, flat=True).distinct()
+        for parent_id in parents:
+            changed = _spread(rows.filter(**{parent: parent_id})
+                              .order_by('order', 'id'))
+            model.objects.bulk_update(changed, ['order'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0021_column_board_order_uniq'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
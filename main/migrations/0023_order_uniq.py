@@ -0,0 +1,22 @@
+# Generated by Django 3.1.7 on 2026-10-19 13:05
+
+from django.db import migrations, models
+import django.db.models.constraints
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0022_order_backfill'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='subtask',
+            constraint=models.UniqueConstraint(deferrable=django.db.models.constraints.Deferrable['DEFERRED'], fields=('task', 'order'), name='subtask_task_order_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(deferrable=django.db.models.constraints.Deferrable['DEFERRED'], fields=('column', 'order'), name='task_column_order_uniq'),
+        ),
+    ]
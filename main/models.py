@@ -1,7 +1,19 @@
 from django.db.models import *
+from django.contrib.postgres.search import SearchVectorField
+from django.utils import timezone
 import uuid
 
 
+# Boards and tasks are soft-deleted: deleting sets deleted_at and the purge
+# command reclaims the rows later. Read paths only look at alive() rows.
+class TombstoneQuerySet(QuerySet):
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def tombstoned(self):
+        return self.filter(deleted_at__isnull=False)
+
+
 class Team(Model):
     invite_code = UUIDField(default=uuid.uuid4)
 
@@ -11,17 +23,39 @@ class User(Model):
     password = BinaryField()
     is_admin = BooleanField(default=False)
     team = ForeignKey(Team, on_delete=CASCADE)
+    # denormalized, see main.counters
+    assigned_task_count = IntegerField(default=0, editable=False)
 
 
 class Board(Model):
     name = CharField(max_length=35)
     team = ForeignKey(Team, on_delete=CASCADE)
     user = ManyToManyField(User)
+    deleted_at = DateTimeField(null=True, blank=True)
+    task_count = IntegerField(default=0, editable=False)
+
+    objects = TombstoneQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            Index(fields=['team'], name='board_alive_team_idx',
+                  condition=Q(deleted_at__isnull=True)),
+            Index(fields=['deleted_at'], name='board_tombstone_idx',
+                  condition=Q(deleted_at__isnull=False)),
+        ]
 
 
 class Column(Model):
     order = IntegerField()
     board = ForeignKey(Board, on_delete=CASCADE)
+    task_count = IntegerField(default=0, editable=False)
+
+    class Meta:
+        constraints = [
+            # makes main.util.create_columns safe to repeat
+            UniqueConstraint(fields=['board', 'order'],
+                             name='column_board_order_uniq'),
+        ]
 
 
 class Task(Model):
@@ -30,6 +64,32 @@ class Task(Model):
     order = IntegerField()
     column = ForeignKey(Column, on_delete=CASCADE)
     user = ForeignKey(User, null=True, on_delete=SET_NULL)
+    deleted_at = DateTimeField(null=True, blank=True)
+    # title, description and subtask titles; kept up to date by triggers on
+    # Postgres (see migration 0017) and left empty on other databases
+    search_vector = SearchVectorField(null=True, editable=False)
+    subtask_count = IntegerField(default=0, editable=False)
+    done_subtask_count = IntegerField(default=0, editable=False)
+
+    objects = TombstoneQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            Index(fields=['column', 'order'], name='task_alive_column_idx',
+                  condition=Q(deleted_at__isnull=True)),
+            # GET /tasks/?assignee= pages through a user's tasks by id
+            Index(fields=['user', 'id'], name='task_alive_user_idx',
+                  condition=Q(deleted_at__isnull=True)),
+            Index(fields=['deleted_at'], name='task_tombstone_idx',
+                  condition=Q(deleted_at__isnull=False)),
+        ]
+        constraints = [
+            # tombstoned tasks keep out of the way at order -id; see
+            # main.ordering
+            UniqueConstraint(fields=['column', 'order'],
+                             name='task_column_order_uniq',
+                             deferrable=Deferrable.DEFERRED),
+        ]
 
 
 class Subtask(Model):
@@ -37,3 +97,39 @@ class Subtask(Model):
     order = IntegerField()
     task = ForeignKey(Task, on_delete=CASCADE)
     done = BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            UniqueConstraint(fields=['task', 'order'],
+                             name='subtask_task_order_uniq',
+                             deferrable=Deferrable.DEFERRED),
+        ]
+
+
+class Job(Model):
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    # dotted path of a function decorated with main.jobs.job
+    name = CharField(max_length=255)
+    kwargs = JSONField(default=dict)
+    status = CharField(max_length=10, default=QUEUED)
+    attempts = IntegerField(default=0)
+    max_attempts = IntegerField(default=3)
+    run_after = DateTimeField(default=timezone.now)
+    locked_by = CharField(max_length=100, blank=True)
+    locked_at = DateTimeField(null=True, blank=True)
+    progress = JSONField(null=True, blank=True)
+    last_error = TextField(blank=True)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            Index(fields=['run_after'], name='job_queued_idx',
+                  condition=Q(status='queued')),
+            Index(fields=['name'], name='job_running_idx',
+                  condition=Q(status='running')),
+        ]
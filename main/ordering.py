@@ -0,0 +1,58 @@
+"""Set-based ordering of tasks and subtasks.
+
+Task(column, order) and Subtask(task, order) are unique. The constraints are
+deferred to commit so that shifting a run of rows with one UPDATE doesn't
+trip over its own intermediate states; Django only creates them on Postgres.
+Tombstoned tasks move out of the way to order -id.
+
+Writes that insert or move rows into a column (or task) first lock its row,
+so they take turns with each other, then lock the rows they touch with
+select_for_update, always in id order so that concurrent requests queue up
+instead of deadlocking. Changes go back with UPDATEs of only the changed
+fields, never a full-row save that could undo concurrent counter updates or
+tombstones.
+"""
+from django.db.models import Case, F, Value, When
+
+
+# lock the rows of queryset, but not those of tables it joins, and return
+# them by id
+def lock(queryset):
+    return {obj.id: obj for obj in
+            queryset.select_for_update(of=('self',)).order_by('id')}
+
+
+# free `order` in queryset (the other rows of one column or task) by moving it
+# and everything after it down by one; a no-op if nothing is at `order`
+def make_room(queryset, order):
+    rows = lock(queryset.filter(order__gte=order))
+    if any(row.order == order for row in rows.values()):
+        queryset.model.objects.filter(id__in=rows) \
+            .update(order=F('order') + 1)
+
+
+# write {id: {attname: value}} with one UPDATE
+def update(model, changes):
+    changes = {id: values for id, values in changes.items() if values}
+    fields = {field for values in changes.values() for field in values}
+    if not fields:
+        return 0
+    return model.objects.filter(id__in=changes).update(**{
+        field: Case(
+            *[When(id=id, then=Value(values[field]))
+              for id, values in changes.items() if field in values],
+            default=F(field),
+            output_field=model._meta.get_field(field)
+        ) for field in fields
+    })
+
+
+# the fields of validated_data that differ from instance, as {attname: value}
+def changed_values(instance, validated_data):
+    values = {}
+    for name, value in validated_data.items():
+        attname = instance._meta.get_field(name).attname
+        value = getattr(value, 'pk', value)
+        if value != getattr(instance, attname):
+            values[attname] = value
+    return values
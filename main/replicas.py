@@ -0,0 +1,94 @@
+"""Read-replica routing.
+
+Reads go to the primary (``default``) unless ReplicaMiddleware has opted the
+current request into replicas, which it does for GET/HEAD/OPTIONS requests
+from clients that have not written recently. ``REPLICA_DATABASES`` lists the
+replica aliases; every request picks one of them and reads from it until the
+first write, after which the rest of the request reads from the primary.
+
+A request that writes pins its client (the AUTH-USER header, plus anything
+passed to pin()) to the primary for ``REPLICA_PIN_SECONDS`` so the next reads
+see the write. Pins live in the ``REPLICA_PIN_CACHE`` cache, which has to be
+shared, e.g. Redis or Memcached, for pins to hold across workers.
+
+Management commands, jobs and anything else outside a request always use the
+primary.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+
+_state = ContextVar('replica_state', default=None)
+
+
+def replica_aliases():
+    return getattr(settings, 'REPLICA_DATABASES', [])
+
+
+class RequestState:
+    def __init__(self, use_replicas):
+        aliases = replica_aliases()
+        self.replica = random.choice(aliases) if aliases else None
+        self.use_replicas = use_replicas and self.replica is not None
+        self.wrote = False
+        self.pins = set()
+
+
+# route the queries made inside the block for one request
+@contextmanager
+def request_routing(use_replicas):
+    state = RequestState(use_replicas)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+# pin key to the primary too if the current request writes
+def pin(key):
+    state = _state.get()
+    if state is not None:
+        state.pins.add(key)
+
+
+def _cache():
+    return caches[getattr(settings, 'REPLICA_PIN_CACHE', 'default')]
+
+
+def pin_keys(keys):
+    seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+    _cache().set_many({f'replica-pin:{key}': True for key in keys},
+                      timeout=seconds)
+
+
+def is_pinned(key):
+    return _cache().get(f'replica-pin:{key}', False)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is not None and state.use_replicas:
+            return state.replica
+        return None
+
+    # without an opinion outside requests, so that e.g. migrate --database
+    # works as usual
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is None:
+            return None
+        state.wrote = True
+        state.use_replicas = False
+        return DEFAULT_DB_ALIAS
+
+    # the replicas hold the same rows as the primary
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
@@ -0,0 +1,67 @@
+"""Ranked task search scoped to the boards a user can see.
+
+On Postgres, hits come from the GIN-indexed ``Task.search_vector`` (see
+migration 0017) and are ranked with ts_rank. Other databases fall back to
+case-insensitive substring matching: every term of the query must appear in
+the title, the description or a subtask title, and matches are weighted the
+same way the vector is (title > description > subtask).
+"""
+from django.db import connection
+from django.db.models import Case, When, Value, IntegerField, F, Q, \
+    Exists, OuterRef
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from .models import Board, Task, Subtask
+
+PAGE_SIZE = 20
+SEARCH_CONFIG = 'english'
+
+
+def visible_boards(user):
+    boards = Board.objects.alive().filter(team_id=user.team_id)
+    return boards if user.is_admin else boards.filter(user=user)
+
+
+def _postgres_hits(tasks, query):
+    search_query = SearchQuery(query, config=SEARCH_CONFIG,
+                               search_type='websearch')
+    return tasks.filter(search_vector=search_query).annotate(
+        rank=SearchRank(F('search_vector'), search_query)
+    )
+
+
+def _fallback_hits(tasks, query):
+    rank = Value(0, output_field=IntegerField())
+    for i, term in enumerate(query.split()):
+        subtask_match = f'subtask_match_{i}'
+        tasks = tasks.annotate(**{subtask_match: Exists(
+            Subtask.objects.filter(task=OuterRef('pk'), title__icontains=term)
+        )}).filter(Q(title__icontains=term) |
+                   Q(description__icontains=term) |
+                   Q(**{subtask_match: True}))
+        rank = rank + Case(When(title__icontains=term, then=Value(4)),
+                           When(description__icontains=term, then=Value(2)),
+                           default=Value(1), output_field=IntegerField())
+    return tasks.annotate(rank=rank)
+
+
+# return (hits, has_next) of the 1-based page
+def search_tasks(user, query, page=1, page_size=None):
+    page_size = page_size or PAGE_SIZE
+    tasks = Task.objects.alive().filter(column__board__in=visible_boards(user))
+    if connection.vendor == 'postgresql':
+        tasks = _postgres_hits(tasks, query)
+    else:
+        tasks = _fallback_hits(tasks, query)
+
+    offset = (page - 1) * page_size
+    hits = list(tasks.order_by('-rank', 'id').values(
+        'id', 'title', 'description', 'column_id', 'column__board_id', 'rank'
+    )[offset:offset + page_size + 1])
+
+    return [{'id': hit['id'],
+             'title': hit['title'],
+             'description': hit['description'],
+             'column': hit['column_id'],
+             'board': hit['column__board_id'],
+             'rank': hit['rank']}
+            for hit in hits[:page_size]], len(hits) > page_size
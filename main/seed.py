@@ -0,0 +1,98 @@
+"""Bulk generator for large, realistic datasets.
+
+Every team gets an admin and some members, N boards with four columns each,
+M tasks per column and K subtasks per task. Rows are inserted with
+bulk_create and everyone shares main.util's ``barbarbar`` password, hashed
+once per process, so no bcrypt work is done per user. Titles, descriptions,
+assignees and done flags come from a ``random.Random`` seeded by the caller,
+so the same seed always produces the same data.
+"""
+import random
+from .models import Team, User, Board, Column, Task, Subtask
+from .counters import \
+    refresh_boards, refresh_columns, refresh_tasks, refresh_users
+from .util import password_hash
+
+PASSWORD_RAW = 'barbarbar'
+BATCH_SIZE = 500
+
+WORDS = ('fix', 'add', 'update', 'remove', 'refactor', 'test', 'deploy',
+         'review', 'design', 'document', 'login', 'board', 'column', 'task',
+         'api', 'cache', 'query', 'index', 'layout', 'button', 'form',
+         'error', 'page', 'release', 'migration', 'report', 'search', 'user')
+
+
+def _title(rng, max_length, words=(2, 5)):
+    title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(*words)))
+    return title.capitalize()[:max_length]
+
+
+def seed_team(prefix, boards, tasks, subtasks, members=1, rng=None):
+    rng = rng or random.Random(0)
+    password = password_hash()
+
+    team = Team.objects.create()
+    admin = User.objects.create(username=f'{prefix}admin',
+                                password=password,
+                                is_admin=True,
+                                team=team)
+    team_members = User.objects.bulk_create([
+        User(username=f'{prefix}member{i}', password=password,
+             is_admin=False, team=team)
+        for i in range(members)
+    ])
+
+    Board.objects.bulk_create([
+        Board(name=_title(rng, 35, (1, 3)), team=team)
+        for _ in range(boards)
+    ])
+    team_boards = list(Board.objects.filter(team=team).order_by('id'))
+    Membership = Board.user.through
+    Membership.objects.bulk_create([
+        Membership(board_id=board.id, user_id=user.username)
+        for board in team_boards for user in [admin, *team_members]
+    ], batch_size=BATCH_SIZE)
+
+    Column.objects.bulk_create([
+        Column(order=i, board=board)
+        for board in team_boards for i in range(4)
+    ])
+    columns = list(Column.objects.filter(board__team=team).order_by('id'))
+
+    Task.objects.bulk_create([
+        Task(title=_title(rng, 50),
+             description=' '.join(rng.choice(WORDS)
+                                  for _ in range(rng.randint(0, 30))),
+             order=i,
+             column=column,
+             user=rng.choice(team_members) if members else None)
+        for column in columns for i in range(tasks)
+    ], batch_size=BATCH_SIZE)
+
+    task_ids = Task.objects.filter(column__board__team=team) \
+        .order_by('id').values_list('id', flat=True)
+    Subtask.objects.bulk_create([
+        Subtask(title=_title(rng, 50), order=i, task_id=task_id,
+                done=rng.random() < 0.5)
+        for task_id in task_ids for i in range(subtasks)
+    ], batch_size=BATCH_SIZE)
+
+    refresh_boards(Board.objects.filter(team=team))
+    refresh_columns(Column.objects.filter(board__team=team))
+    refresh_tasks(Task.objects.filter(column__board__team=team))
+    refresh_users(User.objects.filter(team=team))
+
+    return {
+        'team': team,
+        'boards': team_boards,
+        'columns': columns,
+        'admin': {'username': admin.username, 'password': PASSWORD_RAW},
+        'members': [{'username': member.username, 'password': PASSWORD_RAW}
+                    for member in team_members],
+    }
+
+
+def seed(teams, boards, tasks, subtasks, members=1, seed=0, prefix='seed'):
+    rng = random.Random(seed)
+    return [seed_team(f'{prefix}{i}', boards, tasks, subtasks, members, rng)
+            for i in range(teams)]
@@ -6,3 +6,7 @@ class ColumnSerializer(ModelSerializer):
     class Meta:
         model = Column
         fields = '__all__'
+
+
+def columns_data(queryset):
+    return list(queryset.values('id', 'order', 'task_count'))
@@ -16,3 +16,7 @@ class SubtaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Subtask
         fields = '__all__'
+
+
+def subtasks_data(queryset):
+    return list(queryset.values('id', 'order', 'title', 'done'))
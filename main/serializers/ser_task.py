@@ -6,6 +6,8 @@ class TaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = Task
         fields = '__all__'
+        # DELETE /tasks/ tombstones, see main.ordering
+        read_only_fields = ('deleted_at',)
         extra_kwargs = {
             'user': {
                 'error_messages': {
@@ -19,3 +21,27 @@ class TaskSerializer(serializers.ModelSerializer):
                 }
             }
         }
+
+
+def tasks_data(queryset):
+    return list(queryset.values('id', 'order', 'title', 'description',
+                                 'subtask_count', 'done_subtask_count'))
+
+
+# tasks across boards with the column and board they are on
+def assigned_tasks_data(queryset):
+    return [{'id': task['id'],
+             'title': task['title'],
+             'description': task['description'],
+             'order': task['order'],
+             'subtask_count': task['subtask_count'],
+             'done_subtask_count': task['done_subtask_count'],
+             'column': {'id': task['column_id'],
+                        'order': task['column__order']},
+             'board': {'id': task['column__board_id'],
+                       'name': task['column__board__name']}}
+            for task in queryset.values(
+                'id', 'title', 'description', 'order', 'subtask_count',
+                'done_subtask_count', 'column_id', 'column__order',
+                'column__board_id', 'column__board__name'
+            )]
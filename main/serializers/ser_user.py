@@ -1,10 +1,10 @@
 from rest_framework import serializers
 from main.models import Team, User
-import bcrypt
+from ..hashing import hash_password
 
 
-class UserSerializer(serializers.ModelSerializer):
-    username = serializers.CharField(
+def username_field():
+    return serializers.CharField(
         min_length=5,
         max_length=35,
         error_messages={
@@ -12,7 +12,10 @@ class UserSerializer(serializers.ModelSerializer):
             'max_length': 'Username cannot be longer than 35 characters.'
         }
     )
-    password = serializers.CharField(
+
+
+def password_field():
+    return serializers.CharField(
         min_length=8,
         max_length=255,
         error_messages={
@@ -20,6 +23,11 @@ class UserSerializer(serializers.ModelSerializer):
             'max_length': 'Password cannot be longer than 255 characters.'
         }
     )
+
+
+class UserSerializer(serializers.ModelSerializer):
+    username = username_field()
+    password = password_field()
     # Doesn't need min/max-length since we only care whether it matches the
     # password or not. If it does, min/max-length is validated since the
     # password will already be validated.
@@ -66,10 +74,15 @@ class UserSerializer(serializers.ModelSerializer):
         if validated_data.get('is_admin') and not validated_data.get('team'):
             validated_data['team'] = Team.objects.create()
 
-        validated_data['password'] = bcrypt.hashpw(
-            bytes(validated_data['password'], 'utf-8'),
-            bcrypt.gensalt()
-        )
+        validated_data['password'] = hash_password(validated_data['password'])
 
         validated_data.pop('password_confirmation')
         return User.objects.create(**validated_data)
+
+
+# Validates login requests with the same rules and messages as UserSerializer
+# but without building model fields or touching the database, so a login
+# costs one user lookup plus one bcrypt check.
+class LoginSerializer(serializers.Serializer):
+    username = username_field()
+    password = password_field()
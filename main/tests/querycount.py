@@ -0,0 +1,29 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryCountMixin:
+    """
+    Asserts an upper bound on the SQL queries an endpoint issues while the
+    data behind it grows. `bound` is either a number, meaning the endpoint
+    must stay O(1) in queries, or a callable taking the data size.
+    """
+    data_sizes = (1, 5, 25)
+
+    def assertQueryBound(self, bound, populate, request, sizes=None):
+        for size in sizes or self.data_sizes:
+            # populate builds `size` worth of data and returns the arguments
+            # for request
+            args = populate(size)
+            with CaptureQueriesContext(connection) as captured:
+                response = request(*args)
+            self.assertLess(response.status_code, 400, response.data)
+
+            limit = bound(size) if callable(bound) else bound
+            self.assertLessEqual(
+                len(captured), limit,
+                f'{len(captured)} queries at data size {size}, expected at '
+                f'most {limit}:\n' + '\n'.join(
+                    query['sql'] for query in captured.captured_queries
+                )
+            )
@@ -0,0 +1,195 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework.exceptions import ErrorDetail
+from ..models import Team, Board, Column, Task, Subtask
+from ..transfer import export_board, import_board
+from ..util import make_admin, make_member
+from ..validation.val_auth import \
+    not_authenticated_response, not_authorized_response
+
+
+class BoardTransferTests(APITestCase):
+    def setUp(self):
+        self.team = Team.objects.create()
+        self.admin = make_admin(self.team)
+        self.member = make_member(self.team)
+        self.wrong_admin = make_admin()
+        self.board = Board.objects.create(name='Board', team=self.team)
+        self.board.user.add(self.member['username'])
+        columns = [Column.objects.create(order=i, board=self.board)
+                   for i in range(0, 4)]
+        for i in range(0, 7):
+            task = Task.objects.create(title=f'Task #{i}',
+                                       description='Description',
+                                       order=i,
+                                       column=columns[i % 4],
+                                       user_id=self.member['username'])
+            for j in range(0, i % 3):
+                Subtask.objects.create(title=f'Subtask #{j}', order=j,
+                                       done=j == 0, task=task)
+        Task.objects.create(title='Deleted', order=7, column=columns[0],
+                            deleted_at=timezone.now())
+
+    def export_lines(self, board):
+        return [json.loads(line) for line in export_board(board,
+                                                          chunk_size=2)]
+
+    def test_export(self):
+        lines = self.export_lines(self.board)
+        self.assertEqual(lines[0], {'type': 'board', 'version': 1,
+                                    'name': 'Board'})
+        self.assertEqual(lines[1:5], [{'type': 'column', 'order': i}
+                                      for i in range(0, 4)])
+        self.assertEqual(len(lines), 12)
+        self.assertEqual(lines[-1], {
+            'type': 'task', 'column': 2, 'title': 'Task #6',
+            'description': 'Description', 'order': 6,
+            'user': self.member['username'],
+            'subtasks': []
+        })
+        self.assertEqual(lines[-2]['subtasks'], [
+            {'title': 'Subtask #0', 'order': 0, 'done': True},
+            {'title': 'Subtask #1', 'order': 1, 'done': False}
+        ])
+        self.assertEqual(
+            sum(len(line['subtasks']) for line in lines[5:]),
+            Subtask.objects.count()
+        )
+
+    def test_round_trip(self):
+        team = Team.objects.create()
+        board, task_count = import_board(export_board(self.board), team,
+                                         batch_size=3)
+        self.assertEqual(task_count, 7)
+        self.assertEqual(board.team, team)
+        exported = self.export_lines(self.board)
+        imported = self.export_lines(board)
+        # users outside the new team are dropped
+        for line in exported[5:]:
+            line['user'] = None
+        self.assertEqual(imported, exported)
+
+    def test_import_invalid(self):
+        for lines in ([],
+                      [b'{"type": "column", "order": 0}'],
+                      [b'{"type": "board", "version": 2, "name": "B"}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "task", "column": 0, "title": "T"}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "column", "order": 0}',
+                       b'{"type": "task", "column": 0, "title": "T",'
+                       b' "subtasks": [1]}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "column", "order": 0}',
+                       b'{"type": "task", "column": 0, "title": "T"}',
+                       b'{"type": "task", "column": 0, "title": "U"}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "column", "order": 0}',
+                       b'{"type": "task", "column": 0, "title": "T",'
+                       b' "subtasks": [{"title": "S"}, {"title": "S"}]}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "column", "order": 99999999999999}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "column", "order": 0}',
+                       b'{"type": "task", "column": 0, "title": "T",'
+                       b' "order": 99999999999999}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'{"type": "column", "order": 0}',
+                       b'{"type": "task", "column": 0, "title": "T",'
+                       b' "subtasks": [{"title": "S", "order": -1}]}'],
+                      [b'{"type": "board", "version": 1, "name": "B"}',
+                       b'not json']):
+            with self.assertRaises(ValueError):
+                import_board(lines, self.team)
+        self.assertEqual(Board.objects.filter(team=self.team).count(), 1)
+
+    def test_export_endpoint(self):
+        response = self.client.get(f'/boards/export/?id={self.board.id}',
+                                   HTTP_AUTH_USER=self.member['username'],
+                                   HTTP_AUTH_TOKEN=self.member['token'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(b''.join(response.streaming_content),
+                         b''.join(export_board(self.board)))
+
+    def test_export_endpoint_wrong_team(self):
+        response = self.client.get(f'/boards/export/?id={self.board.id}',
+                                   HTTP_AUTH_USER=self.wrong_admin['username'],
+                                   HTTP_AUTH_TOKEN=self.wrong_admin['token'])
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authenticated_response.data)
+
+    def test_import_endpoint(self):
+        response = self.client.generic(
+            'POST', '/boards/import/?name=Imported',
+            b''.join(export_board(self.board)),
+            content_type='application/x-ndjson',
+            HTTP_AUTH_USER=self.admin['username'],
+            HTTP_AUTH_TOKEN=self.admin['token']
+        )
+        self.assertEqual(response.status_code, 201)
+        board = Board.objects.get(id=response.data['id'])
+        self.assertEqual(response.data, {'msg': 'Board import successful.',
+                                         'id': board.id,
+                                         'tasks': 7})
+        self.assertEqual(board.name, 'Imported')
+        self.assertTrue(board.user.filter(username=self.admin['username']))
+        self.assertEqual(Task.objects.filter(column__board=board).count(), 7)
+
+    def test_import_endpoint_invalid(self):
+        response = self.client.generic(
+            'POST', '/boards/import/', b'{"type": "task"}\n',
+            content_type='application/x-ndjson',
+            HTTP_AUTH_USER=self.admin['username'],
+            HTTP_AUTH_TOKEN=self.admin['token']
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'import': ErrorDetail(string='Export must start with a board.',
+                                  code='invalid')
+        })
+
+    def test_import_endpoint_order_out_of_range(self):
+        response = self.client.generic(
+            'POST', '/boards/import/',
+            b'{"type": "board", "version": 1, "name": "B"}\n'
+            b'{"type": "column", "order": 0}\n'
+            b'{"type": "task", "column": 0, "title": "T",'
+            b' "order": 99999999999999}\n',
+            content_type='application/x-ndjson',
+            HTTP_AUTH_USER=self.admin['username'],
+            HTTP_AUTH_TOKEN=self.admin['token']
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'import': ErrorDetail(string='Invalid task order.',
+                                  code='invalid')
+        })
+
+    def test_import_endpoint_unauthorized(self):
+        response = self.client.generic(
+            'POST', '/boards/import/', b''.join(export_board(self.board)),
+            content_type='application/x-ndjson',
+            HTTP_AUTH_USER=self.member['username'],
+            HTTP_AUTH_TOKEN=self.member['token']
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authorized_response.data)
+
+    def test_commands(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'board.ndjson')
+            call_command('export_board', self.board.id, output=path)
+            out = StringIO()
+            call_command('import_board', self.team.id, path, name='Copy',
+                         stdout=out)
+        self.assertIn('with 7 tasks.', out.getvalue())
+        board = Board.objects.get(name='Copy')
+        self.assertEqual(Subtask.objects.filter(
+            task__column__board=board
+        ).count(), 6)
@@ -0,0 +1,55 @@
+from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory, override_settings
+from django.urls import path
+from ..api.api_auth import login
+from ..middleware import BrowserMiddleware, is_api_path
+
+
+def form(request):
+    return HttpResponse(str(hasattr(request, 'session')))
+
+
+urlpatterns = [
+    path('login/', login),
+    path('form/', form),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class BrowserMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.middleware = BrowserMiddleware(form)
+
+    def get(self, path, method='get'):
+        request = getattr(RequestFactory(), method)(path)
+        response = self.middleware.process_view(request, form, (), {})
+        return response or self.middleware(request)
+
+    def test_is_api_path(self):
+        self.assertTrue(is_api_path('/login/'))
+        self.assertFalse(is_api_path('/form/'))
+        self.assertFalse(is_api_path('/missing/'))
+
+    def test_api_route_skips_middleware(self):
+        response = self.get('/login/')
+        self.assertEqual(response.content, b'False')
+        self.assertFalse(response.has_header('X-Frame-Options'))
+        self.assertFalse(response.has_header('Vary'))
+
+    def test_other_routes_run_middleware(self):
+        response = self.get('/form/')
+        self.assertEqual(response.content, b'True')
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
+
+    def test_csrf_checked_outside_api(self):
+        self.assertEqual(self.get('/form/', 'post').status_code, 403)
+        self.assertEqual(self.get('/login/', 'post').status_code, 200)
+
+    def test_full_stack(self):
+        response = self.client.get('/login/')
+        self.assertEqual(response.status_code, 405)
+        self.assertFalse(response.has_header('X-Frame-Options'))
+        self.assertNotIn('sessionid', response.cookies)
+        response = self.client.get('/form/')
+        self.assertEqual(response.content, b'True')
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
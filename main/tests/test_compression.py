@@ -0,0 +1,93 @@
+import gzip
+from unittest import mock
+import brotli
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import SimpleTestCase, RequestFactory, override_settings
+from .. import metrics
+from ..middleware import CompressionMiddleware
+
+content = b'{"id": 1, "title": "Task", "description": "Lorem ipsum"}' * 100
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024,
+                   COMPRESSION_GZIP_LEVEL=6,
+                   COMPRESSION_BROTLI_QUALITY=5)
+class CompressionTests(SimpleTestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def get(self, accept_encoding, response):
+        middleware = CompressionMiddleware(lambda request: response)
+        return middleware(RequestFactory().get(
+            '/boards/', HTTP_ACCEPT_ENCODING=accept_encoding
+        ))
+
+    def test_gzip(self):
+        response = self.get('gzip, deflate', HttpResponse(content))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(gzip.decompress(response.content), content)
+        self.assertEqual(response['Content-Length'],
+                         str(len(response.content)))
+
+    def test_brotli_preferred(self):
+        response = self.get('gzip, deflate, br', HttpResponse(content))
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), content)
+
+    def test_q_values(self):
+        response = self.get('br;q=0.5, gzip', HttpResponse(content))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        response = self.get('br;q=0, gzip;q=0', HttpResponse(content))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_not_accepted(self):
+        response = self.get('identity', HttpResponse(content))
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, content)
+
+    def test_below_min_size(self):
+        response = self.get('gzip', HttpResponse(content[:1000]))
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_weakens_strong_etag(self):
+        uncompressed = HttpResponse(content)
+        uncompressed['ETag'] = '"abc"'
+        response = self.get('gzip', uncompressed)
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_streaming(self):
+        chunks = [content[i:i + 500] for i in range(0, len(content), 500)]
+        response = self.get('gzip', StreamingHttpResponse(chunks))
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)),
+                         content)
+
+        response = self.get('br', StreamingHttpResponse(chunks))
+        self.assertEqual(
+            brotli.decompress(b''.join(response.streaming_content)), content
+        )
+
+    def test_metrics(self):
+        response = self.get('gzip', HttpResponse(content))
+        self.assertEqual(metrics.snapshot(), {
+            'compression.gzip.responses': 1,
+            'compression.gzip.bytes_in': len(content),
+            'compression.gzip.bytes_out': len(response.content),
+        })
+
+    @override_settings(METRICS_LOG_INTERVAL=60)
+    def test_metrics_log(self):
+        with self.assertRaises(AssertionError), \
+                self.assertLogs('main.metrics', 'INFO'):
+            response = self.get('gzip', HttpResponse(content))
+        with mock.patch('main.metrics.monotonic',
+                        return_value=metrics.monotonic() + 60), \
+                self.assertLogs('main.metrics', 'INFO') as logs:
+            self.get('gzip', HttpResponse(content))
+        # logged on the second response's first incr(), so its bytes are
+        # not in yet
+        self.assertIn(f'compression.gzip.bytes_in={len(content)} '
+                      f'compression.gzip.bytes_out='
+                      f'{len(response.content)} '
+                      f'compression.gzip.responses=2', logs.output[0])
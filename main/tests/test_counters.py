@@ -0,0 +1,180 @@
+from io import StringIO
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+from ..models import Team, User, Board, Column, Task, Subtask
+from ..counters import reconcile
+from ..seed import seed
+from ..transfer import export_board, import_board
+from ..util import make_admin, make_member
+
+
+class CounterTests(APITestCase):
+    def setUp(self):
+        self.team = Team.objects.create()
+        self.admin = make_admin(self.team)
+        self.member = make_member(self.team)
+        self.board = Board.objects.create(name='Board', team=self.team)
+        self.columns = [Column.objects.create(order=i, board=self.board)
+                        for i in range(0, 2)]
+        self.headers = {'HTTP_AUTH_USER': self.admin['username'],
+                        'HTTP_AUTH_TOKEN': self.admin['token']}
+
+    def post_task(self, subtasks=()):
+        response = self.client.post('/tasks/', {
+            'column': self.columns[0].id,
+            'title': 'Task',
+            'subtasks': list(subtasks),
+        }, format='json', **self.headers)
+        self.assertEqual(response.status_code, 201)
+        return Task.objects.get(id=response.data['task_id'])
+
+    def assertCounts(self, columns=None, board=None, user=None):
+        if columns is not None:
+            self.assertEqual([Column.objects.get(id=column.id).task_count
+                              for column in self.columns], columns)
+        if board is not None:
+            self.assertEqual(Board.objects.get(id=self.board.id).task_count,
+                             board)
+        if user is not None:
+            self.assertEqual(User.objects.get(
+                username=self.member['username']
+            ).assigned_task_count, user)
+        # whatever the handlers maintained matches a full recount
+        self.assertFalse(any(reconcile().values()))
+
+    def test_post_task(self):
+        task = self.post_task(['One', 'Two'])
+        self.assertEqual((task.subtask_count, task.done_subtask_count),
+                         (2, 0))
+        self.assertCounts(columns=[1, 0], board=1)
+
+    def test_post_task_rolled_back(self):
+        task = self.post_task()
+        response = self.client.post('/tasks/', {
+            'column': self.columns[0].id,
+            'title': 'Task',
+            'subtasks': ['x' * 51],
+        }, format='json', **self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.get(id=task.id).order, 0)
+        self.assertCounts(columns=[1, 0], board=1)
+
+    def test_patch_task(self):
+        task = self.post_task(['One'])
+        response = self.client.patch(f'/tasks/?id={task.id}', {
+            'column': self.columns[1].id,
+            'user': self.member['username'],
+            'subtasks': [{'title': 'One', 'order': 0, 'done': True},
+                         {'title': 'Two', 'order': 1, 'done': False}],
+        }, format='json', **self.headers)
+        self.assertEqual(response.status_code, 200)
+        task.refresh_from_db()
+        self.assertEqual((task.subtask_count, task.done_subtask_count),
+                         (2, 1))
+        self.assertCounts(columns=[0, 1], board=1, user=1)
+
+        response = self.client.patch(f'/tasks/?id={task.id}', {
+            'user': None,
+        }, format='json', **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertCounts(user=0)
+
+    def test_counters_read_only(self):
+        task = self.post_task()
+        self.client.patch(f'/tasks/?id={task.id}', {'subtask_count': 5},
+                          format='json', **self.headers)
+        self.assertEqual(Task.objects.get(id=task.id).subtask_count, 0)
+
+    def test_patch_subtask(self):
+        task = self.post_task(['One', 'Two'])
+        subtask = Subtask.objects.filter(task=task).first()
+        for done, count in ((True, 1), (True, 1), (False, 0)):
+            response = self.client.patch(f'/subtasks/?id={subtask.id}',
+                                         {'done': done}, format='json',
+                                         **self.headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                Task.objects.get(id=task.id).done_subtask_count, count
+            )
+        self.assertCounts()
+
+    def test_delete_task(self):
+        task = self.post_task()
+        Task.objects.filter(id=task.id).update(user=self.member['username'])
+        User.objects.filter(username=self.member['username']) \
+            .update(assigned_task_count=1)
+        for _ in range(0, 2):
+            self.client.delete(f'/tasks/?id={task.id}', **self.headers)
+        self.assertCounts(columns=[0, 0], board=0, user=0)
+
+    def test_patch_column(self):
+        first, second = self.post_task(), self.post_task()
+        response = self.client.patch(f'/columns/?id={self.columns[1].id}', [
+            {'id': first.id, 'order': 0, 'user': self.member['username']},
+            {'id': second.id, 'order': 1, 'user': None},
+        ], format='json', **self.headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertCounts(columns=[0, 2], board=2, user=1)
+
+    def test_patch_column_rolled_back(self):
+        task = self.post_task()
+        response = self.client.patch(f'/columns/?id={self.columns[1].id}', [
+            {'id': task.id, 'order': 0, 'user': None},
+            {'order': 1, 'user': None},
+        ], format='json', **self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.get(id=task.id).column_id,
+                         self.columns[0].id)
+        self.assertCounts(columns=[1, 0])
+
+    def test_delete_board(self):
+        task = self.post_task()
+        self.client.patch(f'/tasks/?id={task.id}',
+                          {'user': self.member['username']},
+                          format='json', **self.headers)
+        self.assertCounts(user=1)
+        self.client.delete(f'/boards/?id={self.board.id}', **self.headers)
+        self.assertCounts(user=0)
+
+    def test_list_responses(self):
+        task = self.post_task(['One'])
+        response = self.client.get(f'/columns/?board_id={self.board.id}',
+                                   **self.headers)
+        self.assertEqual([column['task_count']
+                          for column in response.data['columns']], [1, 0])
+        response = self.client.get(f'/tasks/?column_id={self.columns[0].id}',
+                                   **self.headers)
+        self.assertEqual(response.data['tasks'][0]['subtask_count'], 1)
+        response = self.client.get(f'/boards/?team_id={self.team.id}',
+                                   **self.headers)
+        self.assertEqual(response.data[0]['task_count'], 1)
+        Task.objects.filter(id=task.id).update(user=self.member['username'])
+        reconcile()
+        response = self.client.get(f'/users/?team_id={self.team.id}',
+                                   **self.headers)
+        self.assertEqual(
+            {user['username']: user['taskCount'] for user in response.data},
+            {self.admin['username']: 0, self.member['username']: 1}
+        )
+
+    def test_bulk_writers(self):
+        [fixture] = seed(1, boards=2, tasks=3, subtasks=2, members=2)
+        self.assertEqual(fixture['boards'][0].task_count, 0)
+        self.assertEqual(Board.objects.get(
+            id=fixture['boards'][0].id
+        ).task_count, 12)
+        self.post_task(['One'])
+        board, _ = import_board(export_board(self.board), self.team)
+        self.assertEqual(Board.objects.get(id=board.id).task_count, 1)
+        self.assertFalse(any(reconcile().values()))
+
+    def test_reconcile_command(self):
+        self.post_task(['One', 'Two'])
+        Column.objects.update(task_count=7)
+        Task.objects.update(subtask_count=0, done_subtask_count=3)
+        out = StringIO()
+        call_command('reconcile_counters', chunk_size=1, stdout=out)
+        self.assertIn('Fixed 2 column.task_count counters.', out.getvalue())
+        self.assertIn('Fixed 1 task.subtask_count counters.', out.getvalue())
+        self.assertIn('Fixed 0 board.task_count counters.', out.getvalue())
+        self.assertCounts(columns=[1, 0], board=1)
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
-from ..models import Team, Board
-from ..util import create_admin, create_member
+from ..models import Team, Board, Job
+from ..util import make_admin, make_member
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -12,12 +12,13 @@ class DeleteBoardTests(APITestCase):
     def setUp(self):
         team = Team.objects.create()
         self.board = Board.objects.create(team=team)
-        self.admin = create_admin(team)
-        self.member = create_member(team)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.admin = make_admin(team)
+        self.member = make_member(team)
+        self.wrong_admin = make_admin()
 
     def test_success(self):
-        initial_count = Board.objects.count()
+        Board.objects.create(team=self.board.team)
+        initial_count = Board.objects.alive().count()
         response = self.client.delete(f'{self.endpoint}{self.board.id}',
                                       HTTP_AUTH_USER=self.admin['username'],
                                       HTTP_AUTH_TOKEN=self.admin['token'])
@@ -26,7 +27,24 @@ class DeleteBoardTests(APITestCase):
             'msg': 'Board deleted successfully.',
             'id': str(self.board.id),
         })
-        self.assertEqual(Board.objects.count(), initial_count - 1)
+        self.assertEqual(Board.objects.alive().count(), initial_count - 1)
+        self.assertTrue(Board.objects.get(id=self.board.id).deleted_at)
+        self.assertEqual(Job.objects.get().kwargs, {'board_id': self.board.id})
+
+    def test_last_board(self):
+        response = self.client.delete(f'{self.endpoint}{self.board.id}',
+                                      HTTP_AUTH_USER=self.admin['username'],
+                                      HTTP_AUTH_TOKEN=self.admin['token'])
+        self.assertEqual(response.status_code, 200)
+        board = Board.objects.alive().get(team=self.board.team)
+        self.assertEqual(board.name, 'New Board')
+        self.assertEqual(board.column_set.count(), 4)
+
+        response = self.client.get(f'/boards/?team_id={board.team_id}',
+                                   HTTP_AUTH_USER=self.admin['username'],
+                                   HTTP_AUTH_TOKEN=self.admin['token'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([b['id'] for b in response.data], [board.id])
 
     def test_board_id_blank(self):
         initial_count = Board.objects.count()
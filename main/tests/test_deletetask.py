@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Team, Board, Column, Task
-from ..util import create_admin, create_member
+from ..util import make_admin, make_member
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -16,12 +16,12 @@ class DeleteTaskTests(APITestCase):
         self.task = Task.objects.create(title='Do Something!',
                                         order=0,
                                         column=column)
-        self.admin = create_admin(team)
-        self.member = create_member(team)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.admin = make_admin(team)
+        self.member = make_member(team)
+        self.wrong_admin = make_admin()
 
     def test_success(self):
-        initial_count = Task.objects.count()
+        initial_count = Task.objects.alive().count()
         response = self.client.delete(f'{self.endpoint}{self.task.id}',
                                       HTTP_AUTH_USER=self.admin['username'],
                                       HTTP_AUTH_TOKEN=self.admin['token'])
@@ -30,7 +30,8 @@ class DeleteTaskTests(APITestCase):
             'msg': 'Task deleted successfully.',
             'id': str(self.task.id),
         })
-        self.assertEqual(Task.objects.count(), initial_count - 1)
+        self.assertEqual(Task.objects.alive().count(), initial_count - 1)
+        self.assertTrue(Task.objects.get(id=self.task.id).deleted_at)
 
     def test_task_id_blank(self):
         initial_count = Task.objects.count()
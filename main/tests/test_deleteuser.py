@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Team, User
-from ..util import create_admin, create_member
+from ..util import make_admin, make_member
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -9,9 +9,9 @@ from ..validation.val_auth import \
 class DeleteUserTests(APITestCase):
     def setUp(self):
         self.team = Team.objects.create()
-        self.admin = create_admin(self.team)
-        self.member = create_member(self.team)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.admin = make_admin(self.team)
+        self.member = make_member(self.team)
+        self.wrong_admin = make_admin()
 
     def delete_user(self, username, auth_user, auth_token):
         return self.client.delete(f'/users/?username={username}',
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from ..deletion import delete_board, delete_user, purge_tombstones
+from ..models import Team, User, Board, Column, Task, Subtask
+
+
+class DeletionTests(TestCase):
+    def setUp(self):
+        self.team = Team.objects.create()
+        self.user = User.objects.create(username='someuser',
+                                        password=b'password',
+                                        team=self.team)
+        self.board = Board.objects.create(name='Board', team=self.team)
+        self.board.user.add(self.user)
+        self.other_board = Board.objects.create(name='Other', team=self.team)
+        for board in (self.board, self.other_board):
+            for i in range(0, 2):
+                column = Column.objects.create(order=i, board=board)
+                for j in range(0, 5):
+                    task = Task.objects.create(title='Task', order=j,
+                                               column=column, user=self.user)
+                    Subtask.objects.create(title='Subtask', order=0,
+                                           task=task)
+
+    def test_delete_board(self):
+        progress = []
+        delete_board(self.board.id, chunk_size=3,
+                     progress=lambda *args: progress.append(args))
+        self.assertEqual(progress, [(3, 10), (6, 10), (9, 10), (10, 10)])
+        self.assertFalse(Board.objects.filter(id=self.board.id))
+        self.assertFalse(Column.objects.filter(board_id=self.board.id))
+        self.assertEqual(Task.objects.count(), 10)
+        self.assertEqual(Subtask.objects.count(), 10)
+        self.assertFalse(self.user.board_set.all())
+
+    def test_delete_board_command(self):
+        out = StringIO()
+        call_command('delete_board', self.board.id, chunk_size=5, stdout=out)
+        self.assertIn('Deleted 10/10 tasks.', out.getvalue())
+        self.assertFalse(Board.objects.filter(id=self.board.id))
+
+    def test_delete_user(self):
+        delete_user(self.user)
+        self.assertFalse(User.objects.filter(username='someuser'))
+        self.assertEqual(Task.objects.count(), 20)
+        self.assertFalse(Task.objects.filter(user__isnull=False))
+
+    def test_purge_tombstones(self):
+        Board.objects.filter(id=self.board.id) \
+            .update(deleted_at=timezone.now())
+        tombstoned_task = Task.objects.filter(column__board=self.other_board) \
+            .first()
+        Task.objects.filter(id=tombstoned_task.id) \
+            .update(deleted_at=timezone.now())
+
+        self.assertEqual(purge_tombstones(timedelta(hours=1)), (0, 0))
+        self.assertEqual(Task.objects.count(), 20)
+
+        self.assertEqual(purge_tombstones(chunk_size=3), (1, 1))
+        self.assertFalse(Board.objects.filter(id=self.board.id))
+        self.assertFalse(Task.objects.filter(id=tombstoned_task.id))
+        self.assertEqual(Task.objects.count(), 9)
+        self.assertEqual(Subtask.objects.count(), 9)
+
+    def test_purge_deleted_command(self):
+        Board.objects.filter(id=self.board.id) \
+            .update(deleted_at=timezone.now())
+        out = StringIO()
+        call_command('purge_deleted', stdout=out)
+        self.assertIn('Purged 1 boards and 0 tasks.', out.getvalue())
+        self.assertFalse(Board.objects.filter(id=self.board.id))
@@ -0,0 +1,118 @@
+from unittest import mock
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework.exceptions import ErrorDetail
+from ..models import Team, Board, Column, Task
+from ..util import make_admin, make_member
+from ..validation.val_auth import not_authenticated_response
+
+
+class GetAssignedTasksTests(APITestCase):
+    endpoint = '/tasks/?assignee='
+
+    def setUp(self):
+        team = Team.objects.create()
+        self.admin = make_admin(team)
+        self.member = make_member(team)
+        self.boards = [Board.objects.create(name=f'Board #{i}', team=team)
+                       for i in range(0, 2)]
+        self.boards[0].user.add(self.member['username'])
+        self.columns = [Column.objects.create(order=i, board=board)
+                        for board in self.boards for i in range(0, 2)]
+        self.tasks = [Task.objects.create(title=f'Task #{i}', order=i,
+                                          column=self.columns[i % 4],
+                                          user_id=self.member['username'])
+                      for i in range(0, 6)]
+        Task.objects.create(title='Unassigned', order=9,
+                            column=self.columns[0])
+        Task.objects.create(title='Deleted', order=9, column=self.columns[0],
+                            user_id=self.member['username'],
+                            deleted_at=timezone.now())
+        other_team = Team.objects.create()
+        other_column = Column.objects.create(order=0, board=Board.objects
+                                             .create(team=other_team))
+        Task.objects.create(title='Other team', order=0, column=other_column,
+                            user_id=self.member['username'])
+        self.wrong_admin = make_admin(other_team)
+
+    def get(self, user, assignee, cursor=None):
+        return self.client.get(
+            f'{self.endpoint}{assignee}' + (f'&cursor={cursor}'
+                                            if cursor is not None else ''),
+            HTTP_AUTH_USER=user['username'],
+            HTTP_AUTH_TOKEN=user['token']
+        )
+
+    def test_success(self):
+        response = self.get(self.admin, self.member['username'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task['id'] for task in response.data['tasks']],
+                         [task.id for task in self.tasks])
+        self.assertEqual(response.data['tasks'][3], {
+            'id': self.tasks[3].id,
+            'title': 'Task #3',
+            'description': None,
+            'order': 3,
+            'subtask_count': 0,
+            'done_subtask_count': 0,
+            'column': {'id': self.columns[3].id, 'order': 1},
+            'board': {'id': self.boards[1].id, 'name': 'Board #1'},
+        })
+        self.assertIsNone(response.data['next'])
+
+    def test_member_sees_own_boards(self):
+        response = self.get(self.member, self.member['username'])
+        self.assertEqual([task['id'] for task in response.data['tasks']],
+                         [task.id for task in self.tasks
+                          if task.column.board_id == self.boards[0].id])
+
+    def test_deleted_board(self):
+        Board.objects.filter(id=self.boards[1].id) \
+            .update(deleted_at=timezone.now())
+        response = self.get(self.admin, self.member['username'])
+        self.assertEqual(len(response.data['tasks']), 4)
+
+    def test_cursor(self):
+        with mock.patch('main.api.api_tasks.ASSIGNED_PAGE_SIZE', 4):
+            response = self.get(self.admin, self.member['username'])
+            self.assertEqual(response.data['next'], self.tasks[3].id)
+            response = self.get(self.admin, self.member['username'],
+                                response.data['next'])
+        self.assertEqual([task['id'] for task in response.data['tasks']],
+                         [task.id for task in self.tasks[4:]])
+        self.assertIsNone(response.data['next'])
+
+    def test_other_team(self):
+        response = self.get(self.wrong_admin, self.member['username'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([task['title'] for task in response.data['tasks']],
+                         ['Other team'])
+
+    def test_unknown_assignee(self):
+        response = self.get(self.admin, 'nobody')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'tasks': [], 'next': None})
+
+    def test_assignee_empty(self):
+        response = self.get(self.admin, '')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'assignee': ErrorDetail(string='Assignee cannot be empty.',
+                                    code='blank')
+        })
+
+    def test_cursor_invalid(self):
+        response = self.get(self.admin, self.member['username'], 'abc')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'cursor': ErrorDetail(string='Invalid cursor.', code='invalid')
+        })
+
+    def test_auth_token_invalid(self):
+        response = self.client.get(
+            f'{self.endpoint}{self.member["username"]}',
+            HTTP_AUTH_USER=self.admin['username'],
+            HTTP_AUTH_TOKEN='ASDKFJ!FJ_012rjpiwajfosia'
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authenticated_response.data)
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Board, Team, Column, User
-from ..util import create_member, create_admin
+from ..util import make_member, make_admin
 from ..validation.val_auth import not_authenticated_response
 
 
@@ -10,9 +10,9 @@ class GetBoardsTests(APITestCase):
 
     def setUp(self):
         self.team = Team.objects.create()
-        self.member = create_member(self.team)
-        self.wrong_team_member = create_member(Team.objects.create(), '1')
-        self.wrong_board_member = create_member(self.team, '2')
+        self.member = make_member(self.team)
+        self.wrong_team_member = make_member()
+        self.wrong_board_member = make_member(self.team)
         self.boards = []
         member = User.objects.get(username=self.member['username'])
         wrong_team_member = User.objects.get(
@@ -36,7 +36,7 @@ class GetBoardsTests(APITestCase):
     def test_boards_not_found_member(self):
         initial_count = Board.objects.count()
         team = Team.objects.create()
-        member = create_member(team, '3')
+        member = make_member(team)
         response = self.client.get(f'{self.endpoint}{team.id}',
                                    HTTP_AUTH_USER=member['username'],
                                    HTTP_AUTH_TOKEN=member['token'])
@@ -51,16 +51,17 @@ class GetBoardsTests(APITestCase):
         initial_board_count = Board.objects.count()
         initial_columns_count = Column.objects.count()
         team = Team.objects.create()
-        admin = create_admin(team)
+        admin = make_admin(team)
         response = self.client.get(self.endpoint + str(team.id),
                                    HTTP_AUTH_USER=admin['username'],
                                    HTTP_AUTH_TOKEN=admin['token'])
-        print(response.data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0].get('name'), 'New Board')
-        self.assertEqual(Board.objects.count(), initial_board_count + 1)
-        self.assertEqual(Column.objects.count(), initial_columns_count + 4)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data, {
+            'team_id': ErrorDetail(string='Boards not found.',
+                                   code='not_found')
+        })
+        self.assertEqual(Board.objects.count(), initial_board_count)
+        self.assertEqual(Column.objects.count(), initial_columns_count)
 
     def test_team_id_empty(self):
         initial_count = Board.objects.count()
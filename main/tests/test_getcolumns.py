@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Board, Team, Column
-from ..util import create_member
+from ..util import make_member
 from ..validation.val_auth import not_authenticated_response
 
 
@@ -10,7 +10,7 @@ class GetColumnsTests(APITestCase):
 
     def setUp(self):
         self.team = Team.objects.create()
-        self.member = create_member(self.team)
+        self.member = make_member(self.team)
         self.board = Board.objects.create(team_id=self.team.id)
         self.columns = [
             Column.objects.create(
@@ -18,7 +18,7 @@ class GetColumnsTests(APITestCase):
             ) for i in range(0, 4)
         ]
         self.empty_board = Board.objects.create(team_id=self.team.id)
-        self.wrong_member = create_member(Team.objects.create(), '1')
+        self.wrong_member = make_member()
 
     def test_success(self):
         response = self.client.get(f'{self.endpoint}{self.board.id}',
@@ -36,11 +36,9 @@ class GetColumnsTests(APITestCase):
         response = self.client.get(f'{self.endpoint}{self.empty_board.id}',
                                    HTTP_AUTH_USER=self.member['username'],
                                    HTTP_AUTH_TOKEN=self.member['token'])
-        self.assertEqual(Column.objects.count(), initial_count + 4)
         self.assertEqual(response.status_code, 200)
-        columns = response.data.get('columns')
-        self.assertTrue(columns)
-        self.assertTrue(columns.count, 4)
+        self.assertEqual(response.data, {'columns': []})
+        self.assertEqual(Column.objects.count(), initial_count)
 
     def test_board_id_empty(self):
         response = self.client.get(self.endpoint,
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Board, Team, Column, Task, Subtask, User
-from ..util import create_member
+from ..util import make_member
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -11,9 +11,9 @@ class GetNestedBoardTests(APITestCase):
 
     def setUp(self):
         self.team = Team.objects.create()
-        self.member = create_member(self.team)
-        self.wrong_team_member = create_member(Team.objects.create(), '1')
-        self.wrong_board_member = create_member(self.team, '2')
+        self.member = make_member(self.team)
+        self.wrong_team_member = make_member()
+        self.wrong_board_member = make_member(self.team)
         self.boards = []
         member = User.objects.get(username=self.member['username'])
         wrong_team_member = User.objects.get(
@@ -0,0 +1,121 @@
+from django.utils import timezone
+from unittest import mock
+from rest_framework.test import APITestCase
+from rest_framework.exceptions import ErrorDetail
+from ..models import Subtask, Task, Column, Board, Team
+from ..util import make_admin, make_member
+from ..validation.val_auth import not_authenticated_response
+
+
+class GetSearchTests(APITestCase):
+    endpoint = '/search/'
+
+    def setUp(self):
+        team = Team.objects.create()
+        self.board = Board.objects.create(name='Board', team=team)
+        self.column = Column.objects.create(order=0, board=self.board)
+        self.title_hit = Task.objects.create(title='Fix login page', order=0,
+                                             column=self.column)
+        self.description_hit = Task.objects.create(
+            title='Polish', description='The login form looks off.',
+            order=1, column=self.column
+        )
+        self.subtask_hit = Task.objects.create(title='Release', order=2,
+                                               column=self.column)
+        Subtask.objects.create(title='Check login', order=0,
+                               task=self.subtask_hit)
+        Subtask.objects.create(title='Check signup', order=1,
+                               task=self.subtask_hit)
+        Task.objects.create(title='Unrelated', order=3, column=self.column)
+        Task.objects.create(title='Deleted login', order=4,
+                            column=self.column, deleted_at=timezone.now())
+
+        other_board = Board.objects.create(name='Other Board', team=team)
+        self.other_column = Column.objects.create(order=0, board=other_board)
+        self.other_hit = Task.objects.create(title='Login on other board',
+                                             order=0,
+                                             column=self.other_column)
+
+        self.admin = make_admin(team)
+        self.member = make_member(team)
+        self.board.user.add(self.member['username'])
+        self.wrong_admin = make_admin()
+
+    def search(self, query, user, page=None):
+        return self.client.get(self.endpoint,
+                               {'q': query, 'page': page} if page else
+                               {'q': query},
+                               HTTP_AUTH_USER=user['username'],
+                               HTTP_AUTH_TOKEN=user['token'])
+
+    def test_ranked(self):
+        response = self.search('LOGIN', self.admin)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [hit['id'] for hit in response.data['tasks']],
+            [self.title_hit.id, self.other_hit.id, self.description_hit.id,
+             self.subtask_hit.id]
+        )
+        self.assertEqual(response.data['tasks'][0], {
+            'id': self.title_hit.id,
+            'title': 'Fix login page',
+            'description': None,
+            'column': self.column.id,
+            'board': self.board.id,
+            'rank': 4,
+        })
+        self.assertIsNone(response.data['next'])
+
+    def test_all_terms(self):
+        response = self.search('check signup', self.admin)
+        self.assertEqual([hit['id'] for hit in response.data['tasks']],
+                         [self.subtask_hit.id])
+        response = self.search('login signup', self.admin)
+        self.assertEqual([hit['id'] for hit in response.data['tasks']],
+                         [self.subtask_hit.id])
+
+    def test_member_boards_only(self):
+        response = self.search('login', self.member)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(self.other_hit.id,
+                         [hit['id'] for hit in response.data['tasks']])
+        self.assertEqual(len(response.data['tasks']), 3)
+
+    def test_other_team(self):
+        response = self.search('login', self.wrong_admin)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['tasks'], [])
+
+    def test_pagination(self):
+        with mock.patch('main.search.PAGE_SIZE', 3):
+            response = self.search('login', self.admin)
+            self.assertEqual(len(response.data['tasks']), 3)
+            self.assertEqual(response.data['next'], 2)
+            response = self.search('login', self.admin, page=2)
+        self.assertEqual([hit['id'] for hit in response.data['tasks']],
+                         [self.subtask_hit.id])
+        self.assertEqual(response.data['page'], 2)
+        self.assertIsNone(response.data['next'])
+
+    def test_query_empty(self):
+        response = self.search('  ', self.admin)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'q': ErrorDetail(string='Search query cannot be empty.',
+                             code='blank')
+        })
+
+    def test_page_invalid(self):
+        for page in ('0', 'two'):
+            response = self.search('login', self.admin, page=page)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data, {
+                'page': ErrorDetail(string='Invalid page.', code='invalid')
+            })
+
+    def test_auth_token_empty(self):
+        response = self.client.get(self.endpoint, {'q': 'login'},
+                                   HTTP_AUTH_USER=self.admin['username'],
+                                   HTTP_AUTH_TOKEN='')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authenticated_response.data)
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Subtask, Task, Column, Board, Team
-from ..util import create_member
+from ..util import make_member
 from ..validation.val_auth import not_authenticated_response
 
 
@@ -32,8 +32,8 @@ class GetSubtasksTests(APITestCase):
                 , subtasks_raw
             )
         )
-        self.member = create_member(team)
-        self.wrong_member = create_member(Team.objects.create(), '4')
+        self.member = make_member(team)
+        self.wrong_member = make_member()
 
     def test_success(self):
         response = self.client.get(f'{self.endpoint}{self.task.id}',
@@ -1,7 +1,8 @@
+from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Task, Column, Board, Team
-from ..util import create_member
+from ..util import make_member
 from ..validation.val_auth import not_authenticated_response
 
 
@@ -25,12 +26,14 @@ class GetTasksTests(APITestCase):
                     'id': task.id,
                     'title': task.title,
                     'description': task.description,
-                    'order': task.order
+                    'order': task.order,
+                    'subtask_count': 0,
+                    'done_subtask_count': 0
                 }, tasks_raw
             )
         )
-        self.member = create_member(team)
-        self.wrong_member = create_member(Team.objects.create(), '1')
+        self.member = make_member(team)
+        self.wrong_member = make_member()
 
     def test_success(self):
         response = self.client.get(f'{self.endpoint}{self.column.id}',
@@ -40,6 +43,23 @@ class GetTasksTests(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data.get('tasks'), self.tasks)
 
+    def test_deleted_tasks_hidden(self):
+        Task.objects.filter(id=self.tasks[0]['id']) \
+            .update(deleted_at=timezone.now())
+        response = self.client.get(f'{self.endpoint}{self.column.id}',
+                                   HTTP_AUTH_USER=self.member['username'],
+                                   HTTP_AUTH_TOKEN=self.member['token'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data.get('tasks'), self.tasks[1:])
+
+    def test_column_of_deleted_board(self):
+        Board.objects.filter(id=self.column.board_id) \
+            .update(deleted_at=timezone.now())
+        response = self.client.get(f'{self.endpoint}{self.column.id}',
+                                   HTTP_AUTH_USER=self.member['username'],
+                                   HTTP_AUTH_TOKEN=self.member['token'])
+        self.assertEqual(response.status_code, 404)
+
     def test_column_id_empty(self):
         response = self.client.get(self.endpoint,
                                    HTTP_AUTH_USER=self.member['username'],
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Team
-from ..util import create_admin, create_member
+from ..util import make_admin, make_member
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -11,9 +11,9 @@ class GetTeamTests(APITestCase):
 
     def setUp(self):
         self.team = Team.objects.create()
-        self.admin = create_admin(self.team)
-        self.member = create_member(self.team)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.admin = make_admin(self.team)
+        self.member = make_member(self.team)
+        self.wrong_admin = make_admin()
 
     def test_success(self):
         response = self.client.get(f'{self.endpoint}{self.team.id}',
@@ -2,7 +2,7 @@ from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Team, User, Board
 from ..validation.val_auth import not_authenticated_response
-from ..util import create_member
+from ..util import make_member
 
 
 class GetUsersTests(APITestCase):
@@ -22,7 +22,7 @@ class GetUsersTests(APITestCase):
                      'aIQsoq'
         self.board = Board.objects.create(name='Board', team=self.team)
         self.board.user.add(self.users[0])
-        self.wrong_member = create_member(Team.objects.create(), '1')
+        self.wrong_member = make_member()
 
     def get_users(self, team_id, board_id, auth_user, auth_token):
         return self.client.get(
@@ -40,7 +40,8 @@ class GetUsersTests(APITestCase):
         self.assertEqual(response.data, list(map(
             lambda i_user: {'username': i_user[1].username,
                             'isActive': i_user[0] == 0,
-                            'isAdmin': i_user[1].is_admin},
+                            'isAdmin': i_user[1].is_admin,
+                            'taskCount': 0},
             enumerate(self.users)
         )))
 
@@ -0,0 +1,47 @@
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from ..hashing import hash_password, check_password, make_token, check_token
+from ..models import Team, User
+from ..util import unique_username
+
+
+class HashingTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create(username=unique_username('user'),
+                                        password=hash_password('barbarbar'),
+                                        is_admin=True,
+                                        team=Team.objects.create())
+
+    def test_test_profile(self):
+        self.assertTrue(bytes(self.user.password).startswith(b'$2b$04$'))
+        self.assertTrue(make_token(self.user).startswith('$2b$04$'))
+
+    def test_password(self):
+        self.assertTrue(check_password('barbarbar', self.user.password))
+        self.assertFalse(check_password('barbarbaz', self.user.password))
+
+    def test_token(self):
+        token = make_token(self.user)
+        self.assertTrue(check_token(self.user, token))
+        self.assertFalse(check_token(self.user, token[:-1]))
+        self.assertFalse(check_token(self.user, 'not a token'))
+        self.assertFalse(check_token(self.user, None))
+
+    @override_settings(PASSWORD_HASH_ROUNDS=5, AUTH_TOKEN_ROUNDS=5)
+    def test_other_profile(self):
+        # hashes carry their own cost, so profiles can check each other's
+        token = make_token(self.user)
+        self.assertTrue(token.startswith('$2b$05$'))
+        self.assertTrue(check_token(self.user, token))
+        self.assertTrue(check_password('barbarbar', self.user.password))
+
+    def test_token_rounds(self):
+        token = make_token(self.user, rounds=5)
+        self.assertTrue(token.startswith('$2b$05$'))
+        self.assertTrue(check_token(self.user, token))
+
+    def test_verify_token(self):
+        response = self.client.post('/verify-token/', {
+            'username': self.user.username
+        })
+        self.assertEqual(response.status_code, 400)
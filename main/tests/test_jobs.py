@@ -0,0 +1,136 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+from .. import jobs
+from ..deletion import purge_board
+from ..models import Job, Team, Board, Column, Task
+
+calls = []
+
+
+@jobs.job()
+def record(job, value):
+    calls.append(value)
+    jobs.report_progress(job, 1, 1)
+
+
+@jobs.job(max_attempts=2)
+def fail(job):
+    raise ValueError('Job failed.')
+
+
+@jobs.job(concurrency=1)
+def limited(job):
+    pass
+
+
+class JobTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_run(self):
+        job = record.delay(value='foo')
+        self.assertEqual(job.name, 'main.tests.test_jobs.record')
+        self.assertEqual(jobs.run_pending('worker'), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.DONE)
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(job.progress, {'done': 1, 'total': 1})
+        self.assertEqual(calls, ['foo'])
+
+    def test_run_after(self):
+        jobs.enqueue(record, timezone.now() + timedelta(hours=1),
+                     value='foo')
+        self.assertEqual(jobs.run_pending('worker'), 0)
+
+    def test_retry_then_fail(self):
+        job = fail.delay()
+        jobs.run(jobs.claim('worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn('Job failed.', job.last_error)
+
+        Job.objects.filter(id=job.id).update(run_after=timezone.now())
+        jobs.run(jobs.claim('worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_claim_once(self):
+        record.delay(value='foo')
+        self.assertTrue(jobs.claim('worker 1'))
+        self.assertIsNone(jobs.claim('worker 2'))
+
+    def test_concurrency(self):
+        limited.delay()
+        limited.delay()
+        record.delay(value='foo')
+        self.assertEqual(jobs.claim('worker 1').name,
+                         'main.tests.test_jobs.limited')
+        self.assertEqual(jobs.claim('worker 2').name,
+                         'main.tests.test_jobs.record')
+        self.assertIsNone(jobs.claim('worker 3'))
+
+    def test_concurrency_two_claimers(self):
+        limited.delay()
+        update = QuerySet.update
+        claimed = []
+
+        # right before worker 1 claims, a second job that is due earlier is
+        # enqueued and worker 2 claims that one
+        def interleave(queryset, **kwargs):
+            if not claimed:
+                claimed.append(None)
+                limited.delay(run_after=timezone.now() - timedelta(hours=1))
+                claimed[0] = jobs.claim('worker 2')
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', interleave):
+            self.assertIsNone(jobs.claim('worker 1'))
+        self.assertEqual(claimed[0].locked_by, 'worker 2')
+        self.assertEqual(Job.objects.filter(status=Job.RUNNING).count(), 1)
+
+    def test_requeue_stale(self):
+        record.delay(value='foo')
+        job = jobs.claim('worker')
+        Job.objects.filter(id=job.id).update(
+            locked_at=timezone.now() - timedelta(hours=2)
+        )
+        self.assertEqual(jobs.requeue_stale(), 1)
+        self.assertEqual(jobs.run_pending('worker'), 1)
+
+    def test_worker_command(self):
+        record.delay(value='foo')
+        fail.delay()
+        out = StringIO()
+        call_command('worker', once=True, stdout=out)
+        self.assertIn('record) done.', out.getvalue())
+        self.assertIn('fail) queued.', out.getvalue())
+        self.assertEqual(calls, ['foo'])
+
+        out = StringIO()
+        call_command('jobs', stdout=out)
+        self.assertIn('main.tests.test_jobs.record\tdone\t1', out.getvalue())
+
+    def test_purge_board(self):
+        board = Board.objects.create(name='Board',
+                                     team=Team.objects.create())
+        column = Column.objects.create(order=0, board=board)
+        Task.objects.create(title='Task', order=0, column=column)
+        purge_board.delay(board_id=board.id)
+
+        # boards that are not tombstoned are left alone
+        jobs.run_pending('worker')
+        self.assertTrue(Board.objects.filter(id=board.id))
+
+        Board.objects.filter(id=board.id).update(deleted_at=timezone.now())
+        jobs.enqueue(purge_board, board_id=board.id)
+        jobs.run_pending('worker')
+        self.assertFalse(Board.objects.filter(id=board.id))
+        self.assertFalse(Task.objects.filter(column=column))
+        self.assertEqual(Job.objects.filter(status=Job.DONE).count(), 2)
@@ -0,0 +1,135 @@
+from unittest import skipUnless
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from rest_framework.exceptions import ErrorDetail
+from ..models import Board, Column, Subtask, Task, Team
+from ..ordering import make_room, update
+from ..util import make_admin
+
+
+class OrderingTests(APITestCase):
+    def setUp(self):
+        team = Team.objects.create()
+        self.admin = make_admin(team)
+        self.auth = {'HTTP_AUTH_USER': self.admin['username'],
+                     'HTTP_AUTH_TOKEN': self.admin['token']}
+        board = Board.objects.create(team=team)
+        self.column, self.other_column = [
+            Column.objects.create(order=i, board=board) for i in range(0, 2)
+        ]
+        self.tasks = [Task.objects.create(title=str(i), order=i,
+                                          column=self.column)
+                      for i in range(0, 3)]
+        self.subtasks = [Subtask.objects.create(title=str(i), order=i,
+                                                task=self.tasks[0])
+                         for i in range(0, 3)]
+
+    def orders(self, queryset):
+        return list(queryset.order_by('id').values_list('order', flat=True))
+
+    def test_make_room(self):
+        make_room(Task.objects.filter(column=self.column), 1)
+        self.assertEqual(self.orders(Task.objects.all()), [0, 2, 3])
+        make_room(Task.objects.filter(column=self.column), 1)
+        self.assertEqual(self.orders(Task.objects.all()), [0, 2, 3])
+
+    def test_update(self):
+        self.assertEqual(update(Task, {
+            self.tasks[0].id: {'order': 2, 'title': 'Two'},
+            self.tasks[2].id: {'order': 0},
+            self.tasks[1].id: {},
+        }), 2)
+        self.assertEqual(list(Task.objects.order_by('id')
+                              .values_list('order', 'title')),
+                         [(2, 'Two'), (1, '1'), (0, '2')])
+
+    def test_delete_tombstones_out_of_the_way(self):
+        task = self.tasks[0]
+        self.client.delete(f'/tasks/?id={task.id}', **self.auth)
+        self.assertEqual(Task.objects.get(id=task.id).order, -task.id)
+        response = self.client.post('/tasks/', {
+            'column': self.column.id, 'title': 'New'
+        }, format='json', **self.auth)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.orders(Task.objects.alive()), [2, 3, 0])
+
+    def test_patch_column_moves_tasks_in_the_way(self):
+        moved = Task.objects.create(title='Moved', order=0,
+                                    column=self.other_column)
+        response = self.client.patch(
+            f'/columns/?id={self.column.id}',
+            [{'id': moved.id, 'order': 1, 'user': self.admin['username']}],
+            format='json', **self.auth
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.orders(Task.objects.filter(column=self.column)),
+                         [0, 3, 2, 1])
+
+    def test_patch_column_duplicate_orders(self):
+        response = self.client.patch(
+            f'/columns/?id={self.column.id}',
+            [{'id': task.id, 'order': 0, 'user': self.admin['username']}
+             for task in self.tasks[:2]],
+            format='json', **self.auth
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'order': ErrorDetail(string='Task orders must be unique.',
+                                 code='unique')
+        })
+        self.assertEqual(self.orders(Task.objects.all()), [0, 1, 2])
+
+    def test_patch_task_makes_room(self):
+        response = self.client.patch(f'/tasks/?id={self.tasks[2].id}',
+                                     {'order': 0}, format='json',
+                                     **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.orders(Task.objects.all()), [1, 2, 0])
+
+    def test_patch_writes_changed_fields_only(self):
+        for path, data in ((f'/tasks/?id={self.tasks[0].id}',
+                            {'title': 'New', 'order': 0}),
+                           (f'/subtasks/?id={self.subtasks[0].id}',
+                            {'done': True})):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(path, data, format='json',
+                                             **self.auth)
+            self.assertEqual(response.status_code, 200)
+            updates = [query['sql'] for query in queries
+                       if query['sql'].startswith('UPDATE "main_task"')
+                       or query['sql'].startswith('UPDATE "main_subtask"')]
+            self.assertTrue(updates)
+            for sql in updates:
+                self.assertNotIn('"deleted_at" =', sql)
+                self.assertNotIn('"subtask_count" =', sql)
+        self.assertEqual(Task.objects.get(id=self.tasks[0].id).title, 'New')
+        self.assertTrue(Subtask.objects.get(id=self.subtasks[0].id).done)
+
+    def test_patch_task_duplicate_subtask_orders(self):
+        response = self.client.patch(f'/tasks/?id={self.tasks[0].id}', {
+            'subtasks': [{'title': 'A', 'order': 0, 'done': False},
+                         {'title': 'B', 'order': 0, 'done': False}]
+        }, format='json', **self.auth)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'subtasks': {'order': [ErrorDetail(
+            string='Subtask orders must be unique.', code='unique'
+        )]}})
+        self.assertEqual(Subtask.objects.count(), 3)
+
+    def test_patch_subtask_makes_room(self):
+        response = self.client.patch(f'/subtasks/?id={self.subtasks[0].id}',
+                                     {'order': 2}, format='json',
+                                     **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.orders(Subtask.objects.all()), [2, 1, 3])
+
+    @skipUnless(connection.features.supports_deferrable_unique_constraints,
+                'needs deferrable unique constraints')
+    def test_constraints(self):
+        for model, parent in ((Task, {'column': self.column}),
+                              (Subtask, {'task': self.tasks[0]})):
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+                model.objects.create(title='Duplicate', order=0, **parent)
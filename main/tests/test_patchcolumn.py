@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Column, Board, Team, Task
-from ..util import create_admin, create_member
+from ..util import make_admin, make_member
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -21,9 +21,9 @@ class UpdateColumns(APITestCase):
                 column=self.column
             ) for i in range(0, 5)
         ]
-        self.admin = create_admin(team)
-        self.member = create_member(team)
-        self.assigned_member = create_member(team, '1')
+        self.admin = make_admin(team)
+        self.member = make_member(team)
+        self.assigned_member = make_member(team)
         self.task_data = list(map(
             lambda task: {
                 'id': task.id,
@@ -33,7 +33,7 @@ class UpdateColumns(APITestCase):
             },
             self.tasks
         ))
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.wrong_admin = make_admin()
 
     def help_test_success(self, user):
         response = self.client.patch(f'{self.endpoint}{self.column.id}',
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Subtask, Task, Column, Board, Team, User
-from ..util import create_member, create_admin
+from ..util import make_member, make_admin
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -11,9 +11,9 @@ class UpdateSubtaskTests(APITestCase):
 
     def setUp(self):
         team = Team.objects.create()
-        self.admin = create_admin(team)
-        self.member = create_member(team)
-        self.assigned_member = create_member(team, '1')
+        self.admin = make_admin(team)
+        self.member = make_member(team)
+        self.assigned_member = make_member(team)
         self.subtask = Subtask.objects.create(
             title='Some Task Title',
             order=0,
@@ -29,7 +29,7 @@ class UpdateSubtaskTests(APITestCase):
                 )
             )
         )
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.wrong_admin = make_admin()
 
     def help_test_success(self, user, subtask_id, request_data):
         response = self.client.patch(f'{self.endpoint}{subtask_id}',
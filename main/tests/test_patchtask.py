@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Task, Column, Board, Team, User
-from ..util import create_member, create_admin
+from ..util import make_member, make_admin
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -11,10 +11,10 @@ class PatchTaskTests(APITestCase):
 
     def setUp(self):
         team = Team.objects.create()
-        self.member = create_member(team)
-        self.admin = create_admin(team)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
-        self.assigned_member = create_member(team, '2')
+        self.member = make_member(team)
+        self.admin = make_admin(team)
+        self.wrong_admin = make_admin()
+        self.assigned_member = make_member(team)
         self.task = Task.objects.create(
             title="Task Title",
             order=0,
@@ -37,6 +37,12 @@ class PatchTaskTests(APITestCase):
                                          'id': self.task.id})
         self.assertEqual(self.task.id, response.data.get('id'))
 
+    def test_deleted_at_read_only(self):
+        self.help_test_success(self.task.id, {
+            'title': 'New Title', 'deleted_at': '2020-01-01T00:00:00Z'
+        })
+        self.assertTrue(Task.objects.alive().filter(id=self.task.id).exists())
+
     def test_title_success(self):
         request_data = {'title': 'New Title'}
         self.help_test_success(self.task.id, request_data)
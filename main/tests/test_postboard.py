@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Board, Team, Column
-from ..util import create_member, create_admin
+from ..util import make_member, make_admin
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -11,9 +11,9 @@ class PostBoardTests(APITestCase):
 
     def setUp(self):
         self.team = Team.objects.create()
-        self.member = create_member(self.team)
-        self.admin = create_admin(self.team)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.member = make_member(self.team)
+        self.admin = make_admin(self.team)
+        self.wrong_admin = make_admin()
 
     def test_success(self):
         initial_count = Board.objects.count()
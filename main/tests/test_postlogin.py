@@ -1,14 +1,13 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
-from main.models import Team
-from ..util import create_member
+from ..util import make_member
 
 
 class LoginTests(APITestCase):
     endpoint = '/login/'
 
     def setUp(self):
-        self.user = create_member(Team.objects.create())
+        self.user = make_member()
 
     def test_success(self):
         request_data = {'username': self.user['username'],
@@ -22,6 +21,15 @@ class LoginTests(APITestCase):
         self.assertEqual(response.data.get('isAdmin'), self.user['is_admin'])
         self.assertTrue(response.data.get('token'))
 
+    def test_single_query(self):
+        request_data = {'username': self.user['username'],
+                        'password': self.user['password_raw'],
+                        # ignored, unlike in registration
+                        'invite_code': str(self.user['team'].invite_code)}
+        with self.assertNumQueries(1):
+            response = self.client.post(self.endpoint, request_data)
+        self.assertEqual(response.status_code, 200)
+
     def test_username_blank(self):
         request_data = {'username': '', 'password': self.user['password_raw']}
         response = self.client.post(self.endpoint, request_data)
@@ -0,0 +1,169 @@
+from rest_framework.test import APITestCase
+from rest_framework.exceptions import ErrorDetail
+from ..models import User, Board, Team
+from ..util import make_admin, make_member
+from ..validation.val_auth import \
+    not_authenticated_response, not_authorized_response
+
+
+class PostMembershipsTests(APITestCase):
+    endpoint = '/memberships/'
+
+    def setUp(self):
+        self.team = Team.objects.create()
+        self.admin = make_admin(self.team)
+        self.member = make_member(self.team)
+        self.users = User.objects.bulk_create([
+            User(username=f'User #{i}',
+                 password=self.admin['password'],
+                 team=self.team)
+            for i in range(0, 3)
+        ])
+        self.boards = [
+            Board.objects.create(name=f'Board #{i}', team=self.team)
+            for i in range(0, 2)
+        ]
+        self.boards[0].user.add(self.users[0])
+        self.wrong_board = Board.objects.create(name='Board',
+                                                team=Team.objects.create())
+
+    def post_memberships(self, data, user=None):
+        user = user or self.admin
+        return self.client.post(self.endpoint,
+                                data,
+                                format='json',
+                                HTTP_AUTH_USER=user['username'],
+                                HTTP_AUTH_TOKEN=user['token'])
+
+    def test_success(self):
+        response = self.post_memberships([
+            {'username': user.username,
+             'board_id': board.id,
+             'is_active': True}
+            for user in self.users for board in self.boards
+        ] + [
+            {'username': self.users[0].username,
+             'board_id': self.boards[0].id,
+             'is_active': False}
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {
+            'msg': 'Board memberships updated successfully.',
+            'added': 5,
+            'removed': 1,
+        })
+        self.assertEqual(
+            set(self.boards[0].user.values_list('username', flat=True)),
+            {self.users[1].username, self.users[2].username}
+        )
+        self.assertEqual(len(self.boards[1].user.all()), 3)
+
+    def test_idempotent(self):
+        data = [{'username': self.users[0].username,
+                 'board_id': self.boards[0].id,
+                 'is_active': True}]
+        for _ in range(0, 2):
+            response = self.post_memberships(data)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.boards[0].user.all()), 1)
+
+    def test_memberships_blank(self):
+        response = self.post_memberships([])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'memberships': ErrorDetail(string='Memberships cannot be empty.',
+                                       code='blank')
+        })
+
+    def test_username_blank(self):
+        response = self.post_memberships([{'username': '',
+                                           'board_id': self.boards[0].id,
+                                           'is_active': True}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'username': ErrorDetail(string='Username cannot be empty.',
+                                    code='blank')
+        })
+
+    def test_username_invalid(self):
+        for username in (['a', 'b'], {'a': 'b'}, 1):
+            response = self.post_memberships([{'username': username,
+                                               'board_id': self.boards[0].id,
+                                               'is_active': True}])
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data, {
+                'username': ErrorDetail(string='Username must be a string.',
+                                        code='invalid')
+            })
+
+    def test_board_id_invalid(self):
+        for board_id in ('asdf', True, 1.7, '1.7', [1], '-1'):
+            response = self.post_memberships([{
+                'username': self.users[0].username,
+                'board_id': board_id,
+                'is_active': True
+            }])
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data, {
+                'board_id': ErrorDetail(string='Board ID must be a number.',
+                                        code='invalid')
+            })
+
+    def test_board_id_string(self):
+        response = self.post_memberships([{'username': self.users[0].username,
+                                           'board_id': str(self.boards[0].id),
+                                           'is_active': True}])
+        self.assertEqual(response.status_code, 200)
+
+    def test_is_active_invalid(self):
+        response = self.post_memberships([{'username': self.users[0].username,
+                                           'board_id': self.boards[0].id,
+                                           'is_active': 'yes'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {
+            'is_active': ErrorDetail(string='Is Active must be a boolean.',
+                                     code='invalid')
+        })
+
+    def test_user_not_found(self):
+        response = self.post_memberships([{'username': 'nobody',
+                                           'board_id': self.boards[0].id,
+                                           'is_active': True}])
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data, {
+            'username': ErrorDetail(string='User not found.',
+                                    code='not_found')
+        })
+
+    def test_board_of_another_team(self):
+        response = self.post_memberships([
+            {'username': self.users[0].username,
+             'board_id': self.boards[1].id,
+             'is_active': True},
+            {'username': self.users[0].username,
+             'board_id': self.wrong_board.id,
+             'is_active': True}
+        ])
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data, {
+            'board_id': ErrorDetail(string='Board not found.',
+                                    code='not_found')
+        })
+        self.assertFalse(self.boards[1].user.all())
+
+    def test_unauthorized(self):
+        response = self.post_memberships([{'username': self.users[0].username,
+                                           'board_id': self.boards[1].id,
+                                           'is_active': True}],
+                                         self.member)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authorized_response.data)
+
+    def test_auth_token_invalid(self):
+        response = self.client.post(self.endpoint,
+                                    [],
+                                    format='json',
+                                    HTTP_AUTH_USER=self.admin['username'],
+                                    HTTP_AUTH_TOKEN='asdfasdf')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authenticated_response.data)
@@ -33,17 +33,23 @@ class RegisterTests(APITestCase):
         initial_user_count = User.objects.count()
         initial_team_count = Team.objects.count()
         initial_board_count = Board.objects.count()
-        self.help_test_success(initial_user_count, {
+        user = self.help_test_success(initial_user_count, {
             'username': 'fooooooooo',
             'password': 'barbarbar',
             'password_confirmation': 'barbarbar'
         })
         self.assertEqual(Team.objects.count(), initial_team_count + 1)
-        self.assertEqual(Board.objects.count(), initial_board_count)
+        self.assertEqual(Board.objects.count(), initial_board_count + 1)
+        board = Board.objects.get(team=user.team)
+        self.assertEqual(board.name, 'New Board')
+        self.assertEqual(list(board.user.all()), [user])
+        self.assertEqual(list(board.column_set.order_by('order')
+                              .values_list('order', flat=True)), [0, 1, 2, 3])
 
     def test_success_with_invite_code(self):
         initial_user_count = User.objects.count()
         initial_team_count = Team.objects.count()
+        initial_board_count = Board.objects.count()
         user = self.help_test_success(initial_user_count, {
             'username': 'foooo',
             'password': 'barbarbar',
@@ -51,6 +57,7 @@ class RegisterTests(APITestCase):
         }, f'?invite_code={self.team.invite_code}')
         self.assertEqual(Team.objects.count(), initial_team_count)
         self.assertEqual(user.team, self.team)
+        self.assertEqual(Board.objects.count(), initial_board_count)
 
     def test_username_max_length(self):
         initial_user_count = User.objects.count()
@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import Team, Board, Column, Task, Subtask
-from ..util import create_member, create_admin
+from ..util import make_member, make_admin
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -11,11 +11,11 @@ class CreateTaskTests(APITestCase):
 
     def setUp(self):
         team = Team.objects.create()
-        self.member = create_member(team)
-        self.admin = create_admin(team)
+        self.member = make_member(team)
+        self.admin = make_admin(team)
         board = Board.objects.create(team=team)
         self.column = Column.objects.create(board=board, order=0)
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.wrong_admin = make_admin()
 
     def help_test_success(self, response_data, status_code, request_data):
         self.assertEqual(status_code, 201)
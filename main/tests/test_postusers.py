@@ -1,7 +1,7 @@
 from rest_framework.test import APITestCase
 from rest_framework.exceptions import ErrorDetail
 from ..models import User, Board, Team
-from ..util import create_admin
+from ..util import make_admin
 from ..validation.val_auth import \
     not_authenticated_response, not_authorized_response
 
@@ -9,7 +9,7 @@ from ..validation.val_auth import \
 class PostUsersTests(APITestCase):
     def setUp(self):
         team = Team.objects.create()
-        self.admin = create_admin(team)
+        self.admin = make_admin(team)
         self.user = User.objects.create(
             username='Some User',
             password=b'$2b$12$DKVJHUAQNZqIvoi.OMN6v.x1ZhscKhbzSxpOBMykHgTIMeeJ'
@@ -22,7 +22,7 @@ class PostUsersTests(APITestCase):
         self.username = self.user.username
         self.token = '$2b$12$l3pvxK.Ig.RYsPvR6gpE1eaxpzAlqkFFznQ1uBGgHnFA8Ui' \
                      'mhbykO'
-        self.wrong_admin = create_admin(Team.objects.create(), '1')
+        self.wrong_admin = make_admin()
 
     def postUser(self, user_data, auth_user, auth_token):
         return self.client.post(f'/users/',
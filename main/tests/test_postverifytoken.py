@@ -1,13 +1,12 @@
 from rest_framework.test import APITestCase
-from main.models import Team
-from ..util import create_member
+from ..util import make_member
 
 
 class VerifyTokenTests(APITestCase):
     endpoint = '/verify-token/'
 
     def setUp(self):
-        self.user = create_member(Team.objects.create())
+        self.user = make_member()
 
     def test_success(self):
         request_data = {'username': self.user['username'],
@@ -0,0 +1,219 @@
+from rest_framework.test import APITestCase
+from ..models import Team, User, Board, Column, Task, Subtask
+from ..util import make_admin
+from .querycount import QueryCountMixin
+
+
+class QueryCountTests(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.team = Team.objects.create()
+        self.admin = make_admin(self.team)
+        self.user_count = 0
+
+    def request(self, method, path, data=None):
+        return getattr(self.client, method)(
+            path, data, format='json',
+            HTTP_AUTH_USER=self.admin['username'],
+            HTTP_AUTH_TOKEN=self.admin['token']
+        )
+
+    def create_users(self, count):
+        users = User.objects.bulk_create([
+            User(username=f'member{self.user_count + i}',
+                 password=self.admin['password'],
+                 team=self.team)
+            for i in range(count)
+        ])
+        self.user_count += count
+        return users
+
+    # a board with four columns, each holding `size` tasks with `size`
+    # subtasks
+    def create_board(self, size):
+        board = Board.objects.create(name='Board', team=self.team)
+        board.user.add(self.admin['username'], *self.create_users(size))
+        columns = [Column.objects.create(order=i, board=board)
+                   for i in range(0, 4)]
+        tasks = Task.objects.bulk_create([
+            Task(title=f'Task #{i}', order=i, column=column,
+                 user_id=self.admin['username'])
+            for column in columns for i in range(0, size)
+        ])
+        tasks = Task.objects.filter(column__board=board)
+        Subtask.objects.bulk_create([
+            Subtask(title=f'Subtask #{i}', order=i, task=task)
+            for task in tasks for i in range(0, size)
+        ])
+        return board, columns, list(tasks)
+
+    def test_get_nested_board(self):
+        self.assertQueryBound(
+            8,
+            lambda size: (self.create_board(size)[0],),
+            lambda board: self.request('get', f'/boards/?id={board.id}')
+        )
+
+    def test_get_boards(self):
+        self.assertQueryBound(
+            4,
+            lambda size: [self.create_board(0) for _ in range(0, size)],
+            lambda *_: self.request('get', f'/boards/?team_id={self.team.id}')
+        )
+
+    def test_get_columns(self):
+        self.assertQueryBound(
+            5,
+            lambda size: (self.create_board(size)[0],),
+            lambda board: self.request('get', f'/columns/?board_id={board.id}')
+        )
+
+    def test_get_tasks(self):
+        self.assertQueryBound(
+            5,
+            lambda size: (self.create_board(size)[1][0],),
+            lambda column: self.request('get',
+                                        f'/tasks/?column_id={column.id}')
+        )
+
+    def test_get_assigned_tasks(self):
+        self.assertQueryBound(
+            2,
+            lambda size: [self.create_board(size) for _ in range(0, size)],
+            lambda *_: self.request(
+                'get', f'/tasks/?assignee={self.admin["username"]}'
+            )
+        )
+
+    def test_get_subtasks(self):
+        self.assertQueryBound(
+            7,
+            lambda size: (self.create_board(size)[2][0],),
+            lambda task: self.request('get', f'/subtasks/?task_id={task.id}')
+        )
+
+    def test_get_users(self):
+        self.assertQueryBound(
+            5,
+            lambda size: (self.create_board(size)[0],),
+            lambda board: self.request(
+                'get', f'/users/?team_id={self.team.id}&board_id={board.id}'
+            )
+        )
+
+    def test_post_task(self):
+        self.assertQueryBound(
+            17,
+            lambda size: (self.create_board(size)[1][0],),
+            lambda column: self.request('post', '/tasks/', {
+                'column': column.id,
+                'title': 'New Task',
+                'subtasks': ['New Subtask'],
+            })
+        )
+
+    def test_patch_task(self):
+        self.assertQueryBound(
+            17,
+            lambda size: (self.create_board(size)[2][0],),
+            lambda task: self.request('patch', f'/tasks/?id={task.id}', {
+                'title': 'Updated Task',
+                'subtasks': [{'title': 'Subtask', 'order': 0, 'done': True}],
+            })
+        )
+
+    def test_delete_task(self):
+        self.assertQueryBound(
+            13,
+            lambda size: (self.create_board(size)[2][0],),
+            lambda task: self.request('delete', f'/tasks/?id={task.id}')
+        )
+
+    def test_patch_subtask(self):
+        self.assertQueryBound(
+            14,
+            lambda size: (self.create_board(size)[2][0]
+                          .subtask_set.first(),),
+            lambda subtask: self.request('patch',
+                                         f'/subtasks/?id={subtask.id}',
+                                         {'done': True})
+        )
+
+    def test_patch_column(self):
+        def populate(size):
+            _, columns, tasks = self.create_board(size)
+            return columns[1], tasks[0]
+
+        self.assertQueryBound(
+            17,
+            populate,
+            lambda column, task: self.request(
+                'patch', f'/columns/?id={column.id}',
+                [{'id': task.id, 'order': 0, 'user': self.admin['username']}]
+            )
+        )
+
+    def test_post_board(self):
+        self.assertQueryBound(
+            16,
+            lambda size: [self.create_board(size)],
+            lambda *_: self.request('post', '/boards/', {
+                'team_id': self.team.id, 'name': 'New Board'
+            })
+        )
+
+    def test_patch_board(self):
+        self.assertQueryBound(
+            6,
+            lambda size: (self.create_board(size)[0],),
+            lambda board: self.request('patch', f'/boards/?id={board.id}',
+                                       {'name': 'Renamed Board'})
+        )
+
+    def test_delete_board(self):
+        # another board, so that the team isn't left without one
+        Board.objects.create(name='Spare Board', team=self.team)
+        self.assertQueryBound(
+            12,
+            lambda size: (self.create_board(size)[0],),
+            lambda board: self.request('delete', f'/boards/?id={board.id}')
+        )
+
+    def test_post_user(self):
+        self.assertQueryBound(
+            7,
+            lambda size: (self.create_board(size)[0],
+                          self.create_users(1)[0]),
+            lambda board, user: self.request('post', '/users/', {
+                'username': user.username,
+                'board_id': board.id,
+                'is_active': True
+            })
+        )
+
+    def test_post_memberships(self):
+        self.assertQueryBound(
+            5,
+            lambda size: (self.create_board(0)[0], self.create_users(size)),
+            lambda board, users: self.request('post', '/memberships/', [
+                {'username': user.username,
+                 'board_id': board.id,
+                 'is_active': True}
+                for user in users
+            ])
+        )
+
+    def test_delete_user(self):
+        def populate(size):
+            board, _, tasks = self.create_board(size)
+            user = self.create_users(1)[0]
+            board.user.add(user)
+            Task.objects.filter(id__in=[task.id for task in tasks]) \
+                .update(user=user)
+            return user,
+
+        self.assertQueryBound(
+            11,
+            populate,
+            lambda user: self.request('delete',
+                                      f'/users/?username={user.username}')
+        )
@@ -0,0 +1,53 @@
+import io
+import json
+import uuid
+from unittest import mock
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+from .. import fastjson
+from ..parsers import FastJSONParser
+from ..renderers import FastJSONRenderer
+
+
+class FastJSONTests(SimpleTestCase):
+    data = {
+        'id': 1,
+        'inviteCode': uuid.UUID('8c1a7a2e-4f5e-4c83-9d2f-4a1b3c5d6e7f'),
+        'auth': ErrorDetail(string='Authentication failure.',
+                            code='not_authenticated'),
+        'columns': [{'id': 1, 'order': 0, 'tasks': [
+            {'title': 'Tâsk\u2028', 'description': None, 'done': True}
+        ]}]
+    }
+
+    def test_render_matches_stock_renderer(self):
+        self.assertEqual(FastJSONRenderer().render(self.data),
+                         JSONRenderer().render(self.data))
+
+    def test_render_fallback(self):
+        with mock.patch.object(fastjson, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.data),
+                             JSONRenderer().render(self.data))
+
+    def test_render_none(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+    def test_render_indent(self):
+        rendered = FastJSONRenderer().render(
+            self.data, 'application/json; indent=2'
+        )
+        self.assertIn(b'\n  ', rendered)
+        self.assertEqual(json.loads(rendered),
+                         json.loads(JSONRenderer().render(self.data)))
+
+    def test_parse(self):
+        stream = io.BytesIO(JSONRenderer().render(self.data))
+        self.assertEqual(FastJSONParser().parse(stream),
+                         json.loads(JSONRenderer().render(self.data)))
+
+    def test_parse_error(self):
+        for orjson in (fastjson.orjson, None):
+            with mock.patch.object(fastjson, 'orjson', orjson):
+                with self.assertRaises(ParseError):
+                    FastJSONParser().parse(io.BytesIO(b'{"title": '))
@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from ..models import Board, Column, Team, User
+from ..replicas import ReplicaRouter, is_pinned, request_routing
+from ..util import make_admin
+from ..validation.val_auth import not_authenticated_response
+
+
+# copy the rows of models from the primary to the replica, as replication
+# would have by now
+def replicate(*models):
+    for model in models:
+        model.objects.using('replica').bulk_create(
+            model.objects.using('default').all()
+        )
+
+
+@override_settings(REPLICA_DATABASES=['replica'], REPLICA_PIN_SECONDS=5)
+class ReplicaTests(APITestCase):
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.team = Team.objects.create()
+        self.admin = make_admin(self.team)
+        self.board = Board.objects.create(name='Board', team=self.team)
+        self.auth = {'HTTP_AUTH_USER': self.admin['username'],
+                     'HTTP_AUTH_TOKEN': self.admin['token']}
+
+    def test_get_reads_replica(self):
+        response = self.client.get('/boards/', **self.auth)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.data, not_authenticated_response.data)
+
+        replicate(Team, User, Board)
+        Board.objects.filter(id=self.board.id).update(name='Renamed')
+        response = self.client.get('/boards/', **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['name'], 'Board')
+
+    def test_write_pins_client_to_primary(self):
+        replicate(Team, User, Board)
+        response = self.client.patch(f'/boards/?id={self.board.id}',
+                                     {'name': 'Renamed'}, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(is_pinned(self.admin['username']))
+        response = self.client.get('/boards/', **self.auth)
+        self.assertEqual(response.data[0]['name'], 'Renamed')
+
+        cache.clear()
+        response = self.client.get('/boards/', **self.auth)
+        self.assertEqual(response.data[0]['name'], 'Board')
+
+    def test_get_columns_reads_replica(self):
+        replicate(Team, User, Board, Board.user.through)
+        Column.objects.create(board=self.board, order=0)
+        response = self.client.get(f'/columns/?board_id={self.board.id}',
+                                   **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'columns': []})
+
+    def test_register_pins_new_user(self):
+        response = self.client.post('/register/', {
+            'username': 'replicauser',
+            'password': 'securepassword',
+            'password_confirmation': 'securepassword',
+        })
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(is_pinned('replicauser'))
+
+    def test_routing(self):
+        router = ReplicaRouter()
+        self.assertIsNone(router.db_for_read(Board))
+        with request_routing(True):
+            self.assertEqual(router.db_for_read(Board), 'replica')
+            self.assertEqual(router.db_for_write(Board), 'default')
+            self.assertIsNone(router.db_for_read(Board))
+        with request_routing(False):
+            self.assertIsNone(router.db_for_read(Board))
@@ -0,0 +1,67 @@
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework.test import APITestCase
+from ..models import Team, User, Board, Column, Task, Subtask
+from ..seed import seed
+
+
+class SeedTests(APITestCase):
+    def contents(self, fixture):
+        team = fixture['team']
+        return (
+            list(Board.objects.filter(team=team)
+                 .order_by('id').values_list('name', flat=True)),
+            list(Task.objects.filter(column__board__team=team).order_by('id')
+                 .values_list('title', 'description', 'order', 'user')),
+            list(Subtask.objects.filter(task__column__board__team=team)
+                 .order_by('id').values_list('title', 'order', 'done')),
+        )
+
+    def test_sizes(self):
+        fixtures = seed(2, boards=3, tasks=4, subtasks=2, members=3)
+        self.assertEqual(len(fixtures), 2)
+        team = fixtures[0]['team']
+        self.assertEqual(User.objects.filter(team=team).count(), 4)
+        self.assertEqual(Board.objects.filter(team=team).count(), 3)
+        self.assertEqual(Column.objects.filter(board__team=team).count(), 12)
+        self.assertEqual(
+            Task.objects.filter(column__board__team=team).count(), 48
+        )
+        self.assertEqual(
+            Subtask.objects.filter(task__column__board__team=team).count(), 96
+        )
+        self.assertEqual(
+            Board.user.through.objects.filter(board__team=team).count(), 12
+        )
+
+    def test_login(self):
+        [fixture] = seed(1, boards=1, tasks=1, subtasks=1)
+        # hashed at the cost of the test profile
+        admin = User.objects.get(username=fixture['admin']['username'])
+        self.assertTrue(bytes(admin.password).startswith(b'$2b$04$'))
+        response = self.client.post('/login/', fixture['admin'])
+        self.assertEqual(response.status_code, 200)
+
+    def test_deterministic(self):
+        [first] = seed(1, boards=2, tasks=3, subtasks=2, seed=7, prefix='a')
+        [second] = seed(1, boards=2, tasks=3, subtasks=2, seed=7, prefix='b')
+        [third] = seed(1, boards=2, tasks=3, subtasks=2, seed=8, prefix='c')
+        first, second, third = \
+            self.contents(first), self.contents(second), self.contents(third)
+        # assignees differ by the username prefix only
+        self.assertEqual(first[0], second[0])
+        self.assertEqual([task[:3] for task in first[1]],
+                         [task[:3] for task in second[1]])
+        self.assertEqual(first[2], second[2])
+        self.assertNotEqual(first, third)
+
+    def test_command(self):
+        out = StringIO()
+        call_command('seed', teams=2, boards=1, tasks=2, subtasks=1,
+                     members=1, stdout=out)
+        self.assertIn('Seeded 2 teams', out.getvalue())
+        self.assertEqual(Team.objects.count(), 2)
+        self.assertEqual(Task.objects.count(), 16)
+        with self.assertRaises(CommandError):
+            call_command('seed', stdout=out)
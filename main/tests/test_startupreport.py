@@ -0,0 +1,24 @@
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from ..management.commands.startup_report import parse_importtime
+
+
+class StartupReportTests(SimpleTestCase):
+    def test_parse_importtime(self):
+        self.assertEqual(dict(parse_importtime(
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       120 |        120 |     django.utils\n'
+            'import time:        30 |        150 |   django\n'
+            'import time:        50 |         50 | main.models\n'
+            'unrelated output\n'
+        )), {'django': 150, 'main': 50})
+
+    def test_api_profile_boots(self):
+        out = StringIO()
+        call_command('startup_report', 'backend.settings_api', top=3,
+                     stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('backend.settings_api: booted '
+                                            'in '))
+        self.assertEqual(len(lines), 4)
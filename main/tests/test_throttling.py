@@ -0,0 +1,157 @@
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from .. import metrics
+from ..models import Team
+from ..throttling import \
+    take, parse_rate, get_backend, CacheBackend, LocalMemoryBackend
+from ..util import make_admin
+
+
+@override_settings(AUTH_THROTTLE_RATES={'ip': '3/min', 'username': '2/min',
+                                       'verify_token': '2/min'})
+class ThrottlingTests(APITestCase):
+    def setUp(self):
+        get_backend().reset()
+        metrics.reset()
+        self.admin = make_admin(Team.objects.create())
+
+    def tearDown(self):
+        get_backend().reset()
+
+    def login(self, username, ip='10.0.0.1'):
+        return self.client.post('/login/', {'username': username,
+                                            'password': 'barbarbar'},
+                                REMOTE_ADDR=ip)
+
+    def test_take(self):
+        state, wait = take(None, 2, 60, 100)
+        self.assertEqual((state, wait), ((1, 100), None))
+        state, wait = take(state, 2, 60, 100)
+        self.assertEqual((state, wait), ((0, 100), None))
+        state, wait = take(state, 2, 60, 115)
+        self.assertEqual(wait, 15)
+        # refilled at 2 tokens per minute
+        state, wait = take(state, 2, 60, 130)
+        self.assertIsNone(wait)
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('10/min'), (10, 60))
+        self.assertEqual(parse_rate('5/second'), (5, 1))
+        self.assertEqual(parse_rate('100/hour'), (100, 3600))
+
+    def test_username(self):
+        for ip in ('10.0.0.1', '10.0.0.2'):
+            self.assertEqual(self.login(self.admin['username'], ip)
+                             .status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.login(self.admin['username'], '10.0.0.3')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(metrics.snapshot(), {'throttle.username.rejected': 1})
+
+        # other usernames are only limited by their address
+        self.assertEqual(self.login('someoneelse', '10.0.0.3').status_code,
+                         400)
+
+    def test_ip(self):
+        for i in range(0, 3):
+            self.login(f'user{i}')
+        for endpoint in ('/login/', '/register/', '/verify-token/'):
+            response = self.client.post(endpoint, {'username': endpoint},
+                                        REMOTE_ADDR='10.0.0.1')
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response['Retry-After'], '20')
+        self.assertEqual(self.login('user9', '10.0.0.2').status_code, 400)
+
+    def test_ip_spoofed_forwarded_for(self):
+        # the router appends the real address to whatever the client sent
+        for i in range(0, 4):
+            response = self.client.post(
+                '/login/', {'username': f'user{i}', 'password': 'barbarbar'},
+                HTTP_X_FORWARDED_FOR=f'6.6.6.{i}, 10.0.0.5'
+            )
+        self.assertEqual(response.status_code, 429)
+        response = self.client.post(
+            '/login/', {'username': 'user9', 'password': 'barbarbar'},
+            HTTP_X_FORWARDED_FOR='6.6.6.9, 10.0.0.6'
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejected_takes_no_tokens(self):
+        for ip in ('10.0.0.1', '10.0.0.2'):
+            self.login(self.admin['username'], ip)
+        for _ in range(0, 3):
+            self.assertEqual(self.login(self.admin['username'], '10.0.0.3')
+                             .status_code, 429)
+        # the username throttle rejected those, so 10.0.0.3 kept its tokens
+        for i in range(0, 3):
+            self.assertEqual(self.login(f'user{i}', '10.0.0.3').status_code,
+                             400)
+
+    def test_verify_token_scope(self):
+        for ip in ('10.0.0.1', '10.0.0.2'):
+            self.login(self.admin['username'], ip)
+        for ip in ('10.0.0.3', '10.0.0.4'):
+            response = self.client.post('/verify-token/', {
+                'username': self.admin['username'],
+                'token': self.admin['token'],
+            }, REMOTE_ADDR=ip)
+            self.assertEqual(response.status_code, 200)
+        response = self.client.post('/verify-token/', {
+            'username': self.admin['username'],
+            'token': self.admin['token'],
+        }, REMOTE_ADDR='10.0.0.5')
+        self.assertEqual(response.status_code, 429)
+
+    def test_body_not_an_object(self):
+        for rates in ({'ip': None, 'username': None, 'verify_token': None},
+                      {'ip': '3/min', 'username': '2/min',
+                       'verify_token': '2/min'}):
+            with self.subTest(rates=rates), \
+                    override_settings(AUTH_THROTTLE_RATES=rates):
+                get_backend().reset()
+                for endpoint in ('/login/', '/register/', '/verify-token/'):
+                    response = self.client.post(endpoint, [1, 2],
+                                                format='json')
+                    self.assertEqual(response.status_code, 400)
+
+    @override_settings(AUTH_THROTTLE_RATES={'ip': None, 'username': None,
+                                            'verify_token': None})
+    def test_disabled(self):
+        for _ in range(0, 5):
+            self.assertEqual(self.login(self.admin['username']).status_code,
+                             200)
+
+    def test_cache_backend(self):
+        backend = CacheBackend()
+        backend.reset()
+        self.assertEqual(backend.consume([('ip:10.0.0.1', 1, 60)]), [None])
+        [wait] = backend.consume([('ip:10.0.0.1', 1, 60)])
+        self.assertAlmostEqual(wait, 60, delta=1)
+        # a full bucket keeps its token if another one is empty
+        self.assertEqual(backend.consume([('ip:10.0.0.2', 1, 60),
+                                          ('ip:10.0.0.1', 1, 60)])[0], None)
+        self.assertEqual(backend.consume([('ip:10.0.0.2', 1, 60)]), [None])
+        backend.reset()
+
+    def test_local_memory_all_or_nothing(self):
+        backend = LocalMemoryBackend()
+        backend.consume([('a', 1, 60)])
+        waits = backend.consume([('b', 1, 60), ('a', 1, 60)])
+        self.assertIsNone(waits[0])
+        self.assertIsNotNone(waits[1])
+        self.assertEqual(list(backend.buckets), ['a'])
+
+    def test_local_memory_capped(self):
+        backend = LocalMemoryBackend()
+        backend.MAX_BUCKETS = 3
+        for key in ('a', 'b', 'c', 'a'):
+            backend.consume([(key, 2, 60)])
+        # 'b' is the least recently used and makes way for 'd'
+        backend.consume([('d', 1, 60)])
+        self.assertEqual(list(backend.buckets), ['c', 'a', 'd'])
+        self.assertEqual(backend.consume([('b', 1, 60)]), [None])
+        self.assertEqual(len(backend.buckets), 3)
@@ -0,0 +1,39 @@
+import os
+from rest_framework.test import APITestCase
+from django.db import IntegrityError, transaction
+from ..models import Board, Column, Team, User
+from ..util import create_columns, make_admin, make_member
+
+
+class FactoryTests(APITestCase):
+    def test_unique_usernames(self):
+        team = Team.objects.create()
+        admins = [make_admin(team) for _ in range(0, 3)]
+        member = make_member(team)
+        usernames = {user['username'] for user in [*admins, member]}
+        self.assertEqual(len(usernames), 4)
+        for username in usernames:
+            self.assertIn(str(os.getpid()), username)
+        self.assertEqual(User.objects.filter(team=team).count(), 4)
+
+    def test_team(self):
+        admin, member = make_admin(), make_member()
+        self.assertTrue(admin['is_admin'])
+        self.assertFalse(member['is_admin'])
+        self.assertNotEqual(admin['team'], member['team'])
+
+
+class CreateColumnsTests(APITestCase):
+    def test_idempotent(self):
+        board = Board.objects.create(team=Team.objects.create())
+        Column.objects.create(board=board, order=2)
+        create_columns(board.id)
+        create_columns(board.id)
+        self.assertEqual(list(board.column_set.order_by('order')
+                              .values_list('order', flat=True)), [0, 1, 2, 3])
+
+    def test_unique_order(self):
+        board = Board.objects.create(team=Team.objects.create())
+        Column.objects.create(board=board, order=0)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Column.objects.create(board=board, order=0)
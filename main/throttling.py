@@ -0,0 +1,153 @@
+"""Token-bucket throttles for the auth endpoints.
+
+Every client IP and every username gets a bucket holding up to ``capacity``
+tokens that refills at ``capacity / period`` tokens per second; each request
+takes one from each of its buckets, and none if any of them is empty. The throttles run as DRF throttle classes, i.e. in the view's
+initial() before the handler, so throttled requests never reach the database
+or bcrypt and get a 429 with a Retry-After header.
+
+Rates come from ``AUTH_THROTTLE_RATES`` ({scope: 'N/period'} or None to
+disable a scope) and buckets live in ``AUTH_THROTTLE_BACKEND``:
+``LocalMemoryBackend`` keeps them per process, ``CacheBackend`` keeps them in
+a Django cache that several processes or hosts can share.
+"""
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from rest_framework.throttling import BaseThrottle
+from . import metrics
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+# '10/min' -> (10, 60)
+def parse_rate(rate):
+    count, period = rate.split('/')
+    return int(count), PERIODS[period[0]]
+
+
+# take one token from a bucket in state (tokens, updated), return
+# (new state, seconds to wait or None if a token was taken)
+def take(state, capacity, period, now):
+    tokens, updated = state or (capacity, now)
+    tokens = min(capacity, tokens + (now - updated) * capacity / period)
+    if tokens >= 1:
+        return (tokens - 1, now), None
+    return (tokens, now), (1 - tokens) * period / capacity
+
+
+class LocalMemoryBackend:
+    # buckets kept; the least recently used ones go first
+    MAX_BUCKETS = 10000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = OrderedDict()
+
+    # take one token from every bucket in [(key, capacity, period)] if all of
+    # them have one, and return the seconds to wait for each (None if not
+    # limiting)
+    def consume(self, buckets):
+        now = time.monotonic()
+        with self.lock:
+            taken = [take(self.buckets.get(key), capacity, period, now)
+                     for key, capacity, period in buckets]
+            waits = [wait for _, wait in taken]
+            if any(wait is not None for wait in waits):
+                return waits
+            for (key, _, _), (state, _) in zip(buckets, taken):
+                self.buckets[key] = state
+                self.buckets.move_to_end(key)
+            while len(self.buckets) > self.MAX_BUCKETS:
+                self.buckets.popitem(last=False)
+        return waits
+
+    def reset(self):
+        with self.lock:
+            self.buckets.clear()
+
+
+# Buckets in the cache named by AUTH_THROTTLE_CACHE, e.g. a shared Redis or
+# Memcached. The read-modify-write is not atomic, so concurrent requests for
+# the same key can occasionally both take the last token.
+class CacheBackend:
+    def __init__(self):
+        self.cache = caches[getattr(settings, 'AUTH_THROTTLE_CACHE',
+                                    'default')]
+
+    def consume(self, buckets):
+        now = time.time()
+        keys = [f'throttle:{key}' for key, _, _ in buckets]
+        states = self.cache.get_many(keys)
+        taken = [take(states.get(key), capacity, period, now)
+                 for key, (_, capacity, period) in zip(keys, buckets)]
+        waits = [wait for _, wait in taken]
+        if all(wait is None for wait in waits):
+            for key, (_, _, period), (state, _) in zip(keys, buckets, taken):
+                self.cache.set(key, state, timeout=period)
+        return waits
+
+    def reset(self):
+        self.cache.clear()
+
+
+@lru_cache(maxsize=None)
+def _backend(path):
+    return import_string(path)()
+
+
+def get_backend():
+    return _backend(settings.AUTH_THROTTLE_BACKEND)
+
+
+# One throttle per endpoint checks all of its scopes together, since DRF
+# would let every throttle class take a token even if another one rejects.
+class TokenBucketThrottle(BaseThrottle):
+    scopes = ()
+
+    def get_key(self, request, scope):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        buckets = {}
+        for scope in self.scopes:
+            rate = settings.AUTH_THROTTLE_RATES.get(scope)
+            key = rate and self.get_key(request, scope)
+            if key:
+                buckets[scope] = (f'{scope}:{key}', *parse_rate(rate))
+        self.wait_time = None
+        if not buckets:
+            return True
+        waits = get_backend().consume(list(buckets.values()))
+        for scope, wait in zip(buckets, waits):
+            if wait is not None:
+                metrics.incr(f'throttle.{scope}.rejected')
+                self.wait_time = max(wait, self.wait_time or 0)
+        return self.wait_time is None
+
+    def wait(self):
+        return self.wait_time
+
+
+# the client's address for 'ip', the posted username for any other scope
+class AuthThrottle(TokenBucketThrottle):
+    scopes = ('ip', 'username')
+
+    def get_key(self, request, scope):
+        if scope == 'ip':
+            return self.get_ident(request)
+        if not isinstance(request.data, Mapping):
+            return None
+        username = request.data.get('username')
+        return username if isinstance(username, str) else None
+
+
+# verify-token runs on every page load, so its usernames get their own
+# buckets instead of eating into the login ones
+class VerifyTokenThrottle(AuthThrottle):
+    scopes = ('ip', 'verify_token')
@@ -0,0 +1,170 @@
+from django.db import connection, transaction
+from django.db.models import Count
+from .models import Board, Column, Task, Subtask, User
+from . import fastjson
+from .counters import refresh_board
+
+# Boards are exported as NDJSON: a board header, then one line per column and
+# one line per task with its subtasks inlined. Tasks reference their column by
+# order, so exports can be imported into any team.
+FORMAT_VERSION = 1
+CHUNK_SIZE = 2000
+BATCH_SIZE = 500
+# the largest value of an IntegerField, such as the orders
+MAX_ORDER = 2 ** 31 - 1
+
+
+def _line(data):
+    return fastjson.dumps(data) + b'\n'
+
+
+# Stream a board as NDJSON lines. Tasks and subtasks are read through two
+# server-side cursors ordered by task id and merged, so memory stays constant
+# however large the board is.
+def export_board(board, chunk_size=CHUNK_SIZE):
+    yield _line({'type': 'board', 'version': FORMAT_VERSION,
+                 'name': board.name})
+
+    column_orders = {}
+    for column in Column.objects.filter(board=board).order_by('order') \
+            .values('id', 'order'):
+        column_orders[column['id']] = column['order']
+        yield _line({'type': 'column', 'order': column['order']})
+
+    tasks = Task.objects.alive().filter(column__board=board) \
+        .order_by('id') \
+        .values('id', 'column_id', 'title', 'description', 'order',
+                'user_id') \
+        .iterator(chunk_size=chunk_size)
+    subtasks = Subtask.objects \
+        .filter(task__column__board=board, task__deleted_at__isnull=True) \
+        .order_by('task_id', 'order', 'id') \
+        .values('task_id', 'title', 'order', 'done') \
+        .iterator(chunk_size=chunk_size)
+
+    subtask = next(subtasks, None)
+    for task in tasks:
+        task_subtasks = []
+        while subtask and subtask['task_id'] == task['id']:
+            task_subtasks.append({'title': subtask['title'],
+                                  'order': subtask['order'],
+                                  'done': subtask['done']})
+            subtask = next(subtasks, None)
+
+        yield _line({'type': 'task',
+                     'column': column_orders[task['column_id']],
+                     'title': task['title'],
+                     'description': task['description'],
+                     'order': task['order'],
+                     'user': task['user_id'],
+                     'subtasks': task_subtasks})
+
+
+def _validate_title(title, max_length):
+    if not isinstance(title, str) or not title:
+        raise ValueError('Title cannot be empty.')
+    if len(title) > max_length:
+        raise ValueError(f'Title cannot be longer than {max_length} '
+                         f'characters.')
+    return title
+
+
+def _validate_order(order, kind):
+    try:
+        order = int(order)
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid {kind} order.')
+    if not 0 <= order <= MAX_ORDER:
+        raise ValueError(f'Invalid {kind} order.')
+    return order
+
+
+# Create a new board for `team` from NDJSON lines, inserting tasks and subtasks
+# with bulk_create in batches of `batch_size`. Raises ValueError on malformed
+# input, in which case nothing is created. Returns (board, task count).
+def import_board(lines, team, name=None, batch_size=BATCH_SIZE):
+    try:
+        with transaction.atomic():
+            return _import_board(lines, team, name, batch_size)
+    except (TypeError, AttributeError):
+        raise ValueError('Malformed export.')
+
+
+def _import_board(lines, team, name, batch_size):
+    lines = (fastjson.loads(line) for line in lines if line.strip())
+
+    header = next(lines, None)
+    if not isinstance(header, dict) or header.get('type') != 'board':
+        raise ValueError('Export must start with a board.')
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError('Unsupported export version.')
+
+    board = Board.objects.create(
+        name=_validate_title(name or header.get('name'), 35), team=team
+    )
+    board.user.add(*User.objects.filter(team=team, is_admin=True))
+
+    team_users = set(User.objects.filter(team=team)
+                     .values_list('username', flat=True))
+    columns = {}
+    batch = []
+    task_count = 0
+
+    def flush():
+        # only Postgres returns primary keys from bulk inserts
+        if connection.features.can_return_rows_from_bulk_insert:
+            Task.objects.bulk_create([task for task, _ in batch])
+        else:
+            for task, _ in batch:
+                task.save()
+        Subtask.objects.bulk_create([
+            Subtask(task=task, **subtask)
+            for task, subtasks in batch for subtask in subtasks
+        ], batch_size=batch_size)
+        batch.clear()
+
+    for line in lines:
+        kind = line.get('type') if isinstance(line, dict) else None
+        if kind == 'column':
+            if line.get('order') in columns or not isinstance(
+                    line.get('order'), int):
+                raise ValueError('Invalid column order.')
+            columns[line['order']] = Column.objects.create(
+                order=_validate_order(line['order'], 'column'), board=board
+            )
+        elif kind == 'task':
+            if line.get('column') not in columns:
+                raise ValueError('Task column not found.')
+            task = Task(
+                column=columns[line['column']],
+                title=_validate_title(line.get('title'), 50),
+                description=line.get('description') or None,
+                order=_validate_order(line.get('order', 0), 'task'),
+                user_id=line.get('user') if line.get('user') in team_users
+                else None
+            )
+            subtasks = [{'title': _validate_title(subtask.get('title'), 50),
+                         'order': _validate_order(subtask.get('order', 0),
+                                                  'subtask'),
+                         'done': bool(subtask.get('done'))}
+                        for subtask in line.get('subtasks') or []]
+            if len({subtask['order'] for subtask in subtasks}) \
+                    < len(subtasks):
+                raise ValueError('Duplicate subtask order.')
+            batch.append((task, subtasks))
+            task_count += 1
+            if len(batch) >= batch_size:
+                flush()
+        else:
+            raise ValueError('Unknown line type.')
+
+    if batch:
+        flush()
+    # checked once all tasks are in rather than by remembering every order;
+    # on Postgres task_column_order_uniq would only fail at commit
+    if Task.objects.filter(column__board=board) \
+            .values('column_id', 'order').annotate(count=Count('id')) \
+            .filter(count__gt=1).exists():
+        raise ValueError('Duplicate task order.')
+    refresh_board(board)
+    return board, task_count
@@ -1,48 +1,60 @@
-from main.models import User
+from main.models import Team, User, Column
 from rest_framework.response import Response
 from .serializers.ser_board import BoardSerializer
-from .serializers.ser_column import ColumnSerializer
-import bcrypt
+from .hashing import hash_password, make_token
+from functools import lru_cache
+import itertools
+import os
 
 
-def create_admin(team, username_suffix=''):
+# hashed once per process, at the cost of the active settings profile
+@lru_cache(maxsize=None)
+def password_hash():
+    return hash_password('barbarbar')
+
+
+def create_user(team, username, is_admin):
     user = User.objects.create(
-        username=f'teamadmin{username_suffix}',
-        password=b'$2b$12$DKVJHUAQNZqIvoi.OMN6v.x1ZhscKhbzSxpOBMykHgTIMeeJpC6m'
-                 b'e',
-        is_admin=True,
+        username=username,
+        password=password_hash(),
+        is_admin=is_admin,
         team=team
     )
-    token = '$2b$12$yGUdlz0eMW3P6TAX07.CPuCA5u.t10uTEKCE2SQ5Vdm3VbnrHbpoK'
     return {'username': user.username,
             'password': user.password,
             'password_raw': 'barbarbar',
             'is_admin': user.is_admin,
             'team': user.team,
-            'token': token if not username_suffix else bcrypt.hashpw(
-                bytes(user.username, 'utf-8') + user.password,
-                bcrypt.gensalt()
-            ).decode('utf-8')}
+            'token': make_token(user)}
+
+
+def create_admin(team, username_suffix=''):
+    return create_user(team, f'teamadmin{username_suffix}', True)
 
 
 def create_member(team, username_suffix=''):
-    user = User.objects.create(
-        username=f'teammember{username_suffix}',
-        password=b'$2b$12$DKVJHUAQNZqIvoi.OMN6v.x1ZhscKhbzSxpOBMykHgTIMeeJpC6m'
-                 b'e',
-        is_admin=False,
-        team=team
-    )
-    token = '$2b$12$qNhh2i1ZPU1qaIKncI7J6O2kr4XmuCWSwLEMJF653vyvDMIRekzLO'
-    return {'username': user.username,
-            'password': user.password,
-            'password_raw': 'barbarbar',
-            'is_admin': user.is_admin,
-            'team': user.team,
-            'token': token if not username_suffix else bcrypt.hashpw(
-                bytes(user.username, 'utf-8') + user.password,
-                bcrypt.gensalt()
-            ).decode('utf-8')}
+    return create_user(team, f'teammember{username_suffix}', False)
+
+
+# Factory variants of the helpers above. Usernames are unique within the
+# process and carry its pid, so tests never depend on fixed names and
+# parallel test processes never collide on anything keyed by username.
+_sequence = itertools.count()
+
+
+def unique_username(prefix):
+    return f'{prefix}{os.getpid()}x{next(_sequence)}'
+
+
+def make_admin(team=None):
+    return create_user(team or Team.objects.create(),
+                       unique_username('teamadmin'), True)
+
+
+def make_member(team=None):
+    return create_user(team or Team.objects.create(),
+                       unique_username('teammember'), False)
+
 
 def create_board(team_id, name):  # -> (board, response)
     board_serializer = BoardSerializer(data={'team': team_id, 'name': name})
@@ -55,16 +67,15 @@ def create_board(team_id, name):  # -> (board, response)
 
     board.user.add(team_admin)
 
-    # create four columns for the board
-    for order in range(0, 4):
-        column_serializer = ColumnSerializer(
-            data={'board': board.id, 'order': order}
-        )
-        if not column_serializer.is_valid():
-            return board, Response(
-                column_serializer.errors, 400
-            )
-        column_serializer.save()
+    create_columns(board.id)
 
     return board, None
 
+
+# create whichever of a board's four columns are missing; repeating it, even
+# concurrently, is harmless since column_board_order_uniq drops duplicates
+def create_columns(board_id):
+    Column.objects.bulk_create([
+        Column(order=order, board_id=board_id) for order in range(0, 4)
+    ], ignore_conflicts=True)
+
@@ -1,7 +1,7 @@
 from main.models import User
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.response import Response
-import bcrypt
+from ..hashing import check_token
 
 
 not_authenticated_response = Response({
@@ -17,13 +17,7 @@ def authenticate(username, token):
     except (User.DoesNotExist, ValueError):
         return None, not_authenticated_response
 
-    try:
-        tokens_match = bcrypt.checkpw(
-            bytes(user.username, 'utf-8') + user.password,
-            bytes(token, 'utf-8'))
-        if not tokens_match:
-            return None, not_authenticated_response
-    except ValueError:
+    if not check_token(user, token):
         return None, not_authenticated_response
 
     return user, None
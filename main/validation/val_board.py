@@ -20,7 +20,7 @@ def validate_board_id(board_id):
         }, 400)
 
     try:
-        board = Board.objects.get(id=board_id)
+        board = Board.objects.alive().get(id=board_id)
     except Board.DoesNotExist:
         return None, Response({
             'board_id': ErrorDetail(string='Board not found.',
@@ -20,7 +20,8 @@ def validate_column_id(column_id):
         }, 400)
 
     try:
-        column = Column.objects.get(id=column_id)
+        column = Column.objects.get(id=column_id,
+                                    board__deleted_at__isnull=True)
     except Column.DoesNotExist:
         return None, Response({
             'column_id': ErrorDetail(string='Column not found.',
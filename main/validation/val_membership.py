@@ -0,0 +1,88 @@
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Cast
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.response import Response
+from ..models import User, Board
+from .val_user import validate_is_active
+
+
+# return ({(username, board_id): is_active}, response)
+def validate_memberships(memberships, team_id):
+    if not memberships or not isinstance(memberships, list):
+        return None, Response({
+            'memberships': ErrorDetail(string='Memberships cannot be empty.',
+                                       code='blank')
+        }, 400)
+
+    validated = {}
+    for membership in memberships:
+        if not isinstance(membership, dict):
+            return None, Response({
+                'memberships': ErrorDetail(
+                    string='Memberships must be objects.', code='invalid'
+                )
+            }, 400)
+
+        username = membership.get('username')
+        if not username:
+            return None, Response({
+                'username': ErrorDetail(string='Username cannot be empty.',
+                                        code='blank')
+            }, 400)
+        if not isinstance(username, str):
+            return None, Response({
+                'username': ErrorDetail(string='Username must be a string.',
+                                        code='invalid')
+            }, 400)
+
+        board_id = membership.get('board_id')
+        if not board_id:
+            return None, Response({
+                'board_id': ErrorDetail(string='Board ID cannot be empty.',
+                                        code='blank')
+            }, 400)
+        # ints or strings of digits; int() would also take e.g. true or 1.7
+        if isinstance(board_id, str) and board_id.isdecimal():
+            board_id = int(board_id)
+        if not isinstance(board_id, int) or isinstance(board_id, bool):
+            return None, Response({
+                'board_id': ErrorDetail(string='Board ID must be a number.',
+                                        code='invalid')
+            }, 400)
+
+        is_active, validation_response = validate_is_active(
+            membership.get('is_active')
+        )
+        if validation_response:
+            return None, validation_response
+
+        # the last entry for a (username, board_id) pair wins
+        validated[(username, board_id)] = is_active
+
+    # check that every user and board belongs to the team in a single query
+    usernames = {username for username, _ in validated}
+    board_ids = {board_id for _, board_id in validated}
+    owned = set(
+        User.objects.filter(team_id=team_id, username__in=usernames)
+            .annotate(kind=Value('user', CharField()), key=F('username'))
+            .values_list('kind', 'key')
+            .union(Board.objects.alive()
+                   .filter(team_id=team_id, id__in=board_ids)
+                   .annotate(kind=Value('board', CharField()),
+                             key=Cast('id', CharField()))
+                   .values_list('kind', 'key'))
+    )
+
+    if any(('user', username) not in owned for username in usernames):
+        return None, Response({
+            'username': ErrorDetail(string='User not found.',
+                                    code='not_found')
+        }, 404)
+
+    if any(('board', str(board_id)) not in owned for board_id in board_ids):
+        return None, Response({
+            'board_id': ErrorDetail(string='Board not found.',
+                                    code='not_found')
+        }, 404)
+
+    return validated, None
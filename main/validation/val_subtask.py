@@ -10,7 +10,11 @@ def validate_subtask_id(subtask_id):
                               code='blank')
         }, 400)
     try:
-        subtask = Subtask.objects.get(id=subtask_id)
+        subtask = Subtask.objects.get(
+            id=subtask_id,
+            task__deleted_at__isnull=True,
+            task__column__board__deleted_at__isnull=True
+        )
     except Subtask.DoesNotExist:
         return None, Response({
             'id': ErrorDetail(string='Subtask not found.',
@@ -20,7 +20,9 @@ def validate_task_id(task_id):
         }, 400)
 
     try:
-        task = Task.objects.get(id=task_id)
+        task = Task.objects.alive().get(
+            id=task_id, column__board__deleted_at__isnull=True
+        )
     except Task.DoesNotExist:
         return None, Response({
             'task_id': ErrorDetail(string='Task not found.',